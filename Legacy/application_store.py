@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Application Store
+SQLite copy of job_applications.csv, indexed on ID, HTML path and PDF path, so
+a status change is one indexed UPDATE instead of a full CSV read and rewrite.
+
+The CSV stays the interchange format for the legacy viewers:
+- if the CSV was edited outside the store (create_jd_resume.py appends, manual
+  edits), it is re-imported on the next store access; status changes not yet
+  exported are re-applied on top, matched by ID
+- export_csv() writes the store back out; callers batch changes and export
+  once (serve_dashboard.py debounces, ci_process_resumes.py exports per run)
+- all CSV reads and writes hold csv_writer's file lock
+
+Every change bumps a store-wide revision and stamps the changed rows with it,
+so readers (the dashboard's /api/applications) can ask for just the rows that
+changed since the revision they hold. A re-import replaces every row and
+starts a new baseline; readers behind it get a full listing.
+
+Usage:
+    python application_store.py export [csv]    # write job_applications.csv from the store
+    python application_store.py import [csv]    # force a re-import of the CSV
+"""
+
+import csv
+import os
+import secrets
+import sqlite3
+import sys
+import threading
+
+import csv_writer
+from csv_writer import FIELDNAMES
+
+STORE_VERSION = 3   # bump when the schema changes; the store is rebuilt from the CSV
+DEFAULT_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)), "job_applications.csv")
+
+
+def file_name(path):
+    """Basename of a CSV path column; rows may hold Windows or ../ relative paths."""
+    return os.path.basename((path or "").replace("\\", "/"))
+
+
+class ApplicationStore:
+    def __init__(self, csv_file=DEFAULT_CSV, db_file=None):
+        self.csv_file = csv_file
+        self.db_file = db_file or os.path.splitext(csv_file)[0] + ".sqlite"
+        self.fieldnames = list(FIELDNAMES)
+        self._lock = threading.Lock()   # one connection shared by the dashboard's request threads
+        self.conn = sqlite3.connect(self.db_file, timeout=30, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] != STORE_VERSION:
+            with self.conn:
+                self.conn.executescript("DROP TABLE IF EXISTS applications; DROP TABLE IF EXISTS meta;")
+                self.conn.execute(f"PRAGMA user_version = {STORE_VERSION}")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS applications (
+                row INTEGER PRIMARY KEY,
+                ID TEXT, Date TEXT, Company TEXT, Position TEXT, Status TEXT,
+                HTML_Path TEXT, PDF_Path TEXT, Notes TEXT,
+                html_name TEXT, pdf_name TEXT,
+                pending INTEGER NOT NULL DEFAULT 0,   -- changed since the last export
+                rev INTEGER NOT NULL DEFAULT 0);      -- store revision of the last change
+            CREATE INDEX IF NOT EXISTS applications_id ON applications(ID);
+            CREATE INDEX IF NOT EXISTS applications_html ON applications(html_name);
+            CREATE INDEX IF NOT EXISTS applications_pdf ON applications(pdf_name);
+            CREATE INDEX IF NOT EXISTS applications_rev ON applications(rev);
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+        """)
+        with self.conn:
+            # Identifies this database file, so revisions of a rebuilt store never look current
+            self.conn.execute("INSERT OR IGNORE INTO meta VALUES ('store_id', ?)", (secrets.token_hex(4),))
+        self._sync()
+
+    # ── CSV <-> store ────────────────────────────────────────────────────────
+
+    def _csv_signature(self):
+        try:
+            st = os.stat(self.csv_file)
+        except FileNotFoundError:
+            return ""
+        return f"{st.st_mtime_ns}:{st.st_size}"
+
+    def _meta(self, key, default=""):
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def _set_meta(self, key, value):
+        self.conn.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, value))
+
+    def _bump_revision(self):
+        revision = int(self._meta("revision", "0")) + 1
+        self._set_meta("revision", str(revision))
+        return revision
+
+    def _sync(self, force=False):
+        """
+        Re-import the CSV when it changed since the store last read or wrote
+        it, keeping unexported changes for rows whose ID is still in the file.
+        """
+        if not force and self._csv_signature() == self._meta("csv_signature"):
+            return False
+        columns = ", ".join(FIELDNAMES)
+        with csv_writer.locked(self.csv_file):
+            signature = self._csv_signature()
+            if not force and signature == self._meta("csv_signature"):
+                return False   # another process re-imported while we waited for the lock
+            rows = []
+            if signature:
+                with open(self.csv_file, "r", encoding="utf-8", newline="") as f:
+                    reader = csv.DictReader(f)
+                    self.fieldnames = reader.fieldnames or list(FIELDNAMES)
+                    rows = [[r.get(k, "") or "" for k in FIELDNAMES] + [file_name(r.get("HTML_Path")), file_name(r.get("PDF_Path"))]
+                            for r in reader]
+            with self.conn:
+                self.conn.execute("BEGIN IMMEDIATE")   # no update may land between reading and replacing the rows
+                pending = self.conn.execute(f"SELECT {columns}, html_name, pdf_name FROM applications WHERE pending").fetchall()
+                revision = self._bump_revision()
+                self.conn.execute("DELETE FROM applications")
+                self.conn.executemany(
+                    f"INSERT INTO applications ({columns}, html_name, pdf_name, rev) "
+                    f"VALUES ({', '.join('?' * (len(FIELDNAMES) + 3))})", [[*r, revision] for r in rows])
+                for row in pending:
+                    self.conn.execute(
+                        f"UPDATE applications SET {', '.join(f'{k} = ?' for k in row.keys())}, pending = 1 WHERE ID = ?",
+                        [*row, row["ID"]])
+                self._set_meta("baseline", str(revision))
+                self._set_meta("csv_signature", signature)
+                self._set_meta("fieldnames", ",".join(self.fieldnames))
+                self._set_meta("dirty", "1" if pending else "0")
+        return True
+
+    def export_csv(self, path=None):
+        """
+        Write every row back to the CSV (temp file + atomic rename) and mark the
+        store clean. Rows appended to the CSV since the last sync are merged in
+        first, under the same lock, so they are not overwritten.
+        """
+        path = path or self.csv_file
+        with self._lock, csv_writer.locked(self.csv_file):
+            self._sync()
+            # Write-locks the store until the CSV is out, so an update from another
+            # process cannot land between the snapshot and clearing `pending`
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                fieldnames = self._meta("fieldnames").split(",") if self._meta("fieldnames") else FIELDNAMES
+                rows = self.conn.execute(f"SELECT {', '.join(FIELDNAMES)} FROM applications ORDER BY row").fetchall()
+                csv_writer.write_atomic(path, fieldnames, (dict(r) for r in rows))
+                if path == self.csv_file:
+                    self.conn.execute("UPDATE applications SET pending = 0 WHERE pending")
+                    self._set_meta("csv_signature", self._csv_signature())
+                    self._set_meta("dirty", "0")
+                self.conn.commit()
+            except BaseException:
+                self.conn.rollback()
+                raise
+        return len(rows)
+
+    @property
+    def dirty(self):
+        with self._lock:
+            return self._meta("dirty") == "1"
+
+    # ── Queries and updates ──────────────────────────────────────────────────
+
+    def rows(self):
+        with self._lock:
+            self._sync()
+            return [dict(r) for r in self.conn.execute(
+                f"SELECT {', '.join(FIELDNAMES)} FROM applications ORDER BY row")]
+
+    def revision(self):
+        """'<store_id>-<revision>': changes whenever any row does. Cheap enough to check per request."""
+        with self._lock:
+            self._sync()
+            return f"{self._meta('store_id')}-{self._meta('revision', '0')}"
+
+    def page(self, offset=0, limit=None, since=None):
+        """
+        Rows in CSV order, each with its `row` key. With `since` (a revision
+        number from an earlier page), only rows changed after it — unless the
+        store was re-imported since then, in which case everything ("full").
+        """
+        with self._lock:
+            self._sync()
+            revision = int(self._meta("revision", "0"))
+            full = since is None or since < int(self._meta("baseline", "0"))
+            where, args = ("", []) if full else ("WHERE rev > ?", [since])
+            total = self.conn.execute(f"SELECT COUNT(*) FROM applications {where}", args).fetchone()[0]
+            rows = self.conn.execute(
+                f"SELECT row, {', '.join(FIELDNAMES)} FROM applications {where} ORDER BY row LIMIT ? OFFSET ?",
+                [*args, -1 if limit is None else limit, offset])
+            return {
+                "store": self._meta("store_id"),
+                "revision": revision,
+                "full": full,
+                "total": total,
+                "offset": offset,
+                "rows": [dict(r) for r in rows],
+            }
+
+    def _update(self, column, updates):
+        """Apply [(name, fields), ...] in one transaction. Returns {name: rows changed}."""
+        with self._lock:
+            self._sync()
+            changed = {}
+            with self.conn:
+                self.conn.execute("BEGIN IMMEDIATE")
+                revision = int(self._meta("revision", "0")) + 1
+                for name, fields in updates:
+                    assignments = dict(fields)
+                    if "HTML_Path" in assignments:
+                        assignments["html_name"] = file_name(assignments["HTML_Path"])
+                    if "PDF_Path" in assignments:
+                        assignments["pdf_name"] = file_name(assignments["PDF_Path"])
+                    cur = self.conn.execute(
+                        f"UPDATE applications SET {', '.join(f'{k} = ?' for k in assignments)}, pending = 1, rev = ? "
+                        f"WHERE {column} = ?",
+                        [*assignments.values(), revision, name])
+                    changed[name] = changed.get(name, 0) + cur.rowcount
+                if any(changed.values()):
+                    self._set_meta("revision", str(revision))
+                    self._set_meta("dirty", "1")
+            return changed
+
+    def update_by_pdf(self, filename, **fields):
+        """Update every row whose PDF_Path has this basename. Returns the number of rows changed."""
+        name = file_name(filename)
+        return self._update("pdf_name", [(name, fields)])[name]
+
+    def update_by_html(self, filename, **fields):
+        """Update every row whose HTML_Path has this basename. Returns the number of rows changed."""
+        name = file_name(filename)
+        return self._update("html_name", [(name, fields)])[name]
+
+    def update_many_by_html(self, updates):
+        """
+        update_by_html() for {filename: fields} in a single transaction (one
+        store revision). Returns {filename basename: rows changed}.
+        """
+        return self._update("html_name", [(file_name(f), fields) for f, fields in updates.items()])
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else "export"
+    csv_file = os.path.abspath(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_CSV
+    if command not in ("export", "import"):
+        print(f"❌ Unknown command: {command} (use export or import)")
+        return 1
+    store = ApplicationStore(csv_file)
+    try:
+        if command == "import":
+            store._sync(force=True)
+            print(f"✅ Imported {len(store.rows())} rows from {csv_file}")
+        elif not os.path.exists(csv_file) and not store.rows():
+            print(f"❌ Nothing to export: {csv_file} does not exist and the store is empty")
+            return 1
+        else:
+            print(f"✅ Exported {store.export_csv()} rows to {csv_file}")
+    finally:
+        store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
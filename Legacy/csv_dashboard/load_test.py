@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Dashboard Load Test
+Starts serve_dashboard's handler against a throwaway copy of the project
+(synthetic job_applications.csv + PDFs in a temp dir) and hammers it with
+concurrent clients: dashboard page and /api/applications GETs, one mark_applied or mark_skipped POST
+per row, and a few slow clients that hold their connection open.
+
+Runs the same workload with the current handler on a single-threaded
+TCPServer and on the threaded DashboardServer, reports throughput and
+latency, and checks that every status change landed in the CSV. Both runs
+use the store-backed handler, so the comparison measures threading only, not
+the pre-store CSV-rewriting handler.
+
+Usage:
+    python load_test.py                      # 32 clients, 200 rows, 2 slow clients
+    python load_test.py --clients 64 --rows 500 --slow 4
+"""
+import argparse
+import contextlib
+import csv
+import http.client
+import io
+import json
+import os
+import shutil
+import socket
+import socketserver
+import statistics
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import serve_dashboard
+
+FIELDNAMES = ["ID", "Date", "Company", "Position", "Status", "HTML_Path", "PDF_Path", "Notes"]
+SLOW_CLIENT_SECONDS = 1.0
+
+
+def make_fixture(root, rows):
+    """Synthetic project tree: CSV with `rows` READY rows, one PDF per row, dashboard page."""
+    for sub in ("To_Apply", "Applied", "Skipped"):
+        os.makedirs(os.path.join(root, "Resume", sub), exist_ok=True)
+    with open(os.path.join(root, "job_applications.csv"), "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+        writer.writeheader()
+        for i in range(rows):
+            name = f"resume_loadtest-{i:04d}"
+            writer.writerow({
+                "ID": f"loadtest-{i:04d}", "Date": "2026-01-01 00:00:00",
+                "Company": f"Company{i}", "Position": "Engineer", "Status": "READY",
+                "HTML_Path": f"Resume/Archive/{name}.html", "PDF_Path": f"Resume/To_Apply/{name}.pdf",
+                "Notes": "load test",
+            })
+            with open(os.path.join(root, "Resume", "To_Apply", f"{name}.pdf"), "wb") as pdf:
+                pdf.write(b"%PDF-1.4\n" + os.urandom(64 * 1024))
+    src = os.path.join(os.path.dirname(os.path.abspath(__file__)), "job_dashboard.html")
+    shutil.copy(src, os.path.join(root, "job_dashboard.html"))
+
+
+def point_server_at(root):
+    serve_dashboard.CSV_FILE = os.path.join(root, "job_applications.csv")
+    serve_dashboard.PDF_DIR = os.path.join(root, "Resume", "To_Apply")
+    serve_dashboard.APPLIED_DIR = os.path.join(root, "Resume", "Applied")
+    serve_dashboard.SKIPPED_DIR = os.path.join(root, "Resume", "Skipped")
+
+
+class QuietHandler(serve_dashboard.DashboardHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def request(port, method, path, body=None):
+    """One request on a fresh connection; returns (status, seconds)."""
+    start = time.perf_counter()
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+    try:
+        payload = json.dumps(body).encode("utf-8") if body is not None else None
+        headers = {"Content-Type": "application/json"} if payload else {}
+        conn.request(method, path, body=payload, headers=headers)
+        resp = conn.getresponse()
+        resp.read()
+        return resp.status, time.perf_counter() - start
+    except OSError:
+        # Refused or reset: the server's accept queue overflowed
+        return 0, time.perf_counter() - start
+    finally:
+        conn.close()
+
+
+def slow_client(port):
+    """Sends its request line, then stalls before the headers — like a client on a bad link."""
+    start = time.perf_counter()
+    with socket.create_connection(("127.0.0.1", port), timeout=60) as sock:
+        sock.sendall(b"GET /job_applications.csv HTTP/1.1\r\n")
+        time.sleep(SLOW_CLIENT_SECONDS)
+        sock.sendall(b"Host: localhost\r\nConnection: close\r\n\r\n")
+        while sock.recv(65536):
+            pass
+    return 200, time.perf_counter() - start
+
+
+def run(server_cls, clients, rows, slow):
+    root = tempfile.mkdtemp(prefix="dashboard_load_")
+    try:
+        make_fixture(root, rows)
+        point_server_at(root)
+        handler = partial(QuietHandler, directory=root)
+        with server_cls(("127.0.0.1", 0), handler) as httpd:
+            port = httpd.server_address[1]
+            threading.Thread(target=httpd.serve_forever, daemon=True).start()
+
+            jobs = [partial(slow_client, port) for _ in range(slow)]
+            for i in range(rows):
+                action = "mark_applied" if i % 2 == 0 else "mark_skipped"
+                jobs.append(partial(request, port, "POST", f"/api/{action}",
+                                    {"filename": f"resume_loadtest-{i:04d}.pdf"}))
+                jobs.append(partial(request, port, "GET", "/job_dashboard.html"))
+                jobs.append(partial(request, port, "GET", f"/api/applications?offset={i // 100 * 100}&limit=100"))
+
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()), ThreadPoolExecutor(max_workers=clients + slow) as pool:
+                results = list(pool.map(lambda job: job(), jobs))
+            elapsed = time.perf_counter() - start
+            httpd.shutdown()
+        serve_dashboard.flush_csv_export()
+        serve_dashboard.get_store().close()
+
+        with open(serve_dashboard.CSV_FILE, encoding="utf-8") as f:
+            statuses = [row["Status"] for row in csv.DictReader(f)]
+        expected = ["APPLIED" if i % 2 == 0 else "SKIPPED" for i in range(rows)]
+        latencies = sorted(seconds for _, seconds in results[slow:])
+        return {
+            "requests": len(results),
+            "errors": sum(status != 200 for status, _ in results),
+            "rps": len(results) / elapsed,
+            "p50": statistics.median(latencies) * 1000,
+            "p95": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+            "csv_ok": statuses == expected,
+            "lost": sum(a != b for a, b in zip(statuses, expected)) + abs(len(statuses) - rows),
+        }
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent-client load test for serve_dashboard.")
+    parser.add_argument("--clients", type=int, default=32, help="Concurrent clients")
+    parser.add_argument("--rows", type=int, default=200, help="CSV rows (one POST + two GETs each)")
+    parser.add_argument("--slow", type=int, default=2, help="Clients that stall mid-request")
+    args = parser.parse_args()
+
+    print("🏋️  Dashboard load test")
+    print(f"   {args.clients} clients, {args.rows} rows ({args.rows * 3} requests), {args.slow} slow clients")
+    print("   Same store-backed handler on both servers: compares threading, not the CSV-to-store change")
+    print("-" * 72)
+    print(f"{'Server':<22}{'req/s':>9}{'p50 ms':>10}{'p95 ms':>10}{'errors':>8}   CSV")
+    for label, server_cls in (("TCPServer (1 thread)", socketserver.TCPServer),
+                              ("DashboardServer", serve_dashboard.DashboardServer)):
+        r = run(server_cls, args.clients, args.rows, args.slow)
+        csv_flag = "✅ intact" if r["csv_ok"] else f"❌ {r['lost']} rows wrong"
+        print(f"{label:<22}{r['rps']:>9.0f}{r['p50']:>10.1f}{r['p95']:>10.1f}{r['errors']:>8}   {csv_flag}")
+
+
+if __name__ == "__main__":
+    main()
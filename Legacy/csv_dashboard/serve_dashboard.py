@@ -1,21 +1,148 @@
+import gzip
 import http.server
-import socketserver
 import webbrowser
 import os
 import time
 import json
 import shutil
-import csv
-from threading import Timer
+import queue
+import sys
+from threading import Event, Lock, Thread, Timer
 from urllib.parse import urlparse, parse_qs
 
 # Define paths
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)  # Legacy/, for the shared application_store module
+from application_store import ApplicationStore
+
 CSV_FILE = os.path.join(BASE_DIR, "job_applications.csv")
 PDF_DIR = os.path.join(BASE_DIR, "Resume", "To_Apply")
 APPLIED_DIR = os.path.join(BASE_DIR, "Resume", "Applied")
 SKIPPED_DIR = os.path.join(BASE_DIR, "Resume", "Skipped")
 
+# Requests are served on their own threads; every status update and file move
+# goes through this lock so concurrent mark_applied/mark_skipped calls cannot
+# interleave and drop each other's updates.
+CSV_LOCK = Lock()
+
+# Status changes go to the indexed store; the CSV is re-exported once a burst
+# of changes settles (or before it is served), not once per change.
+CSV_EXPORT_DELAY = 1.0
+
+# /api/applications paging; bodies below the gzip threshold are sent as is
+API_PAGE_SIZE = 500
+API_MAX_PAGE_SIZE = 5000
+GZIP_MIN_BYTES = 1024
+
+# /api/events pushes row changes as Server-Sent Events. Changes made by this
+# server are pushed at once; the store is also polled so changes made by other
+# processes (ci_process_resumes.py, CSV edits) are picked up within a second.
+SSE_POLL_INTERVAL = 1.0
+SSE_HEARTBEAT = 15.0
+SSE_MAX_ROWS = 500   # larger deltas tell clients to reload over /api/applications
+
+_store = None
+_store_lock = Lock()   # the first requests arrive together; only one of them may open the store
+_export_timer = None
+
+def get_store():
+    global _store
+    store = _store
+    if store is None or store.csv_file != CSV_FILE:
+        with _store_lock:
+            if _store is None or _store.csv_file != CSV_FILE:
+                _store = ApplicationStore(CSV_FILE)
+            store = _store
+    return store
+
+def flush_csv_export():
+    """Write pending status changes out to job_applications.csv"""
+    with CSV_LOCK:
+        if _export_timer is not None:
+            _export_timer.cancel()
+        store = get_store()
+        if store.dirty:
+            store.export_csv()
+
+def schedule_csv_export():
+    global _export_timer
+    if _export_timer is not None:
+        _export_timer.cancel()
+    _export_timer = Timer(CSV_EXPORT_DELAY, flush_csv_export)
+    _export_timer.daemon = True
+    _export_timer.start()
+
+def parse_event_id(event_id):
+    """'<store_id>-<revision>' from an event id or ETag -> (store_id, revision), or (None, None)"""
+    store_id, _, revision = (event_id or '').strip('"').rpartition('-')
+    return (store_id, int(revision)) if store_id and revision.isdigit() else (None, None)
+
+def change_event(store, since):
+    """
+    SSE message for the rows changed after revision `since`, or None if there
+    are none. A re-import or a large delta becomes a 'reload' event instead.
+    """
+    page = store.page(0, SSE_MAX_ROWS, since)
+    if page['full'] or page['total'] > len(page['rows']):
+        name, data = 'reload', {'revision': page['revision']}
+    elif page['rows']:
+        name, data = 'rows', {'revision': page['revision'], 'rows': page['rows']}
+    else:
+        return None
+    payload = json.dumps(data, separators=(',', ':'))
+    return f"id: {page['store']}-{page['revision']}\nevent: {name}\ndata: {payload}\n\n"
+
+class ChangeFeed:
+    """Watches the store revision and fans change events out to /api/events subscribers"""
+    def __init__(self):
+        self._lock = Lock()
+        self._subscribers = set()
+        self._wake = Event()
+        self._thread = None
+        self._seen = None   # (store_id, revision) last published
+
+    def subscribe(self):
+        q = queue.Queue()
+        with self._lock:
+            self._subscribers.add(q)
+            if self._thread is None:
+                # Baseline before any subscriber catches up, so no change falls between the two
+                self._seen = parse_event_id(get_store().revision())
+                self._thread = Thread(target=self._run, name="change-feed", daemon=True)
+                self._thread.start()
+        return q
+
+    def unsubscribe(self, q):
+        with self._lock:
+            self._subscribers.discard(q)
+
+    def notify(self):
+        """Publish now instead of at the next poll (for changes made by this process)"""
+        self._wake.set()
+
+    def _run(self):
+        while True:
+            self._wake.wait(SSE_POLL_INTERVAL)
+            self._wake.clear()
+            try:
+                self.publish()
+            except Exception as e:
+                print(f"Error publishing changes: {e}")
+
+    def publish(self):
+        store = get_store()
+        current = parse_event_id(store.revision())
+        if current == self._seen:
+            return
+        seen, self._seen = self._seen, current
+        message = change_event(store, seen[1] if seen[0] == current[0] else None)
+        if message:
+            with self._lock:
+                for q in self._subscribers:
+                    q.put(message)
+
+FEED = ChangeFeed()
+
 def ensure_dirs():
     for d in [APPLIED_DIR, SKIPPED_DIR]:
         os.makedirs(d, exist_ok=True)
@@ -26,14 +153,103 @@ class DashboardHandler(http.server.SimpleHTTPRequestHandler):
             self.send_response(302)
             self.send_header('Location', '/job_dashboard.html')
             self.end_headers()
+        elif urlparse(self.path).path == '/api/applications':
+            self.send_applications()
+        elif urlparse(self.path).path == '/api/events':
+            self.send_events()
         else:
+            if urlparse(self.path).path == '/job_applications.csv':
+                flush_csv_export()
             super().do_GET()
 
+    def send_applications(self):
+        """
+        GET /api/applications?offset=0&limit=500[&since=<revision>]
+        JSON page of rows from the store. `since` returns only rows changed after
+        that revision; a matching If-None-Match gets 304 without touching the rows.
+        """
+        query = parse_qs(urlparse(self.path).query)
+        try:
+            offset = max(0, int(query.get('offset', ['0'])[0]))
+            limit = min(API_MAX_PAGE_SIZE, max(1, int(query.get('limit', [API_PAGE_SIZE])[0])))
+            since = int(query['since'][0]) if 'since' in query else None
+        except ValueError:
+            self.send_response(400)
+            self.end_headers()
+            return
+
+        store = get_store()
+        etag = f'"{store.revision()}"'
+        if_none_match = self.headers.get('If-None-Match', '')
+        if if_none_match.strip() == '*' or etag in [tag.strip().removeprefix('W/') for tag in if_none_match.split(',')]:
+            self.send_response(304)
+            self.send_header('ETag', 'W/' + etag)
+            self.end_headers()
+            return
+
+        page = store.page(offset, limit, since)
+        etag = f'"{page["store"]}-{page["revision"]}"'  # the revision this body was read at
+        body = json.dumps(page, separators=(',', ':')).encode('utf-8')
+        gzipped = len(body) >= GZIP_MIN_BYTES and 'gzip' in self.headers.get('Accept-Encoding', '')
+        if gzipped:
+            body = gzip.compress(body, compresslevel=6)
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Cache-Control', 'no-cache')
+        # Weak: the gzip and plain bodies of a page share the tag, so it names the rows, not the bytes
+        self.send_header('ETag', 'W/' + etag)
+        self.send_header('Vary', 'Accept-Encoding')
+        if gzipped:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_events(self):
+        """
+        GET /api/events[?last=<store_id>-<revision>]
+        Server-Sent Events stream: 'rows' events carry the changed rows, 'reload'
+        asks the client to re-page /api/applications. `last` (or Last-Event-ID
+        on reconnect) is the state the client holds; it is caught up first.
+        """
+        query = parse_qs(urlparse(self.path).query)
+        last = self.headers.get('Last-Event-ID') or query.get('last', [''])[0]
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+
+        subscription = FEED.subscribe()   # before catching up; a row sent twice is harmless
+        try:
+            self.wfile.write(b'retry: 3000\n\n')
+            store_id, since = parse_event_id(last)
+            store = get_store()
+            if store_id is not None:
+                catch_up = change_event(store, since if store_id == parse_event_id(store.revision())[0] else None)
+                if catch_up:
+                    self.wfile.write(catch_up.encode('utf-8'))
+            while True:
+                try:
+                    message = subscription.get(timeout=SSE_HEARTBEAT)
+                except queue.Empty:
+                    message = ': keepalive\n\n'   # also how a closed connection gets noticed
+                self.wfile.write(message.encode('utf-8'))
+        except (BrokenPipeError, ConnectionResetError, ConnectionAbortedError):
+            pass
+        finally:
+            FEED.unsubscribe(subscription)
+
     def do_POST(self):
         if self.path.startswith('/api/'):
-            content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
-            data = json.loads(post_data.decode('utf-8'))
+            try:
+                content_length = int(self.headers['Content-Length'])
+                post_data = self.rfile.read(content_length)
+                data = json.loads(post_data.decode('utf-8'))
+            except (TypeError, ValueError):
+                self.send_response(400)
+                self.end_headers()
+                return
             
             action = self.path.split('/')[-1]
             filename = data.get('filename')
@@ -61,10 +277,12 @@ class DashboardHandler(http.server.SimpleHTTPRequestHandler):
             super().do_POST()
 
     def handle_file_move(self, filename, dest_dir, new_status):
+        with CSV_LOCK:
+            return self._handle_file_move(filename, dest_dir, new_status)
+
+    def _handle_file_move(self, filename, dest_dir, new_status):
         try:
-            # 1. Update CSV
-            rows = []
-            updated = False
+            # 1. Update the store (indexed on the PDF basename)
             base_filename = os.path.basename(filename)
             
             # Map standard status to V2 Status (Uppercase)
@@ -72,28 +290,15 @@ class DashboardHandler(http.server.SimpleHTTPRequestHandler):
             # "Skipped" -> "SKIPPED"
             v2_status = new_status.upper()
             
-            if os.path.exists(CSV_FILE):
-                with open(CSV_FILE, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    fieldnames = reader.fieldnames
-                    for row in reader:
-                        # Check match by PDF filename in PDF_Path
-                        # row['PDF_Path'] might be "Resume/To_Apply/foo.pdf"
-                        if os.path.basename(row['PDF_Path']) == base_filename:
-                            row['Status'] = v2_status
-                            # Update path in CSV to reflect move
-                            # New Path: Resume/Applied/foo.pdf
-                            dest_folder_name = os.path.basename(dest_dir)
-                            row['PDF_Path'] = f"Resume/{dest_folder_name}/{base_filename}"
-                            updated = True
-                        rows.append(row)
-
-                if updated:
-                    with open(CSV_FILE, 'w', newline='', encoding='utf-8') as f:
-                        writer = csv.DictWriter(f, fieldnames=fieldnames)
-                        writer.writeheader()
-                        writer.writerows(rows)
-                    print(f"✅ CSV Updated: {base_filename} -> {v2_status}")
+            # Update path in CSV to reflect move
+            # New Path: Resume/Applied/foo.pdf
+            dest_folder_name = os.path.basename(dest_dir)
+            updated = get_store().update_by_pdf(
+                base_filename, Status=v2_status, PDF_Path=f"Resume/{dest_folder_name}/{base_filename}") > 0
+            if updated:
+                schedule_csv_export()
+                FEED.notify()
+                print(f"✅ CSV Updated: {base_filename} -> {v2_status}")
             
             # 2. Move File
             src_path = os.path.join(PDF_DIR, base_filename)
@@ -111,6 +316,11 @@ class DashboardHandler(http.server.SimpleHTTPRequestHandler):
             print(f"Error handling file move: {e}")
             return False
 
+class DashboardServer(http.server.ThreadingHTTPServer):
+    """One thread per request, so a slow PDF download or CSV rewrite does not block other clients"""
+    daemon_threads = True
+    request_queue_size = 64   # default of 5 resets connections when many tabs refresh at once
+
 def open_browser(port):
     """Open browser after a short delay"""
     webbrowser.open(f'http://localhost:{port}/job_dashboard.html')
@@ -126,10 +336,8 @@ def start_server():
     # Try ports 8080 to 8090
     for port in range(8080, 8091):
         try:
-            # allow_reuse_address allows restarting quickly
-            socketserver.TCPServer.allow_reuse_address = True
-            
-            with socketserver.TCPServer(("", port), DashboardHandler) as httpd:
+            # allow_reuse_address (on for HTTPServer) allows restarting quickly
+            with DashboardServer(("", port), DashboardHandler) as httpd:
                 print(f"🌐 Starting local server at http://localhost:{port}")
                 print(f"📊 Dashboard URL: http://localhost:{port}/job_dashboard.html")
                 print("🔄 Server will auto-refresh dashboard data")
@@ -139,7 +347,10 @@ def start_server():
                 # Open browser after 2 seconds
                 Timer(2.0, lambda: open_browser(port)).start()
                 
-                httpd.serve_forever()
+                try:
+                    httpd.serve_forever()
+                finally:
+                    flush_csv_export()
             break # Exit loop if successful
             
         except OSError as e:
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Shared CSV Writer
+Every write to job_applications.csv goes through here so concurrent runs of
+create_jd_resume.py, ci_process_resumes.py and serve_dashboard.py cannot lose
+rows or leave a truncated file:
+- locked():      exclusive cross-process lock (sidecar <csv>.lock file)
+- append_rows(): batched append, one write per batch, under the lock
+- write_atomic(): full rewrite to a temp file, fsync, then atomic rename
+"""
+
+import csv
+import io
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+FIELDNAMES = ["ID", "Date", "Company", "Position", "Status", "HTML_Path", "PDF_Path", "Notes"]
+
+if os.name == "nt":
+    import msvcrt
+
+    def _lock(f):
+        f.seek(0)
+        while True:
+            try:
+                msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+                return
+            except OSError:
+                time.sleep(0.05)
+
+    def _unlock(f):
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+else:
+    import fcntl
+
+    def _lock(f):
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+    def _unlock(f):
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+_held = threading.local()
+
+
+@contextmanager
+def locked(csv_file):
+    """Hold the cross-process lock for csv_file. Re-entrant within a thread."""
+    key = os.path.abspath(csv_file)
+    depth = getattr(_held, "depth", None)
+    if depth is None:
+        depth = _held.depth = {}
+    if depth.get(key):
+        depth[key] += 1
+        try:
+            yield
+        finally:
+            depth[key] -= 1
+        return
+
+    with open(key + ".lock", "a+b") as lock_file:
+        _lock(lock_file)
+        depth[key] = 1
+        try:
+            yield
+        finally:
+            depth[key] = 0
+            _unlock(lock_file)
+
+
+def write_atomic(csv_file, fieldnames, rows):
+    """
+    Replace csv_file with `rows` (dicts). Readers see the old or the new file,
+    never a partial one. Callers that read-modify-write should hold locked().
+    """
+    directory = os.path.dirname(os.path.abspath(csv_file))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(csv_file) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(rows)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, csv_file)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def rewrite_rows(csv_file, fieldnames, rows):
+    """write_atomic() under the lock."""
+    with locked(csv_file):
+        write_atomic(csv_file, fieldnames, rows)
+
+
+def append_rows(csv_file, rows, header=FIELDNAMES):
+    """
+    Append `rows` (lists in header order) in a single write under the lock,
+    writing the header first if the file is new or empty.
+    """
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    with locked(csv_file):
+        size = os.path.getsize(csv_file) if os.path.exists(csv_file) else 0
+        if size == 0:
+            writer.writerow(header)
+        else:
+            # A hand-edited file may lack its final newline; don't glue the first row onto the last
+            with open(csv_file, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) not in (b"\n", b"\r"):
+                    buf.write("\r\n")
+        writer.writerows(rows)
+        with open(csv_file, "ab") as f:
+            f.write(buf.getvalue().encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+    return len(rows)
@@ -2,129 +2,272 @@
 """
 CI Process Resumes
 Run by GitHub Actions to process drafts:
-1. Convert Drafts/*.html -> To_Apply/*.pdf
-2. Move Drafts/*.html -> HTMLs/*.html
+1. Convert Drafts/*.html -> To_Apply/*.pdf (in parallel, one process per CPU)
+2. Mark every converted draft READY in one store transaction
+3. Move Drafts/*.html -> HTMLs/*.html
+
+Each finished step is checkpointed per draft in Resume/.ci_manifest.json, so a
+run that fails halfway resumes where it stopped: drafts already rendered are
+not rendered again, and only the failed steps are retried. A draft whose HTML
+changed since its checkpoint starts over. The manifest is deleted once every
+draft has been archived.
+
+Usage:
+    python ci_process_resumes.py              # one render worker per CPU
+    python ci_process_resumes.py --workers 2
 """
 
+import argparse
+import hashlib
+import json
 import os
 import shutil
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 
 # Define paths
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)  # Legacy/, for the shared application_store module
+import csv_writer
+from application_store import ApplicationStore
+
 DRAFTS_DIR = os.path.join(BASE_DIR, "Resume", "Drafts")
 HTMLS_DIR = os.path.join(BASE_DIR, "Resume", "Archive")  # New Archive Location
 PDF_DIR = os.path.join(BASE_DIR, "Resume", "To_Apply")
 CSV_FILE = os.path.join(BASE_DIR, "job_applications.csv")
+MANIFEST_FILE = os.path.join(BASE_DIR, "Resume", ".ci_manifest.json")
 
 def ensure_dirs():
     for d in [DRAFTS_DIR, HTMLS_DIR, PDF_DIR]:
         os.makedirs(d, exist_ok=True)
 
-# Import WeasyPrint (must be installed in CI)
-import csv
+# ── Checkpoints ──────────────────────────────────────────────────────────────
+# {draft: {"digest": sha256 of the draft HTML, "done": [steps], "error": last failure}}
 
-def update_csv_status(filename, pdf_path):
-    """Update row in CSV: Status=READY, PDF_Path=..."""
+def draft_digest(draft):
+    with open(os.path.join(DRAFTS_DIR, draft), "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def load_manifest():
     try:
-        rows = []
-        updated = False
-        
-        # We match by looking for the HTML filename in the HTML_Path column
-        # Or by ID if the filename closely matches.
-        # Simpler: Match by HTML filename basename
-        target_html = os.path.basename(filename)
-        
-        if os.path.exists(CSV_FILE):
-            with open(CSV_FILE, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                fieldnames = reader.fieldnames
-                for row in reader:
-                    # Check if this row corresponds to our file
-                    # HTML_Path might be "Resume/Drafts/foo.html" or "../Resume/Drafts/foo.html"
-                    if os.path.basename(row['HTML_Path']) == target_html:
-                        row['Status'] = 'READY'
-                        # Use relative path for PDF: Resume/To_Apply/foo.pdf
-                        row['PDF_Path'] = f"Resume/To_Apply/{os.path.basename(pdf_path)}"
-                        # Update HTML path to Archive
-                        row['HTML_Path'] = f"Resume/Archive/{target_html}"
-                        updated = True
-                    rows.append(row)
-
-            if updated:
-                with open(CSV_FILE, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(rows)
-                print(f"✅ CSV Updated: {target_html} -> READY")
-                return True
-            else:
-                print(f"⚠️  Warning: No matching CSV entry found for {target_html}. Adding new one...")
-                # Fallback: Add new row if it was manually added to Drafts
-                return False 
-        return False
-    except Exception as e:
-        print(f"❌ Failed to update CSV: {e}")
-        return False
+        with open(MANIFEST_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def save_manifest(manifest):
+    """Write the manifest atomically; with nothing left to resume, remove it"""
+    if not manifest:
+        if os.path.exists(MANIFEST_FILE):
+            os.remove(MANIFEST_FILE)
+        return
+    tmp_path = MANIFEST_FILE + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp_path, MANIFEST_FILE)
+
+def mark_done(manifest, draft, step):
+    entry = manifest[draft]
+    if step not in entry["done"]:
+        entry["done"].append(step)
+    entry.pop("error", None)
+
+def mark_failed(manifest, draft, step, error):
+    manifest[draft]["error"] = f"{step}: {error}"
+
+def pdf_path_for(draft):
+    return os.path.join(PDF_DIR, f"{os.path.splitext(draft)[0]}.pdf")
+
+# ── Store ────────────────────────────────────────────────────────────────────
+
+_store = None
+
+def get_store():
+    """Application store over CSV_FILE (indexed on HTML path; see Legacy/application_store.py)"""
+    global _store
+    if _store is None:
+        _store = ApplicationStore(CSV_FILE)
+    return _store
+
+def ready_fields(draft):
+    """Store fields for a converted draft: READY, PDF in To_Apply, HTML in Archive"""
+    base_name = os.path.splitext(draft)[0]
+    return {
+        "Status": "READY",
+        # Use relative path for PDF: Resume/To_Apply/foo.pdf
+        "PDF_Path": f"Resume/To_Apply/{base_name}.pdf",
+        # Update HTML path to Archive
+        "HTML_Path": f"Resume/Archive/{draft}",
+    }
+
+def update_csv_statuses(drafts):
+    """
+    Mark converted drafts READY in one store transaction (written to the CSV by
+    export_csv_status). Rows are matched on the HTML basename, since HTML_Path
+    might be "Resume/Drafts/foo.html" or "../Resume/Drafts/foo.html".
+    Returns the drafts that had no CSV row.
+    """
+    changed = get_store().update_many_by_html({draft: ready_fields(draft) for draft in drafts})
+    missing = []
+    for draft in drafts:
+        if changed.get(draft):
+            print(f"✅ CSV Updated: {draft} -> READY")
+        else:
+            print(f"⚠️  Warning: No matching CSV entry found for {draft}. Adding new one...")
+            missing.append(draft)
+    return missing
+
+def export_csv_status():
+    """Write every status change of this run to job_applications.csv in one pass"""
+    store = get_store()
+    if store.dirty:
+        rows = store.export_csv()
+        print(f"✅ CSV written: {rows} rows")
 
 def add_new_ready_entry(base_name, html_rel, pdf_rel):
-    """Fallback for files not in CSV"""
-    # ... (simplified logic if needed, but optimally we trust create_jd_resume)
-    pass
+    """Fallback for files not in CSV: a READY row, appended in one batch at the end of the run"""
+    job_id = base_name.replace("resume_", "", 1)
+    parts = job_id.split('-', 1)
+    return [
+        job_id,
+        datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        parts[0].title(),
+        parts[1].title() if len(parts) > 1 else "Unknown",
+        "READY",
+        html_rel,
+        pdf_rel,
+        "Added by CI (draft was not in CSV)",
+    ]
 
-def process_resumes():
+def render_pdf(draft_path, pdf_path):
+    """Convert one draft; runs in a worker process. Returns the render time in seconds."""
+    import weasyprint
+    start = time.perf_counter()
+    weasyprint.HTML(filename=draft_path).write_pdf(pdf_path)
+    return time.perf_counter() - start
+
+def render_all(drafts, workers):
+    """Render drafts in parallel, yielding (draft, seconds, error) as each finishes"""
+    with ProcessPoolExecutor(max_workers=max(1, min(workers, len(drafts)))) as pool:
+        futures = {
+            pool.submit(render_pdf, os.path.join(DRAFTS_DIR, draft), pdf_path_for(draft)): draft
+            for draft in drafts
+        }
+        for future in as_completed(futures):
+            try:
+                yield futures[future], future.result(), None
+            except Exception as e:
+                yield futures[future], None, e
+
+def process_resumes(workers=None):
     # Check for drafts
     if not os.path.exists(DRAFTS_DIR):
         print("No Drafts directory found.")
         return
 
-    drafts = [f for f in os.listdir(DRAFTS_DIR) if f.endswith('.html')]
+    drafts = sorted(f for f in os.listdir(DRAFTS_DIR) if f.endswith('.html'))
+
+    # Checkpoints of drafts that are gone (archived, deleted) or were edited are dropped
+    old_manifest = load_manifest()
+    manifest = {}
+    for draft in drafts:
+        digest = draft_digest(draft)
+        entry = old_manifest.get(draft)
+        manifest[draft] = entry if entry and entry.get("digest") == digest else {"digest": digest, "done": []}
+    save_manifest(manifest)
     
     if not drafts:
         print("No drafts to process.")
         return
 
-    print(f"found {len(drafts)} drafts to process...")
-    
-    # Import WeasyPrint (must be installed in CI)
-    try:
-        import weasyprint
-    except ImportError:
-        print("Error: WeasyPrint not installed. This script is intended for CI environment.")
-        # For local dev without WeasyPrint, we might skip conversion
-        if os.environ.get('CI') != 'true':
-             print("⚠️  WEASYPRINT MISSING: Skipping PDF generation (Local Mode)")
-             return
-        sys.exit(1)
+    def pending(step):
+        return [d for d in drafts if step not in manifest[d]["done"]]
 
-    for draft in drafts:
-        draft_path = os.path.join(DRAFTS_DIR, draft)
-        base_name = os.path.splitext(draft)[0]
-        pdf_name = f"{base_name}.pdf"
-        pdf_path = os.path.join(PDF_DIR, pdf_name)
-        final_html_path = os.path.join(HTMLS_DIR, draft)
-
-        print(f"Processing: {draft}")
-        
+    # A checkpointed render only counts while its PDF is still there
+    to_render = [d for d in drafts if "render" not in manifest[d]["done"] or not os.path.exists(pdf_path_for(d))]
+    for draft in to_render:
+        if "render" in manifest[draft]["done"]:
+            manifest[draft]["done"].remove("render")
+    resumed = len(drafts) - len(to_render)
+
+    workers = workers or os.cpu_count() or 1
+    print(f"found {len(drafts)} drafts to process ({min(workers, max(1, len(to_render)))} workers)...")
+    if resumed:
+        print(f"Resuming: {resumed} drafts already rendered, "
+              f"{len(drafts) - len(pending('status'))} already marked READY")
+    
+    if to_render:
+        # Import WeasyPrint (must be installed in CI)
         try:
-            # 1. Convert to PDF
-            print(f"  - Converting to PDF...")
-            html = weasyprint.HTML(filename=draft_path)
-            html.write_pdf(pdf_path)
-            print(f"    Success: {pdf_name}")
-
-            # 2. Update CSV Status
-            success = update_csv_status(draft, pdf_path)
-            
-            # 3. Move HTML to Archive
-            print(f"  - Archiving HTML...")
-            shutil.move(draft_path, final_html_path)
-            print(f"    Moved to Resume/Archive/")
+            import weasyprint
+        except ImportError:
+            print("Error: WeasyPrint not installed. This script is intended for CI environment.")
+            # For local dev without WeasyPrint, we might skip conversion
+            if os.environ.get('CI') != 'true':
+                 print("⚠️  WEASYPRINT MISSING: Skipping PDF generation (Local Mode)")
+                 return
+            sys.exit(1)
 
+        # 1. Convert to PDF, checkpointing each draft as it finishes
+        start = time.perf_counter()
+        for draft, seconds, error in render_all(to_render, workers):
+            if error is None:
+                print(f"  - Converted {draft} ({seconds:.1f}s)")
+                mark_done(manifest, draft, "render")
+            else:
+                print(f"  ❌ Failed to convert {draft}: {error}")
+                mark_failed(manifest, draft, "render", error)
+            save_manifest(manifest)
+        print(f"Converted {len(to_render) - len(pending('render'))}/{len(to_render)} drafts "
+              f"in {time.perf_counter() - start:.1f}s")
+
+    # 2. Update CSV Status: one transaction, one append, one export
+    to_update = [d for d in pending("status") if "render" in manifest[d]["done"]]
+    if to_update:
+        try:
+            missing = update_csv_statuses(to_update)
+            new_rows = [add_new_ready_entry(os.path.splitext(draft)[0], f"Resume/Archive/{draft}",
+                                            f"Resume/To_Apply/{os.path.basename(pdf_path_for(draft))}")
+                        for draft in missing]
+            if new_rows:
+                csv_writer.append_rows(CSV_FILE, new_rows)
+                print(f"✅ CSV: added {len(new_rows)} new READY rows")
+            export_csv_status()
         except Exception as e:
-            print(f"  ❌ Failed to process {draft}: {e}")
+            # Rendered drafts keep their checkpoint; the next run retries from here
+            print(f"❌ Failed to update CSV: {e}")
+            for draft in to_update:
+                mark_failed(manifest, draft, "status", e)
+            save_manifest(manifest)
+            return
+        for draft in to_update:
+            mark_done(manifest, draft, "status")
+        save_manifest(manifest)
 
-if __name__ == "__main__":
+    # 3. Move HTML to Archive; a fully processed draft leaves the manifest
+    archived = 0
+    for draft in [d for d in drafts if "status" in manifest[d]["done"]]:
+        try:
+            shutil.move(os.path.join(DRAFTS_DIR, draft), os.path.join(HTMLS_DIR, draft))
+            del manifest[draft]
+            archived += 1
+        except OSError as e:
+            print(f"  ❌ Failed to archive {draft}: {e}")
+            mark_failed(manifest, draft, "archive", e)
+        save_manifest(manifest)
+    print(f"Archived {archived} drafts to Resume/Archive/")
+    if manifest:
+        print(f"⚠️  {len(manifest)} drafts unfinished; re-run to retry: {', '.join(sorted(manifest))}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert Resume/Drafts to PDFs and mark them READY.")
+    parser.add_argument("--workers", type=int, default=None, help="Render processes (default: one per CPU)")
+    args = parser.parse_args()
     ensure_dirs()
-    process_resumes()
+    process_resumes(args.workers)
+
+if __name__ == "__main__":
+    main()
@@ -6,61 +6,20 @@ Converts customized JD resume HTML to PDF with matching name
 
 import os
 import sys
-import csv
 import argparse
 from datetime import datetime
 from pathlib import Path
 
-def update_dashboard_data():
-    """Update the dashboard HTML with fresh CSV data"""
-    csv_file = "../job_applications.csv"
-    dashboard_file = "../job_dashboard.html"
-    
-    if not os.path.exists(csv_file) or not os.path.exists(dashboard_file):
-        return False
-    
-    try:
-        # Read CSV data
-        with open(csv_file, 'r', encoding='utf-8') as f:
-            csv_content = f.read().strip()
-        
-        # Read dashboard HTML
-        with open(dashboard_file, 'r', encoding='utf-8') as f:
-            dashboard_content = f.read()
-        
-        # Find and replace the CSV data section
-        start_marker = "const csvText = `"
-        end_marker = "`;"
-        
-        start_idx = dashboard_content.find(start_marker)
-        if start_idx == -1:
-            return False
-        
-        start_idx += len(start_marker)
-        end_idx = dashboard_content.find(end_marker, start_idx)
-        if end_idx == -1:
-            return False
-        
-        # Replace the CSV data
-        new_dashboard = (
-            dashboard_content[:start_idx] + 
-            csv_content + 
-            dashboard_content[end_idx:]
-        )
-        
-        # Write updated dashboard
-        with open(dashboard_file, 'w', encoding='utf-8') as f:
-            f.write(new_dashboard)
-        print("🎯 Dashboard updated with fresh data!")
-        return True
-    except:
-        return False
+LEGACY_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, LEGACY_DIR)  # Legacy/, for csv_writer
+import csv_writer
+from csv_writer import FIELDNAMES
+
+CSV_FILE = os.path.join(LEGACY_DIR, "job_applications.csv")
 
 def log_application(jd_name, html_file, pdf_file):
     """Log application details to CSV tracking file"""
     try:
-        csv_file = "../job_applications.csv"
-        
         # Parse company and position from jd_name
         parts = jd_name.replace('-', ' ').title().split()
         if len(parts) >= 2:
@@ -70,49 +29,29 @@ def log_application(jd_name, html_file, pdf_file):
             company = jd_name.title()
             position = "Unknown Position"
         
-        # Get current timestamp
-        now = datetime.now()
-        date_str = now.strftime("%Y-%m-%d")
-        time_str = now.strftime("%H:%M:%S")
-        
-        # Prepare row data (normalize paths for JavaScript compatibility)
-        html_file_normalized = html_file.replace('\\', '/')
-        pdf_file_normalized = pdf_file.replace('\\', '/')
-        
-        row_data = [
-            date_str,
-            time_str,
-            company,
-            position,
-            html_file_normalized,
-            pdf_file_normalized,
-            "PDF Created",
-            f"Auto-generated from {jd_name}"
-        ]
-        
-        # Check if CSV exists, create with headers if not
-        file_exists = os.path.exists(csv_file)
-        
-        with open(csv_file, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            
-            # Add headers if file is new
-            if not file_exists:
-                headers = ["Date", "Time", "Company", "Position", "Resume_File", "PDF_File", "Status", "Notes"]
-                writer.writerow(headers)
-            
-            writer.writerow(row_data)
-        
-        print(f"📊 Application logged to {csv_file}")
+        now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        job_id = os.path.splitext(os.path.basename(html_file))[0].replace('resume_', '', 1)
+        
+        # Prepare Row: ID,Date,Company,Position,Status,HTML_Path,PDF_Path,Notes (paths relative to Legacy/)
+        row = {
+            "ID": job_id,
+            "Date": now_str,
+            "Company": company,
+            "Position": position,
+            "Status": "READY",
+            "HTML_Path": f"Resume/Drafts/{os.path.basename(html_file)}",
+            "PDF_Path": f"Resume/To_Apply/{os.path.basename(pdf_file)}",
+            "Notes": f"Auto-generated from {jd_name}",
+        }
+        
+        # Append under the CSV lock (the dashboard and CI rewrite the same file)
+        csv_writer.append_rows(CSV_FILE, [[row[k] for k in FIELDNAMES]])
+        
+        print(f"📊 Application logged to {os.path.relpath(CSV_FILE)}")
         print(f"   Company: {company}")
         print(f"   Position: {position}")
-        print(f"   Date/Time: {date_str} {time_str}")
-        
-        # Update dashboard with fresh data
-        try:
-            update_dashboard_data()
-        except Exception as e:
-            print(f"⚠️  Warning: Could not update dashboard: {e}")
+        print(f"   Date/Time: {now_str}")
+
         
         return True
         
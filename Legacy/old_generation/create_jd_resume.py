@@ -2,14 +2,58 @@
 """
 Create Job-Specific Resume Copy
 Creates a copy of resume_clean.html with JD-relevant naming for customization
+
+Bulk mode seeds a whole shortlist at once from a CSV or JSONL job list with
+company, role and base columns/keys (base is a file in Master_Resume/current/,
+e.g. ai_engineer or resume_ai_engineer.html):
+    python create_jd_resume.py --bulk shortlist.csv [--force]
+Every row is validated before anything is written, each base is read once,
+and all DRAFT rows are logged in one batched append. Existing drafts are
+skipped unless --force is given.
 """
 
+import argparse
+import csv
+import json
 import os
 import sys
 import shutil
-import csv
 from datetime import datetime
 
+LEGACY_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, LEGACY_DIR)  # Legacy/, for csv_writer
+import csv_writer
+
+BASES_DIR = os.path.join(os.path.dirname(LEGACY_DIR), "Master_Resume", "current")
+DRAFTS_DIR = os.path.join(LEGACY_DIR, "Resume", "Drafts")
+CSV_FILE = os.path.join(LEGACY_DIR, "job_applications.csv")
+
+def clean_jd_name(jd_name):
+    """'Google SWE_2' -> 'google-swe-2' (used for the file name and the CSV ID)"""
+    jd_clean = jd_name.strip().lower().replace(' ', '-').replace('_', '-')
+    return ''.join(c for c in jd_clean if c.isalnum() or c in '-.')
+
+def draft_content(content, jd_name, base_file, created):
+    """Base resume HTML -> draft HTML: JD in the title, customization notes after DOCTYPE"""
+    updated_content = content.replace(
+        '<title>Naman Yeshwanth Kumar - Resume</title>',
+        f'<title>Naman Yeshwanth Kumar - Resume ({jd_name})</title>'
+    )
+    jd_comment = f"""<!-- 
+    JD-Specific Resume: {jd_name}
+    Created: {created}
+    Base: {base_file}
+    
+    CUSTOMIZATION NOTES:
+    - Update relevant sections based on job description
+    - Prioritize matching technical skills
+    - Highlight relevant projects and experience
+    - Ensure ATS optimization with JD keywords
+-->
+
+"""
+    return updated_content.replace('<!DOCTYPE html>\n', f'<!DOCTYPE html>\n{jd_comment}', 1)
+
 def create_jd_resume(jd_name):
     """Create a JD-specific copy of the master resume"""
     
@@ -20,8 +64,7 @@ def create_jd_resume(jd_name):
         return False
     
     # Clean the JD name for filename
-    jd_clean = jd_name.strip().lower().replace(' ', '-').replace('_', '-')
-    jd_clean = ''.join(c for c in jd_clean if c.isalnum() or c in '-.')
+    jd_clean = clean_jd_name(jd_name)
     
     # Define file paths
     # Define file paths relative to script location
@@ -55,32 +98,8 @@ def create_jd_resume(jd_name):
         with open(master_file, 'r', encoding='utf-8') as f:
             content = f.read()
         
-        # Update title and add JD-specific comment
-        updated_content = content.replace(
-            '<title>Naman Yeshwanth Kumar - Resume</title>',
-            f'<title>Naman Yeshwanth Kumar - Resume ({jd_name})</title>'
-        )
-        
-        # Add JD-specific comment at the beginning
-        jd_comment = f"""<!-- 
-    JD-Specific Resume: {jd_name}
-    Created: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-    Base: resume_clean.html
-    
-    CUSTOMIZATION NOTES:
-    - Update relevant sections based on job description
-    - Prioritize matching technical skills
-    - Highlight relevant projects and experience
-    - Ensure ATS optimization with JD keywords
--->
-
-"""
-        
-        # Insert comment after DOCTYPE
-        updated_content = updated_content.replace(
-            '<!DOCTYPE html>\\n',
-            f'<!DOCTYPE html>\\n{jd_comment}'
-        )
+        updated_content = draft_content(content, jd_name, os.path.basename(master_file),
+                                        datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
         
         # Write JD-specific file
         with open(jd_file, 'w', encoding='utf-8') as f:
@@ -118,13 +137,8 @@ def create_jd_resume(jd_name):
                 f"Created from {os.path.basename(master_file)}"
             ]
             
-            # Append to CSV
-            file_exists = os.path.exists(csv_file)
-            with open(csv_file, 'a', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                if not file_exists:
-                    writer.writerow(["ID","Date","Company","Position","Status","HTML_Path","PDF_Path","Notes"])
-                writer.writerow(new_row)
+            # Append to CSV (locked against the dashboard and CI rewriting it)
+            csv_writer.append_rows(csv_file, [new_row])
                 
             print(f"✅ Logged DRAFT to job_applications.csv (ID: {job_id})")
 
@@ -154,29 +168,117 @@ def create_jd_resume(jd_name):
         print(f"❌ Error creating JD resume: {e}")
         return False
 
-def show_usage():
-    """Show usage instructions and examples"""
-    print("🎯 JD-Specific Resume Creator")
-    print("=" * 40)
-    print()
-    print("USAGE:")
-    print("  python create_jd_resume.py 'job-description-name'")
-    print()
-    print("EXAMPLES:")
-    print("  python create_jd_resume.py 'google-swe'")
-    print("  python create_jd_resume.py 'microsoft-ai-engineer'")
-    print("  python create_jd_resume.py 'startup-fullstack'")
-    print("  python create_jd_resume.py 'nvidia-hardware'")
-    print()
-    print("OUTPUT:")
-    print("  Creates: resume_[cleaned-name].html")
-    print("  Example: resume_google-swe.html")
-    print()
-    print("NAMING TIPS:")
-    print("  - Use company-role format")
-    print("  - Keep it short and descriptive")
-    print("  - Avoid special characters")
-    print("  - Use hyphens instead of spaces")
+def read_job_list(list_file):
+    """CSV (with a header row) or JSONL job list -> [(line number, {company, role, base})]"""
+    with open(list_file, 'r', encoding='utf-8', newline='') as f:
+        if list_file.lower().endswith(('.jsonl', '.json')):
+            records = [(n, json.loads(line)) for n, line in enumerate(f, 1) if line.strip()]
+        else:
+            records = list(enumerate(csv.DictReader(f), 2))
+    return [(n, {str(k).strip().lower(): str(v or '').strip() for k, v in record.items()})
+            for n, record in records]
+
+def resolve_base(base):
+    """'ai_engineer', 'resume_ai_engineer' or 'resume_ai_engineer.html' -> path in BASES_DIR, or None"""
+    name = os.path.basename(base)
+    name = name[:-len('.html')] if name.endswith('.html') else name
+    if not name.startswith('resume_'):
+        name = f"resume_{name}"
+    path = os.path.join(BASES_DIR, f"{name}.html")
+    return path if os.path.exists(path) else None
+
+def existing_ids(csv_file):
+    if not os.path.exists(csv_file):
+        return set()
+    with csv_writer.locked(csv_file), open(csv_file, 'r', encoding='utf-8', newline='') as f:
+        return {row.get('ID') for row in csv.DictReader(f)}
+
+def create_jd_resumes_bulk(list_file, force=False):
+    """Create one draft per job in a CSV/JSONL list and log them in a single CSV append"""
+    try:
+        jobs = read_job_list(list_file)
+    except (OSError, ValueError, AttributeError) as e:
+        print(f"❌ Error reading job list {list_file}: {e}")
+        return False
+
+    # Validate everything before writing anything
+    errors, planned, seen = [], [], {}
+    for line, job in jobs:
+        missing = [k for k in ('company', 'role', 'base') if not job.get(k)]
+        if missing:
+            errors.append(f"line {line}: missing {', '.join(missing)}")
+            continue
+        base_path = resolve_base(job['base'])
+        if base_path is None:
+            errors.append(f"line {line}: unknown base '{job['base']}'")
+            continue
+        jd_name = f"{job['company']}-{job['role']}"
+        jd_clean = clean_jd_name(jd_name)
+        if jd_clean in seen:
+            errors.append(f"line {line}: duplicate of line {seen[jd_clean]} (resume_{jd_clean}.html)")
+            continue
+        seen[jd_clean] = line
+        planned.append((jd_name, jd_clean, job, base_path))
+    if errors:
+        print(f"❌ {len(errors)} problem(s) in {list_file}, nothing was created:")
+        for error in errors:
+            print(f"   {error}")
+        print(f"   Bases available: {', '.join(sorted(f for f in os.listdir(BASES_DIR) if f.endswith('.html')))}")
+        return False
+
+    os.makedirs(DRAFTS_DIR, exist_ok=True)
+    now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    bases = {}
+    created, skipped, new_rows = [], [], []
+    for jd_name, jd_clean, job, base_path in planned:
+        jd_file = os.path.join(DRAFTS_DIR, f"resume_{jd_clean}.html")
+        if os.path.exists(jd_file) and not force:
+            skipped.append(jd_clean)
+            continue
+        if base_path not in bases:
+            with open(base_path, 'r', encoding='utf-8') as f:
+                bases[base_path] = f.read()
+        base_file = os.path.basename(base_path)
+        with open(jd_file, 'w', encoding='utf-8') as f:
+            f.write(draft_content(bases[base_path], jd_name, base_file, now_str))
+        created.append(jd_clean)
+        # Prepare Row: ID,Date,Company,Position,Status,HTML_Path,PDF_Path,Notes
+        new_rows.append([jd_clean, now_str, job['company'], job['role'], "DRAFT",
+                         f"Resume/Drafts/resume_{jd_clean}.html", "", f"Created from {base_file}"])
+
+    if new_rows:
+        try:
+            # Check and append under one lock, so a concurrent run cannot log the same IDs
+            with csv_writer.locked(CSV_FILE):
+                logged = existing_ids(CSV_FILE)
+                new_rows = [row for row in new_rows if row[0] not in logged]
+                if new_rows:
+                    csv_writer.append_rows(CSV_FILE, new_rows)
+            print(f"✅ Logged {len(new_rows)} DRAFT rows to job_applications.csv")
+        except Exception as e:
+            print(f"⚠️ Failed to log to CSV: {e}")
+
+    print(f"✅ Created {len(created)} drafts in Resume/Drafts/ from {len(bases)} base(s)")
+    if skipped:
+        print(f"⏭️  Skipped {len(skipped)} existing drafts (use --force to overwrite): {', '.join(skipped)}")
+    return True
+
+USAGE_EXAMPLES = """\
+examples:
+  python create_jd_resume.py 'google-swe'
+  python create_jd_resume.py 'microsoft-ai-engineer'
+  python create_jd_resume.py --bulk jobs.csv [--force]   # company,role,base per row (or .jsonl)
+
+output:
+  Creates: resume_[cleaned-name].html
+  Example: resume_google-swe.html
+
+naming tips:
+  - Use company-role format
+  - Keep it short and descriptive
+  - Avoid special characters
+  - Use hyphens instead of spaces
+"""
 
 def analyze_current_resumes():
     """Show existing resume files"""
@@ -209,18 +311,29 @@ def analyze_current_resumes():
 
 def main():
     """Main function"""
+    parser = argparse.ArgumentParser(description='Create JD-specific resume drafts',
+                                     epilog=USAGE_EXAMPLES,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('target', help='Job description name (e.g. "google-swe"), or with --bulk a CSV/JSONL job list')
+    parser.add_argument('--bulk', action='store_true', help='Create one draft per row of the job list')
+    parser.add_argument('--force', action='store_true', help='With --bulk, overwrite existing drafts')
+    args = parser.parse_args()
+    if args.force and not args.bulk:
+        parser.error('--force only applies to --bulk')
+
     print("🎯 JD-Specific Resume Creator")
     print("=" * 40)
     
     # Show existing resumes
     analyze_current_resumes()
     
-    # Check command line arguments
-    if len(sys.argv) != 2:
-        show_usage()
+    if args.bulk:
+        if create_jd_resumes_bulk(args.target, force=args.force):
+            print()
+            print("🎉 Drafts ready to customize; convert them with ci_process_resumes.py")
         return
-    
-    jd_name = sys.argv[1]
+
+    jd_name = args.target
     
     # Create JD-specific resume
     success = create_jd_resume(jd_name)
@@ -12,13 +12,44 @@ application status. Supabase/dashboard updates are handled separately.
 from __future__ import annotations
 
 import argparse
+import asyncio
+import atexit
+import hashlib
+import json
+import os
+import queue
+import re
 import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from importlib import metadata, util
 from pathlib import Path
+from typing import Callable, NamedTuple
 
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 DRAFTS_DIR = BASE_DIR / "Resume" / "Drafts"
 TO_APPLY_DIR = BASE_DIR / "Resume" / "To_Apply"
+MANIFEST_PATH = TO_APPLY_DIR / ".build_manifest.json"
+DEFAULT_CHROMIUM_PAGES = 4
+WATCH_DEBOUNCE_SECONDS = 0.3
+WATCH_POLL_SECONDS = 0.25
+
+# Local files an HTML draft or stylesheet can pull into the rendered PDF.
+ASSET_REF_RE = re.compile(
+    r"""(?:href|src)\s*=\s*["']([^"']+)["']"""
+    r"""|url\(\s*["']?([^"')]+?)["']?\s*\)"""
+    r"""|@import\s+["']([^"']+)["']""",
+    re.IGNORECASE,
+)
+
+
+class BuildResult(NamedTuple):
+    name: str
+    pdf_path: Path | None
+    status: str  # "created", "up to date" or "failed"
+    error: str | None = None
 
 
 def normalize_resume_name(name: str) -> str:
@@ -41,34 +72,144 @@ def find_input_html(name: str) -> Path:
     return html_path
 
 
+_font_config = None
+
+
+def weasyprint_font_config():
+    """Share one FontConfiguration so font discovery happens once per process."""
+    global _font_config
+    if _font_config is None:
+        from weasyprint.text.fonts import FontConfiguration
+
+        _font_config = FontConfiguration()
+    return _font_config
+
+
 def convert_with_weasyprint(html_path: Path, pdf_path: Path) -> None:
     import weasyprint
 
     html = weasyprint.HTML(filename=str(html_path))
-    html.write_pdf(str(pdf_path))
+    html.write_pdf(str(pdf_path), font_config=weasyprint_font_config())
 
 
-def convert_with_playwright(html_path: Path, pdf_path: Path) -> None:
-    from playwright.sync_api import sync_playwright
-
-    with sync_playwright() as playwright:
-        browser = playwright.chromium.launch()
-        page = browser.new_page()
-        page.goto(html_path.resolve().as_uri(), wait_until="networkidle")
-        page.pdf(
-            path=str(pdf_path),
-            format="A4",
-            margin={"top": "0", "bottom": "0", "left": "0", "right": "0"},
-            print_background=True,
-            prefer_css_page_size=True,
+class ChromiumPool:
+    """One Chromium instance kept alive for every Playwright conversion in this process.
+
+    Playwright's async API runs on a private event-loop thread so callers stay
+    synchronous. Each conversion gets a fresh page; up to ``pages`` print at once.
+    """
+
+    def __init__(self, pages: int = DEFAULT_CHROMIUM_PAGES) -> None:
+        self.pages = max(1, pages)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="chromium-pool", daemon=True)
+        self._thread.start()
+        try:
+            self._run(self._launch())
+        except BaseException:
+            self._stop_loop()
+            raise
+
+    def _run(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def _stop_loop(self) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    async def _launch(self) -> None:
+        from playwright.async_api import async_playwright
+
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch()
+
+    async def _print(
+        self, html_path: Path, pdf_path: Path | None, semaphore: asyncio.Semaphore | None = None
+    ) -> bytes:
+        async with semaphore or asyncio.Semaphore(1):
+            page = await self._browser.new_page()
+            try:
+                await page.goto(html_path.resolve().as_uri(), wait_until="networkidle")
+                return await page.pdf(
+                    path=str(pdf_path) if pdf_path else None,
+                    format="A4",
+                    margin={"top": "0", "bottom": "0", "left": "0", "right": "0"},
+                    print_background=True,
+                    prefer_css_page_size=True,
+                )
+            finally:
+                await page.close()
+
+    async def _print_all(self, jobs: list[tuple[Path, Path]]) -> list[BaseException | None]:
+        semaphore = asyncio.Semaphore(self.pages)
+        results = await asyncio.gather(
+            *(self._print(html_path, pdf_path, semaphore) for html_path, pdf_path in jobs),
+            return_exceptions=True,
         )
-        browser.close()
+        return [result if isinstance(result, BaseException) else None for result in results]
+
+    def convert(self, html_path: Path, pdf_path: Path) -> None:
+        error = self.convert_many([(html_path, pdf_path)])[0]
+        if error is not None:
+            raise error
+
+    def render(self, html_path: Path) -> bytes:
+        """Print a draft into memory instead of a file."""
+        return self._run(self._print(html_path, None))
+
+    def convert_many(self, jobs: list[tuple[Path, Path]]) -> list[BaseException | None]:
+        """Print (html_path, pdf_path) jobs concurrently; returns one error or None per job."""
+        return self._run(self._print_all(jobs))
+
+    def close(self) -> None:
+        if not self._loop.is_running():
+            return
+        try:
+            self._run(self._browser.close())
+            self._run(self._playwright.stop())
+        finally:
+            self._stop_loop()
+
+
+_chromium_pool: ChromiumPool | None = None
+
+
+def chromium_pool(pages: int | None = None) -> ChromiumPool:
+    """Return the process-wide Chromium pool, launching it on first use."""
+    global _chromium_pool
+    if _chromium_pool is None:
+        _chromium_pool = ChromiumPool(pages or DEFAULT_CHROMIUM_PAGES)
+        atexit.register(_chromium_pool.close)
+    elif pages:
+        _chromium_pool.pages = max(1, pages)
+    return _chromium_pool
+
+
+def convert_with_playwright(html_path: Path, pdf_path: Path) -> None:
+    chromium_pool().convert(html_path, pdf_path)
+
+
+def render_pdf_bytes(html_path: Path) -> bytes:
+    try:
+        import weasyprint
+    except ImportError:
+        return chromium_pool().render(html_path)
+    return weasyprint.HTML(filename=str(html_path)).write_pdf(font_config=weasyprint_font_config())
+
+
+def weasyprint_available() -> bool:
+    return util.find_spec("weasyprint") is not None
+
+
+def output_pdf_path(html_path: Path) -> Path:
+    return TO_APPLY_DIR / f"{html_path.stem}.pdf"
 
 
 def convert_resume(name: str) -> Path:
     html_path = find_input_html(name)
     TO_APPLY_DIR.mkdir(parents=True, exist_ok=True)
-    pdf_path = TO_APPLY_DIR / f"{html_path.stem}.pdf"
+    pdf_path = output_pdf_path(html_path)
 
     try:
         convert_with_weasyprint(html_path, pdf_path)
@@ -78,38 +219,712 @@ def convert_resume(name: str) -> Path:
     return pdf_path
 
 
+# ── Incremental build manifest ──────────────────────────────────────────────
+
+
+def renderer_version() -> str:
+    for package in ("weasyprint", "playwright"):
+        try:
+            return f"{package} {metadata.version(package)}"
+        except metadata.PackageNotFoundError:
+            continue
+    return "none"
+
+
+def referenced_assets(path: Path, seen: set[Path] | None = None) -> list[Path]:
+    """Local stylesheets, fonts and images reachable from an HTML or CSS file."""
+    seen = set() if seen is None else seen
+    assets: list[Path] = []
+    text = path.read_text(encoding="utf-8", errors="replace")
+
+    for match in ASSET_REF_RE.finditer(text):
+        ref = next(group for group in match.groups() if group).strip()
+        if not ref or ref.startswith(("#", "data:")) or re.match(r"^[a-z][a-z0-9+.-]*:", ref, re.I):
+            continue
+        asset = (path.parent / ref.split("#", 1)[0].split("?", 1)[0]).resolve()
+        if asset in seen or not asset.is_file():
+            continue
+        seen.add(asset)
+        assets.append(asset)
+        if asset.suffix.lower() == ".css":
+            assets.extend(referenced_assets(asset, seen))
+
+    return assets
+
+
+def build_fingerprint(html_path: Path) -> str:
+    digest = hashlib.sha256()
+    digest.update(renderer_version().encode())
+    for path in [html_path, *sorted(referenced_assets(html_path))]:
+        digest.update(b"\0" + path.name.encode() + b"\0")
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def load_manifest() -> dict[str, dict[str, str]]:
+    try:
+        return json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_manifest(manifest: dict[str, dict[str, str]]) -> None:
+    TO_APPLY_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = MANIFEST_PATH.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    tmp_path.replace(MANIFEST_PATH)
+
+
+def record_build(manifest: dict[str, dict[str, str]], stem: str, fingerprint: str) -> None:
+    manifest[stem] = {"fingerprint": fingerprint, "renderer": renderer_version()}
+
+
+def build_status(html_path: Path, manifest: dict[str, dict[str, str]], fingerprint: str | None = None) -> str:
+    if not output_pdf_path(html_path).exists():
+        return "missing"
+    fingerprint = fingerprint or build_fingerprint(html_path)
+    if manifest.get(html_path.stem, {}).get("fingerprint") == fingerprint:
+        return "up to date"
+    return "stale"
+
+
+def draft_names() -> list[str]:
+    return [draft.stem for draft in sorted(DRAFTS_DIR.glob("resume_*.html"))]
+
+
+def warm_renderer() -> None:
+    # Pay the renderer import and font setup once per worker, not once per file.
+    try:
+        weasyprint_font_config()
+    except ImportError:
+        pass
+
+
+def convert_many_with_playwright(names: list[str], pages: int | None = None) -> list[BuildResult]:
+    """Print several drafts as concurrent pages of one shared Chromium instance."""
+    results: dict[str, BuildResult] = {}
+    jobs: dict[str, tuple[Path, Path]] = {}
+
+    for name in names:
+        try:
+            html_path = find_input_html(name)
+        except FileNotFoundError as exc:
+            results[name] = BuildResult(name, None, "failed", str(exc))
+            continue
+        jobs[name] = (html_path, output_pdf_path(html_path))
+
+    if jobs:
+        TO_APPLY_DIR.mkdir(parents=True, exist_ok=True)
+        try:
+            errors = chromium_pool(pages).convert_many(list(jobs.values()))
+        except Exception as exc:
+            errors = [exc] * len(jobs)
+        for name, error in zip(jobs, errors):
+            if error is None:
+                results[name] = BuildResult(name, jobs[name][1], "created")
+            else:
+                results[name] = BuildResult(name, None, "failed", str(error))
+
+    return [results[name] for name in names]
+
+
+def convert_many(names: list[str], workers: int | None = None) -> list[BuildResult]:
+    """Convert several drafts in the order given.
+
+    WeasyPrint renders fan out over a warm process pool. Without WeasyPrint the
+    drafts print as ``workers`` concurrent pages of one persistent Chromium.
+    """
+    if len(names) > 1 and not weasyprint_available():
+        return convert_many_with_playwright(names, workers)
+
+    if len(names) <= 1:
+        results = []
+        for name in names:
+            try:
+                results.append(BuildResult(name, convert_resume(name), "created"))
+            except Exception as exc:
+                results.append(BuildResult(name, None, "failed", str(exc)))
+        return results
+
+    by_name: dict[str, BuildResult] = {}
+    workers = max(1, min(workers or os.cpu_count() or 1, len(names)))
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=warm_renderer) as pool:
+        futures = {pool.submit(convert_resume, name): name for name in names}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                by_name[name] = BuildResult(name, future.result(), "created")
+            except Exception as exc:
+                by_name[name] = BuildResult(name, None, "failed", str(exc))
+
+    return [by_name[name] for name in names]
+
+
+def build_drafts(names: list[str], workers: int | None = None, force: bool = False) -> list[BuildResult]:
+    """Render only drafts whose fingerprint changed since the last recorded build.
+
+    The manifest is read and written only in this process, so pool workers never
+    race on it.
+    """
+    manifest = load_manifest()
+    by_name: dict[str, BuildResult] = {}
+    pending: dict[str, tuple[str, str]] = {}
+
+    for name in names:
+        try:
+            html_path = find_input_html(name)
+        except FileNotFoundError as exc:
+            by_name[name] = BuildResult(name, None, "failed", str(exc))
+            continue
+        fingerprint = build_fingerprint(html_path)
+        if not force and build_status(html_path, manifest, fingerprint) == "up to date":
+            by_name[name] = BuildResult(name, output_pdf_path(html_path), "up to date")
+        else:
+            pending[name] = (html_path.stem, fingerprint)
+
+    created = False
+    for result in convert_many(list(pending), workers):
+        by_name[result.name] = result
+        if result.status == "created":
+            record_build(manifest, *pending[result.name])
+            created = True
+
+    if created:
+        save_manifest(manifest)
+
+    return [by_name[name] for name in names]
+
+
+def print_batch_summary(results: list[BuildResult]) -> int:
+    counts = {"created": 0, "up to date": 0, "failed": 0}
+    for result in results:
+        counts[result.status] += 1
+        if result.status == "failed":
+            print(f"FAIL  {normalize_resume_name(result.name)}: {result.error}", file=sys.stderr)
+        elif result.status == "up to date":
+            print(f"SKIP  {result.pdf_path.relative_to(BASE_DIR)}  (up to date)")
+        else:
+            print(f"OK    {result.pdf_path.relative_to(BASE_DIR)}")
+
+    print(f"\n{counts['created']} converted, {counts['up to date']} up to date, {counts['failed']} failed")
+    return 1 if counts["failed"] else 0
+
+
+# ── In-memory convert-and-check ─────────────────────────────────────────────
+
+
+def report_drafts(names: list[str], save: bool = False) -> int:
+    """Render each draft into memory and run the resume_check report on the bytes.
+
+    The PDF is written to Resume/To_Apply only if the verdict passes or ``save``
+    is set, so a failing iteration never touches disk.
+    """
+    import resume_check
+
+    manifest = load_manifest()
+    saved = False
+    failed = 0
+
+    for name in names:
+        try:
+            html_path = find_input_html(name)
+            fingerprint = build_fingerprint(html_path)
+            data = render_pdf_bytes(html_path)
+        except Exception as exc:
+            print(f"ERROR: {normalize_resume_name(name)}: {exc}", file=sys.stderr)
+            failed += 1
+            continue
+
+        pdf_path = output_pdf_path(html_path)
+        issues = resume_check.print_report(pdf_path, data)
+        failed += bool(issues)
+
+        if issues and not save:
+            print(f"Not saved: {html_path.stem} did not pass (use --save to keep the PDF anyway)")
+            continue
+
+        TO_APPLY_DIR.mkdir(parents=True, exist_ok=True)
+        pdf_path.write_bytes(data)
+        record_build(manifest, html_path.stem, fingerprint)
+        saved = True
+        print(f"Saved {pdf_path.relative_to(BASE_DIR)}")
+
+    if saved:
+        save_manifest(manifest)
+    return 1 if failed else 0
+
+
+# ── Layout-only check ───────────────────────────────────────────────────────
+
+CSS_PX_PER_INCH = 96
+
+
+class LayoutCheck(NamedTuple):
+    pages: int
+    words: int
+    page_heights: list[float]  # CSS px
+    content_heights: list[float]  # CSS px from the page top to the last laid-out line
+    bullet_lines: list[tuple[str, int]]  # (bullet text, printed lines) in document order
+
+
+def layout_document(html_path: Path, stylesheets: list | None = None):
+    """Run WeasyPrint's layout pass only; nothing is serialised or written to disk."""
+    import weasyprint
+
+    html = weasyprint.HTML(filename=str(html_path))
+    return html.render(stylesheets=stylesheets, font_config=weasyprint_font_config())
+
+
+def summarize_layout(document) -> LayoutCheck:
+    """Read page fill, word count and per-bullet line counts from the laid-out boxes in one walk."""
+    from weasyprint.formatting_structure import boxes
+
+    words = 0
+    page_heights = []
+    content_heights = []
+    # Keyed by the source element so a bullet split across pages is counted once.
+    bullets: dict[object, list] = {}
+
+    for page in document.pages:
+        bottom = 0.0
+        stack = [(page._page_box, None)]
+        while stack:
+            box, bullet = stack.pop()
+            element = getattr(box, "element", None)
+            if isinstance(box, boxes.BlockBox) and element is not None and "bullet-item" in (element.get("class") or "").split():
+                bullet = bullets.setdefault(element, [[], 0])
+            if isinstance(box, boxes.LineBox):
+                bottom = max(bottom, box.position_y + box.height)
+                if bullet is not None:
+                    bullet[0].append(" ")
+                    bullet[1] += 1
+            elif isinstance(box, boxes.TextBox):
+                words += len(box.text.split())
+                if bullet is not None:
+                    bullet[0].append(box.text)
+            stack.extend((child, bullet) for child in reversed(getattr(box, "children", ())))
+        page_heights.append(page.height)
+        content_heights.append(bottom)
+
+    bullet_lines = [(" ".join("".join(texts).split()).lstrip("● "), lines) for texts, lines in bullets.values()]
+    return LayoutCheck(len(document.pages), words, page_heights, content_heights, bullet_lines)
+
+
+def check_layout(html_path: Path) -> LayoutCheck:
+    if not weasyprint_available():
+        raise RuntimeError("--check-only needs WeasyPrint's layout engine; install weasyprint")
+    return summarize_layout(layout_document(html_path))
+
+
+def print_layout_check(name: str, check: LayoutCheck, elapsed: float) -> None:
+    import resume_check
+
+    issues = resume_check.verdict_issues(check.pages, check.words)
+    verdict = "; ".join(issues) if issues else "✅ Looks good"
+    print(
+        f"CHECK {normalize_resume_name(name)}: {resume_check.page_flag(check.pages)} {check.pages} page(s)  "
+        f"{resume_check.word_flag(check.words)} {check.words} words  — {verdict}  ({elapsed:.2f}s)"
+    )
+    for number, (used, height) in enumerate(zip(check.content_heights, check.page_heights), 1):
+        print(
+            f"      page {number}: {used / CSS_PX_PER_INCH:.2f}in of {height / CSS_PX_PER_INCH:.2f}in used "
+            f"({used / height:.0%})"
+        )
+    long_bullets = [(text, lines) for text, lines in check.bullet_lines if lines > 2]
+    print(f"      bullets: {len(check.bullet_lines)}, {len(long_bullets)} over 2 lines")
+    for text, lines in long_bullets:
+        short = text[:70] + ("…" if len(text) > 70 else "")
+        print(f"      {resume_check.bullet_line_flag(lines)} {lines} lines  \"{short}\"")
+
+
+def check_drafts(names: list[str]) -> int:
+    failed = 0
+    for name in names:
+        started = time.perf_counter()
+        try:
+            check = check_layout(find_input_html(name))
+        except Exception as exc:
+            print(f"ERROR: {normalize_resume_name(name)}: {exc}", file=sys.stderr)
+            failed += 1
+            continue
+        print_layout_check(name, check, time.perf_counter() - started)
+        failed += check.pages > 1
+    return 1 if failed else 0
+
+
+# ── Overflow auto-fit ───────────────────────────────────────────────────────
+
+
+class FitKnob(NamedTuple):
+    label: str
+    selector: str
+    properties: tuple[str, ...]
+    base: float
+    tight: float
+    unit: str
+    step: float
+
+
+# RESUME_AGENT_GUIDE.md step 4, in the documented priority order.
+FIT_KNOBS = [
+    FitKnob("container padding", ".resume-container", ("padding-top", "padding-bottom"), 0.46, 0.32, "in", 0.01),
+    FitKnob("section margin-bottom", ".section", ("margin-bottom",), 14, 11, "pt", 0.5),
+    FitKnob("entry margin-bottom", ".entry:not(:last-child)", ("margin-bottom",), 7, 4, "pt", 0.5),
+    FitKnob("bullet line-height", ".bullet-item", ("line-height",), 10.5, 10, "pt", 0.25),
+    FitKnob("bullet margin-bottom", ".bullet-item", ("margin-bottom",), 2, 1, "pt", 0.25),
+    FitKnob("skills p margin-bottom", ".skills-section p", ("margin-bottom",), 3, 2, "pt", 0.25),
+    FitKnob("header margin-bottom", ".header", ("margin-bottom",), 17, 12, "pt", 0.5),
+]
+
+AUTOFIT_STYLE_RE = re.compile(r'\s*<style id="autofit">.*?</style>', re.DOTALL)
+STYLE_BLOCK_RE = re.compile(r"<style[^>]*>(.*?)</style>", re.DOTALL | re.IGNORECASE)
+
+
+def fit_css(settings: dict[str, float]) -> str:
+    rules = []
+    for knob in FIT_KNOBS:
+        if knob.label in settings:
+            value = f"{settings[knob.label]:g}{knob.unit}"
+            declarations = " ".join(f"{prop}: {value} !important;" for prop in knob.properties)
+            # "html body" outranks the base resume's own !important print rules.
+            rules.append(f"html body {knob.selector} {{ {declarations} }}")
+    return "\n".join(rules)
+
+
+class LayoutTrials:
+    """Re-lay out one draft under different CSS overrides.
+
+    The HTML and its inline stylesheets are parsed once; each trial only parses
+    the few override rules being tried.
+    """
+
+    def __init__(self, html_path: Path) -> None:
+        import weasyprint
+
+        self._weasyprint = weasyprint
+        source = AUTOFIT_STYLE_RE.sub("", html_path.read_text(encoding="utf-8"))
+        base_url = str(html_path)
+        self.stylesheets = [
+            weasyprint.CSS(string=css, base_url=base_url, font_config=weasyprint_font_config())
+            for css in STYLE_BLOCK_RE.findall(source)
+        ]
+        self.html = weasyprint.HTML(string=STYLE_BLOCK_RE.sub("", source), base_url=base_url)
+        self.count = 0
+
+    def pages(self, settings: dict[str, float]) -> int:
+        self.count += 1
+        stylesheets = list(self.stylesheets)
+        if settings:
+            stylesheets.append(self._weasyprint.CSS(string=fit_css(settings)))
+        document = self.html.render(stylesheets=stylesheets, font_config=weasyprint_font_config())
+        return len(document.pages)
+
+
+def fit_draft(html_path: Path) -> tuple[dict[str, float] | None, int]:
+    """Find the least aggressive step-4 CSS tightening that fits the draft on one page.
+
+    Knobs are tightened one at a time in priority order. Once fully tightening a
+    knob makes the draft fit, that knob is binary-searched for the loosest value
+    that still fits. Returns (settings, trials); settings is None if every knob
+    at its tightest still overflows, meaning content has to be cut.
+    """
+    if not weasyprint_available():
+        raise RuntimeError("--fit needs WeasyPrint's layout engine; install weasyprint")
+
+    trials = LayoutTrials(html_path)
+    settings: dict[str, float] = {}
+    if trials.pages(settings) <= 1:
+        return settings, trials.count
+
+    for knob in FIT_KNOBS:
+        settings[knob.label] = knob.tight
+        if trials.pages(settings) > 1:
+            continue
+
+        fits, overflows = knob.tight, knob.base
+        while overflows - fits > knob.step:
+            candidate = round((fits + overflows) / 2 / knob.step) * knob.step
+            if candidate in (fits, overflows):
+                break
+            settings[knob.label] = candidate
+            if trials.pages(settings) <= 1:
+                fits = candidate
+            else:
+                overflows = candidate
+        settings[knob.label] = fits
+        return settings, trials.count
+
+    return None, trials.count
+
+
+def write_fit(html_path: Path, settings: dict[str, float]) -> None:
+    source = AUTOFIT_STYLE_RE.sub("", html_path.read_text(encoding="utf-8"))
+    if settings:
+        block = (
+            '\n    <style id="autofit">\n'
+            "        /* Written by html_to_pdf.py --fit: least aggressive spacing that fits one page */\n"
+            + "".join(f"        {rule}\n" for rule in fit_css(settings).splitlines())
+            + "    </style>"
+        )
+        source = re.sub(r"\s*</head>", lambda match: block + match.group(0), source, count=1, flags=re.IGNORECASE)
+    html_path.write_text(source, encoding="utf-8")
+
+
+def fit_drafts(names: list[str]) -> int:
+    failed = 0
+    for name in names:
+        started = time.perf_counter()
+        try:
+            html_path = find_input_html(name)
+            settings, trials = fit_draft(html_path)
+        except Exception as exc:
+            print(f"ERROR: {normalize_resume_name(name)}: {exc}", file=sys.stderr)
+            failed += 1
+            continue
+
+        elapsed = time.perf_counter() - started
+        label = normalize_resume_name(name)
+        if settings is None:
+            failed += 1
+            print(
+                f"FAIL  {label}: still overflows with every CSS knob at its tightest — cut content "
+                f"({trials} trials, {elapsed:.2f}s)"
+            )
+            continue
+
+        write_fit(html_path, settings)
+        if not settings:
+            print(f"FIT   {label}: already fits on one page ({trials} trials, {elapsed:.2f}s)")
+            continue
+        print(f"FIT   {label}: fits on one page ({trials} trials, {elapsed:.2f}s)")
+        for knob in FIT_KNOBS:
+            if knob.label in settings:
+                print(f"      {knob.label}: {knob.base:g}{knob.unit} -> {settings[knob.label]:g}{knob.unit}")
+    return 1 if failed else 0
+
+
+# ── Watch mode ──────────────────────────────────────────────────────────────
+
+
+def is_draft_html(path: Path) -> bool:
+    return path.parent == DRAFTS_DIR and path.name.startswith("resume_") and path.suffix == ".html"
+
+
+def draft_mtimes() -> dict[Path, int]:
+    """Modification time of every draft; a file replaced mid-scan (atomic save) is left for the next tick."""
+    mtimes = {}
+    for path in DRAFTS_DIR.glob("resume_*.html"):
+        try:
+            mtimes[path] = path.stat().st_mtime_ns
+        except OSError:
+            continue
+    return mtimes
+
+
+def start_polling_watcher(changes: queue.Queue) -> Callable[[], None]:
+    stop = threading.Event()
+
+    def poll() -> None:
+        seen = draft_mtimes()
+        while not stop.wait(WATCH_POLL_SECONDS):
+            current = draft_mtimes()
+            for path, mtime in current.items():
+                if seen.get(path) != mtime:
+                    changes.put(path)
+            seen = current
+
+    threading.Thread(target=poll, name="drafts-poller", daemon=True).start()
+    return stop.set
+
+
+def start_watcher(changes: queue.Queue) -> Callable[[], None]:
+    """Feed changed draft paths into ``changes``; returns a function that stops watching.
+
+    Uses watchdog's native file notifications (inotify, FSEvents, ReadDirectoryChangesW)
+    when installed and falls back to polling modification times otherwise.
+    """
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        return start_polling_watcher(changes)
+
+    class DraftEventHandler(FileSystemEventHandler):
+        def on_any_event(self, event) -> None:
+            # Editors often save via temp file + rename, so the draft shows up as dest_path.
+            for raw_path in (event.src_path, getattr(event, "dest_path", "")):
+                if raw_path:
+                    changes.put(Path(os.fsdecode(raw_path)))
+
+    observer = Observer()
+    observer.schedule(DraftEventHandler(), str(DRAFTS_DIR))
+    observer.start()
+
+    def stop() -> None:
+        observer.stop()
+        observer.join()
+
+    return stop
+
+
+def report_build(result: BuildResult, elapsed: float) -> None:
+    name = normalize_resume_name(result.name)
+    if result.status == "failed":
+        print(f"FAIL  {name}: {result.error}  ({elapsed:.2f}s)", file=sys.stderr)
+        return
+    if result.status == "up to date":
+        print(f"SKIP  {name}: content unchanged")
+        return
+
+    import resume_check
+
+    reader = resume_check.load_pdf(result.pdf_path)
+    pages = resume_check.page_count(reader)
+    words = resume_check.count_words("\n".join(resume_check.extract_text_by_page(reader)))
+    issues = resume_check.verdict_issues(pages, words)
+    verdict = "; ".join(issues) if issues else "✅ Looks good"
+    print(
+        f"OK    {name}: {resume_check.page_flag(pages)} {pages} page(s)  "
+        f"{resume_check.word_flag(words)} {words} words  — {verdict}  ({elapsed:.2f}s)"
+    )
+
+
+def watch_drafts(debounce: float = WATCH_DEBOUNCE_SECONDS, check_only: bool = False) -> int:
+    """Re-render each draft shortly after it is saved, in this already-warm process.
+
+    With ``check_only`` only the layout pass runs and no PDFs are written.
+    """
+    DRAFTS_DIR.mkdir(parents=True, exist_ok=True)
+    warm_renderer()
+    changes: queue.Queue = queue.Queue()
+    stop = start_watcher(changes)
+    print(f"Watching {DRAFTS_DIR.relative_to(BASE_DIR)} for changes (Ctrl+C to stop)...")
+
+    try:
+        while True:
+            try:
+                batch = {changes.get(timeout=1.0)}
+            except queue.Empty:
+                continue
+            # Debounce: wait for the burst of events from one save to go quiet.
+            while True:
+                try:
+                    batch.add(changes.get(timeout=debounce))
+                except queue.Empty:
+                    break
+
+            for html_path in sorted(path for path in batch if is_draft_html(path) and path.exists()):
+                started = time.perf_counter()
+                try:
+                    if check_only:
+                        check = check_layout(html_path)
+                        print_layout_check(html_path.stem, check, time.perf_counter() - started)
+                    else:
+                        result = build_drafts([html_path.stem])[0]
+                        report_build(result, time.perf_counter() - started)
+                except Exception as exc:
+                    print(f"FAIL  {html_path.stem}: could not check draft: {exc}", file=sys.stderr)
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+    finally:
+        stop()
+
+    return 0
+
+
 def list_drafts() -> None:
     drafts = sorted(DRAFTS_DIR.glob("resume_*.html"))
     if not drafts:
         print("No draft HTML files found in Resume/Drafts.")
         return
 
+    manifest = load_manifest()
     for draft in drafts:
-        pdf_path = TO_APPLY_DIR / f"{draft.stem}.pdf"
-        status = "pdf exists" if pdf_path.exists() else "no pdf"
-        print(f"{draft.name}  [{status}]")
+        print(f"{draft.name}  [{build_status(draft, manifest)}]")
 
 
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Convert Resume/Drafts HTML to Resume/To_Apply PDF.")
-    parser.add_argument("name", nargs="?", help="Resume slug, filename, or resume_<slug>.html")
+    parser.add_argument("names", nargs="*", metavar="name", help="Resume slug, filename, or resume_<slug>.html")
     parser.add_argument("--list", action="store_true", help="List available draft HTML files")
+    parser.add_argument("--all", action="store_true", help="Convert every draft in Resume/Drafts")
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=None,
+        help=(
+            "Worker processes for batch conversion (default: CPU count); "
+            f"concurrent Chromium pages for the Playwright fallback (default: {DEFAULT_CHROMIUM_PAGES})"
+        ),
+    )
+    parser.add_argument("--force", action="store_true", help="Re-render even if the PDF is up to date")
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Watch Resume/Drafts and re-render each draft as soon as it is saved",
+    )
+    modes = parser.add_mutually_exclusive_group()
+    modes.add_argument(
+        "--check-only",
+        action="store_true",
+        help="Report page count and page fill from WeasyPrint's layout pass without writing PDFs",
+    )
+    modes.add_argument(
+        "--report",
+        action="store_true",
+        help="Render in memory, print the resume_check report, and save the PDF only if it passes",
+    )
+    modes.add_argument(
+        "--fit",
+        action="store_true",
+        help="Search the step-4 CSS tightening knobs and write the least aggressive one-page fit into the draft",
+    )
+    parser.add_argument("--save", action="store_true", help="With --report, save the PDF even if it fails")
     args = parser.parse_args(argv)
 
+    if args.watch and (args.report or args.fit):
+        parser.error("--watch only combines with --check-only")
+    if args.save and not args.report:
+        parser.error("--save only applies to --report")
+
     if args.list:
         list_drafts()
         return 0
 
-    if not args.name:
-        parser.error("name is required unless --list is used")
+    if args.watch:
+        return watch_drafts(check_only=args.check_only)
 
-    try:
-        pdf_path = convert_resume(args.name)
-    except Exception as exc:
-        print(f"ERROR: {exc}", file=sys.stderr)
+    names = draft_names() if args.all else args.names
+    if not names:
+        if args.all:
+            print("No draft HTML files found in Resume/Drafts.")
+            return 0
+        parser.error("name is required unless --list or --all is used")
+
+    if args.fit:
+        return fit_drafts(names)
+
+    if args.check_only:
+        return check_drafts(names)
+
+    if args.report:
+        return report_drafts(names, args.save)
+
+    results = build_drafts(names, args.workers, args.force)
+    if len(results) > 1:
+        return print_batch_summary(results)
+
+    result = results[0]
+    if result.status == "failed":
+        print(f"ERROR: {result.error}", file=sys.stderr)
         return 1
 
-    print(f"Created {pdf_path.relative_to(BASE_DIR)}")
+    if result.status == "up to date":
+        print(f"Up to date: {result.pdf_path.relative_to(BASE_DIR)} (use --force to re-render)")
+    else:
+        print(f"Created {result.pdf_path.relative_to(BASE_DIR)}")
     return 0
 
 
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+jd_match.py — JD keyword coverage for base resumes and drafts
+Scores a job description against every base in Master_Resume/current/, every
+draft in Resume/Drafts/ and the HTML archive in one TF-IDF matrix product, then
+lists the must-have JD keywords each section is missing (Step 1 of
+RESUME_AGENT_GUIDE.md: match score + gaps).
+
+Must-haves are the technical terms from the JD's required/minimum qualifications
+block (the whole JD when it has no such block); preferred terms come from the
+preferred/nice-to-have block.
+
+Requires numpy (pip install numpy).
+
+Usage:
+    python Scripts/jd_match.py jd.txt                    # rank every resume, gaps for the best
+    python Scripts/jd_match.py jd.txt --gaps xai-grok    # gaps for a specific base/draft
+    Get-Clipboard | python Scripts/jd_match.py -         # JD from stdin
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+import resume_corpus
+from resume_check import BASE_DIR, HR
+
+MASTER_DIR = BASE_DIR / "Master_Resume" / "current"
+DRAFTS_DIR = BASE_DIR / "Resume" / "Drafts"
+ARCHIVE_DIR = BASE_DIR / "Resume" / "Archive"
+SEARCH_DIRS = (MASTER_DIR, DRAFTS_DIR, ARCHIVE_DIR)
+
+SKILLS_SECTIONS = resume_corpus.SKILLS_SECTIONS
+GAP_SECTIONS = ("SUMMARY", *SKILLS_SECTIONS, "PROJECTS", "PROJECT EXPERIENCE", "WORK EXPERIENCE", "EXPERIENCE")
+
+DEFAULT_TOP = 10
+MAX_KEYWORDS = 30   # per JD block, highest TF-IDF first
+
+# ── Terms ────────────────────────────────────────────────────────────────────
+
+# Keeps C++, C#, Node.js, CI/CD, PyTorch 2.x style tokens whole
+TOKEN_RE = re.compile(r"[A-Za-z0-9][A-Za-z0-9+#./-]*[A-Za-z0-9+#]|[A-Za-z]")
+
+STOPWORDS = set("""
+a about above across after all also an and any are as at be been being both but by can
+could do does each either etc for from had has have how if in into is it its like may
+more most must new no not of on or other our out over per such than that the their them
+then there these they this those through to under up us use used using via was we well
+were what when where which while who will with within without would you your
+ability able across ai-powered applicant apply background based benefit benefits best
+bonus build building candidate candidates collaborate company complex comfortable
+communication consider day degree demonstrated deep design develop developing
+environment equivalent excellent experience experienced familiarity familiar fast
+field help highly ideal ideally including job join key knowledge large least level
+looking make minimum nice opportunity own paced passion passionate plus preferred
+problem problems proficiency proficient qualifications related relevant required
+requirements responsibilities role skills solid solving strong team teams technical
+technologies tools understanding work working world year years
+""".split())
+
+REQUIRED_RE = re.compile(r"(?i)\b(required|minimum|basic qualifications|must[- ]have|what you.ll need|you have|requirements)\b")
+PREFERRED_RE = re.compile(r"(?i)\b(preferred|nice[- ]to[- ]have|bonus|plus|ideally)\b")
+OTHER_RE = re.compile(r"(?i)\b(responsibilities|what you.ll do|about (us|the team|the role)|benefits|compensation|salary)\b")
+
+
+def tokens(text: str) -> list[str]:
+    return [t.lower() for t in TOKEN_RE.findall(text)]
+
+
+def terms(text: str) -> list[str]:
+    """Unigrams and bigrams of non-stopword tokens, per line so bigrams never straddle bullets."""
+    out = []
+    for line in text.splitlines():
+        keep = [t if t not in STOPWORDS and re.search("[a-z]", t) else None for t in tokens(line)]
+        out.extend(t for t in keep if t)
+        out.extend(f"{a} {b}" for a, b in zip(keep, keep[1:]) if a and b)
+    return out
+
+
+def looks_technical(term: str, jd_text: str, lexicon: set[str]) -> bool:
+    """
+    JD terms worth flagging as gaps: anything listed in a resume skills
+    section, plus tokens the JD writes as names or symbols (Kubernetes, gRPC,
+    C++, CI/CD).
+    """
+    if term in lexicon:
+        return True
+    if " " in term:
+        return False
+    if re.search(r"[0-9+#./]", term):
+        return True
+    # Capitalised mid-sentence (not after a line start, bullet or full stop)
+    mid_sentence = rf"(?<=[a-z,;(/] )\b{re.escape(term)}\b"
+    return any(w != w.lower() for w in re.findall(mid_sentence, jd_text, re.I))
+
+
+def jd_blocks(jd_text: str) -> tuple[str, str]:
+    """
+    (required, preferred) text of a JD; all of it is 'required' without headings.
+    A heading may carry its list inline ("Preferred: Rust, Go."): the text after
+    the colon goes into the block the heading opens.
+    """
+    required, preferred, current = [], [], None
+    for line in jd_text.splitlines():
+        heading, colon, rest = line.partition(":")
+        if not colon:
+            heading, rest = line, ""
+        short = len(heading.split()) <= 8
+        if short and PREFERRED_RE.search(heading):
+            current = preferred
+        elif short and REQUIRED_RE.search(heading):
+            current = required
+        elif short and OTHER_RE.search(heading):
+            current = None
+        else:
+            rest = line     # not a heading: the whole line belongs to the open block
+        if current is not None and rest.strip():
+            current.append(rest)
+    if not required:
+        return jd_text, "\n".join(preferred)
+    return "\n".join(required), "\n".join(preferred)
+
+
+# ── Resume matrix ────────────────────────────────────────────────────────────
+
+def resume_files(dirs=SEARCH_DIRS) -> list[Path]:
+    return [p for d in dirs for p in sorted(d.glob("resume_*.html"))]
+
+
+class ResumeMatrix:
+    """
+    Term counts for every resume (rows of `docs`) and every resume section
+    (rows of `sections`) over one shared vocabulary, so a JD is scored
+    against all of them with a single matrix product.
+    """
+
+    def __init__(self, paths: list[Path]):
+        self.paths = paths
+        self.vocab: dict[str, int] = {}
+        self.section_rows: list[tuple[int, str]] = []   # (doc index, section name)
+        self.lexicon: set[str] = set()                    # every term of every skills section
+        counts: list[list[int]] = []
+        for doc, path in enumerate(paths):
+            for header, body, _ in resume_corpus.extract_html(path):
+                section_terms = terms(body)
+                if header in SKILLS_SECTIONS:
+                    self.lexicon.update(section_terms)
+                self.section_rows.append((doc, header))
+                counts.append([self.vocab.setdefault(t, len(self.vocab)) for t in section_terms])
+
+        self.sections = np.zeros((len(counts), len(self.vocab)), dtype=np.float32)
+        for row, ids in enumerate(counts):
+            np.add.at(self.sections[row], ids, 1)
+        owner = np.array([doc for doc, _ in self.section_rows], dtype=np.intp)
+        self.docs = np.zeros((len(paths), len(self.vocab)), dtype=np.float32)
+        np.add.at(self.docs, owner, self.sections)
+        # Smoothed IDF over resumes; terms the resumes never use get the maximum weight
+        df = np.count_nonzero(self.docs, axis=0)
+        self.idf = np.log((1 + len(paths)) / (1 + df)).astype(np.float32) + 1
+        self.max_idf = np.float32(np.log(1 + len(paths)) + 1)
+
+    def name(self, doc: int) -> str:
+        return str(self.paths[doc].relative_to(BASE_DIR))
+
+    def jd_vector(self, jd_terms: list[str]) -> tuple[np.ndarray, dict[str, float]]:
+        """JD TF-IDF over the resume vocabulary, plus weights for every JD term."""
+        vec = np.zeros(len(self.vocab), dtype=np.float32)
+        weights: dict[str, float] = {}
+        for t in jd_terms:
+            col = self.vocab.get(t)
+            idf = self.idf[col] if col is not None else self.max_idf
+            weights[t] = weights.get(t, 0.0) + float(idf)
+            if col is not None:
+                vec[col] += idf
+        return vec, weights
+
+    def presence(self, rows: np.ndarray, keywords: list[str]) -> np.ndarray:
+        """Boolean rows × keywords matrix; keywords missing from the vocabulary are never present."""
+        cols = np.array([self.vocab.get(k, -1) for k in keywords], dtype=np.intp)
+        out = np.zeros((rows.shape[0], len(keywords)), dtype=bool)
+        known = cols >= 0
+        out[:, known] = rows[:, cols[known]] > 0
+        return out
+
+
+def score(matrix: ResumeMatrix, jd_text: str) -> dict:
+    """Cosine TF-IDF score and must-have / preferred coverage of every resume."""
+    required_text, preferred_text = jd_blocks(jd_text)
+    jd_vec, _ = matrix.jd_vector(terms(jd_text))
+
+    def keywords(block: str, exclude=()) -> list[str]:
+        _, weights = matrix.jd_vector(terms(block))
+        ranked = sorted(weights, key=lambda t: (-weights[t], t))
+        picked = [t for t in ranked if t not in exclude and looks_technical(t, jd_text, matrix.lexicon)]
+        return picked[:MAX_KEYWORDS]
+
+    must = keywords(required_text)
+    preferred = keywords(preferred_text, exclude=set(must)) if preferred_text else []
+
+    tfidf = matrix.docs * matrix.idf
+    norms = np.linalg.norm(tfidf, axis=1) * (np.linalg.norm(jd_vec) or 1.0)
+    cosine = (tfidf @ jd_vec) / np.where(norms == 0, 1.0, norms)
+
+    return {
+        "must": must,
+        "preferred": preferred,
+        "cosine": cosine,
+        "must_present": matrix.presence(matrix.docs, must),
+        "preferred_present": matrix.presence(matrix.docs, preferred),
+        "section_present": matrix.presence(matrix.sections, must),
+    }
+
+
+# ── Output ───────────────────────────────────────────────────────────────────
+
+def print_ranking(matrix: ResumeMatrix, result: dict, top: int, loaded: float, scored: float):
+    must, preferred = result["must"], result["preferred"]
+    must_hits = result["must_present"].sum(axis=1)
+    pref_hits = result["preferred_present"].sum(axis=1)
+    # Coverage of must-haves first, cosine similarity breaks ties
+    order = np.lexsort((-result["cosine"], -must_hits))
+
+    print(f"\n{HR}")
+    print(f"  JD match — {len(must)} must-have, {len(preferred)} preferred keywords")
+    print(f"  {len(matrix.paths)} resumes: parsed and indexed in {loaded * 1000:.0f} ms, "
+          f"scored in {scored * 1000:.1f} ms (total {(loaded + scored) * 1000:.0f} ms)")
+    print(HR)
+    print(f"\n  {'Score':>5}  {'Must':>6}  {'Pref':>6}  Resume")
+    for doc in order[:top]:
+        print(f"  {round(100 * result['cosine'][doc]):>4}%  {must_hits[doc]:>2}/{len(must):<3}"
+              f"  {pref_hits[doc]:>2}/{len(preferred):<3}  {matrix.name(doc)}")
+    return order
+
+
+def print_gaps(matrix: ResumeMatrix, result: dict, doc: int):
+    must = result["must"]
+    present = result["must_present"][doc]
+    print(f"\n  Gaps in {matrix.name(doc)}:")
+    missing = [k for k, hit in zip(must, present) if not hit]
+    print(f"    {'Missing everywhere':<22} {', '.join(missing) if missing else '—'}")
+    for row, (owner, header) in enumerate(matrix.section_rows):
+        if owner != doc or header not in GAP_SECTIONS:
+            continue
+        # Only keywords the resume has elsewhere: these are the ones to move or echo
+        gaps = [k for k, hit, here in zip(must, present, result["section_present"][row]) if hit and not here]
+        print(f"    {header:<22} {', '.join(gaps) if gaps else '—'}")
+    pref_missing = [k for k, hit in zip(result["preferred"], result["preferred_present"][doc]) if not hit]
+    if pref_missing:
+        print(f"    {'Preferred, missing':<22} {', '.join(pref_missing)}")
+
+
+def find_resume(matrix: ResumeMatrix, name: str) -> int | None:
+    needle = resume_corpus.normalize(name)
+    for doc, path in enumerate(matrix.paths):
+        if needle in resume_corpus.normalize(path.stem):
+            return doc
+    return None
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Score a job description against every base resume and draft.")
+    parser.add_argument("jd", help="Job description text file, or - for stdin")
+    parser.add_argument("--gaps", metavar="NAME", action="append",
+                        help="Show section gaps for this base/draft (repeatable; default: best match)")
+    parser.add_argument("-n", "--top", type=int, default=DEFAULT_TOP, help="Resumes to list")
+    args = parser.parse_args(argv)
+
+    jd_text = sys.stdin.read() if args.jd == "-" else Path(args.jd).read_text(encoding="utf-8", errors="replace")
+    if not jd_text.strip():
+        print("Empty job description.", file=sys.stderr)
+        return 1
+
+    start = time.perf_counter()
+    paths = resume_files()
+    if not paths:
+        print("No resumes found in Master_Resume/current/, Resume/Drafts/ or Resume/Archive/.", file=sys.stderr)
+        return 1
+    matrix = ResumeMatrix(paths)
+    loaded = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = score(matrix, jd_text)
+    scored = time.perf_counter() - start
+
+    order = print_ranking(matrix, result, args.top, loaded, scored)
+    targets = []
+    for name in args.gaps or []:
+        doc = find_resume(matrix, name)
+        if doc is None:
+            print(f"\n  ❌ No base or draft matching '{name}'", file=sys.stderr)
+        else:
+            targets.append(doc)
+    for doc in targets or ([] if args.gaps else [order[0]]):
+        print_gaps(matrix, result, doc)
+    print(f"\n{HR}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,17 +2,29 @@
 """
 resume_check.py — Resume feedback tool
 Reads CI-generated PDFs from Resume/To_Apply/ (or any .pdf path you pass)
-and reports: page count, section breakdown, bullet line estimates, word counts.
+and reports: page count, section breakdown, bullet line counts, word counts.
+Line counts come from glyph positions in the PDF; text that cannot be located
+falls back to a CHARS_PER_LINE estimate.
 
 Usage:
     python Scripts/resume_check.py                        # all To_Apply/*.pdf
     python Scripts/resume_check.py Resume/To_Apply/foo.pdf
     python Scripts/resume_check.py Resume/To_Apply/a.pdf Resume/To_Apply/b.pdf
+    python Scripts/resume_check.py --jobs 8 Resume/Applied/*.pdf   # parallel + summary
+    python Scripts/resume_check.py --format ndjson                  # one JSON record per PDF
 """
 
+from __future__ import annotations
+
 import sys
 import io
 import re
+import json
+import hashlib
+import sqlite3
+from bisect import bisect_right
+from contextlib import closing
+from functools import partial
 from pathlib import Path
 
 # Force UTF-8 on Windows console
@@ -23,12 +35,17 @@ if hasattr(sys.stdout, "buffer") and sys.stdout.encoding.lower() != "utf-8":
 
 BASE_DIR = Path(__file__).parent.parent
 TO_APPLY  = BASE_DIR / "Resume" / "To_Apply"
+CACHE_PATH = BASE_DIR / "Resume" / ".resume_check_cache.sqlite"
+CACHE_VERSION = 3   # bump when extraction or section/bullet splitting changes
 
 # ── PDF helpers ───────────────────────────────────────────────────────────────
 
-def load_pdf(path: Path):
+def load_pdf(source):
+    """Open a PDF from a path, or from bytes already rendered in memory."""
     from pypdf import PdfReader
-    return PdfReader(str(path))
+    if isinstance(source, (bytes, bytearray)):
+        return PdfReader(io.BytesIO(source))
+    return PdfReader(str(source))
 
 
 def page_count(reader) -> int:
@@ -39,14 +56,40 @@ def extract_text_by_page(reader) -> list[str]:
     return [p.extract_text() or "" for p in reader.pages]
 
 
+LINE_Y_TOLERANCE = 2.0   # PDF points; glyph runs closer than this share a baseline
+
+def extract_page_runs(page) -> tuple[str, list[tuple[int, str]]]:
+    """
+    One extraction pass over a page returning its text plus every text run,
+    in content order, tagged with the printed line (baseline) it sits on.
+    Line numbers come from glyph positions, top of the page first.
+    """
+    runs = []
+
+    def visit(text, cm, tm, font_dict, font_size):
+        if text.strip():
+            runs.append((tm[4] * cm[1] + tm[5] * cm[3] + cm[5], text))
+
+    text = page.extract_text(visitor_text=visit) or ""
+
+    line_of: dict[float, int] = {}
+    line, line_y = -1, None
+    for y in sorted({y for y, _ in runs}, reverse=True):
+        if line_y is None or line_y - y > LINE_Y_TOLERANCE:
+            line, line_y = line + 1, y
+        line_of[y] = line
+    return text, [(line_of[y], run) for y, run in runs]
+
+
 # ── Text analysis ─────────────────────────────────────────────────────────────
 
 # Section headers as they appear in the PDF text
 SECTION_HEADERS = [
     "SUMMARY", "SKILLS", "TECHNICAL SKILLS",
-    "PROJECTS", "WORK EXPERIENCE", "EXPERIENCE",
-    "EDUCATION", "AWARDS", "CERTIFICATIONS",
+    "PROJECTS", "PROJECT EXPERIENCE", "WORK EXPERIENCE", "EXPERIENCE",
+    "EDUCATION", "AWARDS", "AWARDS & HONORS", "CERTIFICATIONS",
 ]
+ITEM_SECTIONS = ("EDUCATION", "AWARDS", "AWARDS & HONORS", "CERTIFICATIONS")
 
 def split_into_sections(text: str) -> list[tuple[str, str]]:
     """Return [(section_name, section_body), ...] in order."""
@@ -75,6 +118,41 @@ def line_estimate(text: str) -> float:
     return max(1.0, len(text) / CHARS_PER_LINE)
 
 
+class PrintedLines:
+    """
+    Exact printed-line counts for text taken from a PDF, using the positioned
+    runs from extract_page_runs(). Text is located in the document with
+    whitespace ignored and counted by the distinct baselines its runs sit on;
+    anything that cannot be found falls back to line_estimate().
+    """
+
+    def __init__(self, page_runs: list[list[tuple[int, str]]]):
+        parts, self.starts, self.line_keys, pos = [], [], [], 0
+        for page, runs in enumerate(page_runs):
+            for line, run in runs:
+                norm = re.sub(r"\s+", "", run)
+                if norm:
+                    parts.append(norm)
+                    self.starts.append(pos)
+                    self.line_keys.append((page, line))
+                    pos += len(norm)
+        self.stream = "".join(parts)
+        self.cursor = 0   # searches move forward through the document
+
+    def lines(self, text: str) -> float:
+        needle = re.sub(r"\s+", "", text)
+        start = self.stream.find(needle, self.cursor) if needle else -1
+        if start < 0 and needle:
+            start = self.stream.find(needle)
+        if start < 0:
+            return line_estimate(text)
+        end = start + len(needle)
+        self.cursor = end
+        first = bisect_right(self.starts, start) - 1
+        last = bisect_right(self.starts, end - 1) - 1
+        return float(len(set(self.line_keys[first:last + 1])))
+
+
 def split_bullets(body: str) -> list[str]:
     """
     Split section body into individual bullet strings.
@@ -90,6 +168,73 @@ def split_bullets(body: str) -> list[str]:
     return bullets
 
 
+# ── Extraction cache ──────────────────────────────────────────────────────────
+
+def extract_pdf(source) -> dict:
+    """Page count, per-page text and positioned runs, and split sections/bullets for one PDF."""
+    reader = load_pdf(source)
+    texts, runs = [], []
+    for page in reader.pages:
+        text, page_runs = extract_page_runs(page)
+        texts.append(text)
+        runs.append(page_runs)
+    return {
+        "pages": page_count(reader),
+        "texts": texts,
+        "runs": runs,
+        "sections": [[h, b, split_bullets(b)] for h, b in split_into_sections("\n".join(texts))],
+    }
+
+
+def cache_version() -> str:
+    from importlib.metadata import version
+    return f"{CACHE_VERSION}:pypdf-{version('pypdf')}"
+
+
+def open_cache() -> sqlite3.Connection:
+    conn = sqlite3.connect(str(CACHE_PATH), timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    if conn.execute("PRAGMA user_version").fetchone()[0] != CACHE_VERSION:
+        # Older cache layout: start over rather than migrate
+        with conn:
+            conn.execute("DROP TABLE IF EXISTS extractions")
+            conn.execute(f"PRAGMA user_version = {CACHE_VERSION}")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS extractions ("
+        " digest TEXT PRIMARY KEY, version TEXT NOT NULL, data TEXT NOT NULL)"
+    )
+    return conn
+
+
+def cached_extract(pdf_path: Path) -> dict:
+    """
+    extract_pdf() memoised in a SQLite file keyed by the PDF's content hash,
+    so archived PDFs are parsed once no matter how often they are reported on.
+    """
+    data = pdf_path.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    version = cache_version()
+    try:
+        with closing(open_cache()) as conn:
+            row = conn.execute(
+                "SELECT data FROM extractions WHERE digest = ? AND version = ?",
+                (digest, version),
+            ).fetchone()
+            if row:
+                return json.loads(row[0])
+
+            extraction = extract_pdf(data)
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO extractions VALUES (?, ?, ?)",
+                    (digest, version, json.dumps(extraction)),
+                )
+            return extraction
+    except sqlite3.Error as exc:
+        print(f"⚠️  Extraction cache unavailable ({exc}); parsing {pdf_path.name} directly", file=sys.stderr)
+        return extract_pdf(data)
+
+
 # ── Formatting helpers ────────────────────────────────────────────────────────
 
 W  = "⚠️ "
@@ -114,17 +259,143 @@ def bullet_line_flag(lines: float) -> str:
     return W
 
 
+def verdict_issues(pages: int, total_words: int) -> list[str]:
+    """Problems that should block submitting the resume as-is."""
+    issues = []
+    if pages > 1:
+        issues.append(f"❌ {pages} pages — needs trimming")
+    if total_words > 1400:
+        issues.append(f"⚠️  Word count {total_words} is high")
+    if total_words < 800:
+        issues.append(f"⚠️  Word count {total_words} is low — resume may be sparse")
+    return issues
+
+
+# ── Analysis ──────────────────────────────────────────────────────────────────
+
+BULLET_LINE_RE = re.compile(r"^[●•◆▸\-]")
+
+
+def bullet_stats(text: str, counter: PrintedLines | None = None) -> dict:
+    lines = counter.lines(text) if counter else line_estimate(text)
+    return {"text": text, "words": count_words(text), "lines": lines}
+
+
+def group_entries(body: str, counter: PrintedLines | None = None) -> list[dict]:
+    """Group an entries section into titled entries (lines without bullet chars are usually titles)."""
+    entries = []
+    current_entry = None
+    entry_bullets: list[str] = []
+
+    def flush_entry(title, blist):
+        if not title and not blist:
+            return
+        stats = [bullet_stats(b, counter) for b in blist]
+        entries.append({
+            "title": title,
+            "bullets": stats,
+            "lines": sum(b["lines"] for b in stats),
+        })
+
+    for line in (l.strip() for l in body.splitlines() if l.strip()):
+        if BULLET_LINE_RE.match(line):
+            entry_bullets.append(re.sub(r"^[●•◆▸\-]\s*", "", line).strip())
+        else:
+            # New entry title — flush previous
+            if current_entry is not None or entry_bullets:
+                flush_entry(current_entry or "", entry_bullets)
+            current_entry = line
+            entry_bullets = []
+    flush_entry(current_entry or "", entry_bullets)
+    return entries
+
+
+def analyze_section(header: str, body: str, bullets: list[str] | None = None,
+                    counter: PrintedLines | None = None) -> dict:
+    """
+    Stats for one section. With a `counter`, line counts are the real printed
+    lines from the PDF; without one they are CHARS_PER_LINE estimates.
+    """
+    lines_of = counter.lines if counter else line_estimate
+
+    if header in ("SUMMARY",):
+        return {"name": header, "kind": "summary", "words": count_words(body), "lines": lines_of(body)}
+
+    if header in ("SKILLS", "TECHNICAL SKILLS"):
+        rows = [l.strip() for l in body.splitlines() if l.strip()]
+        return {
+            "name": header,
+            "kind": "skills",
+            "rows": [
+                {"text": row, "items": len(re.split(r"[|,]", row)), "lines": lines_of(row)}
+                for row in rows
+            ],
+        }
+
+    if bullets is None:
+        bullets = split_bullets(body)
+
+    if header in ITEM_SECTIONS:
+        return {"name": header, "kind": "items", "items": [bullet_stats(b, counter) for b in bullets]}
+
+    # PROJECTS, EXPERIENCE, WORK EXPERIENCE
+    section_start = counter.cursor if counter else 0
+    stats = [bullet_stats(b, counter) for b in bullets]
+    if counter:
+        # The entry grouping below walks the same text again
+        counter.cursor = section_start
+    return {
+        "name": header,
+        "kind": "entries",
+        "bullets": stats,
+        "lines": sum(b["lines"] for b in stats),
+        "entries": group_entries(body, counter),
+    }
+
+
+def analyze_pdf(pdf_path: Path, data: bytes | None = None, use_cache: bool = True) -> dict:
+    """
+    Everything the report shows for one resume PDF, as plain data.
+    Pass `data` to analyse an in-memory PDF; `pdf_path` then only names it.
+    """
+    if data is not None:
+        extraction = extract_pdf(data)
+    elif use_cache:
+        extraction = cached_extract(pdf_path)
+    else:
+        extraction = extract_pdf(pdf_path)
+
+    pages  = extraction["pages"]
+    full   = "\n".join(extraction["texts"])
+    total_words = count_words(full)
+    counter = PrintedLines(extraction["runs"])
+    sections = [analyze_section(h, b, bullets, counter) for h, b, bullets in extraction["sections"]]
+
+    return {
+        "file": pdf_path.name,
+        "path": str(pdf_path),
+        "pages": pages,
+        "words": total_words,
+        "sections": sections,
+        "total_bullets": sum(
+            len(s["items"] if s["kind"] == "items" else s["bullets"])
+            for s in sections if s["kind"] in ("items", "entries")
+        ),
+        "issues": verdict_issues(pages, total_words),
+        "preview": "" if sections else full[:400],
+    }
+
+
 # ── Main report ───────────────────────────────────────────────────────────────
 
-def print_report(pdf_path: Path):
+def print_analysis(analysis: dict):
     print(f"\n{HR}")
-    print(f"  {pdf_path.name}")
+    print(f"  {analysis['file']}")
     print(HR)
 
-    reader = load_pdf(pdf_path)
-    pages  = page_count(reader)
-    texts  = extract_text_by_page(reader)
-    full   = "\n".join(texts)
+    pages = analysis["pages"]
+    total_words = analysis["words"]
+    sections = analysis["sections"]
 
     # ── Page count
     pf = page_flag(pages)
@@ -133,102 +404,60 @@ def print_report(pdf_path: Path):
         print(f"       ❌ OVERFLOW — resume is {pages} pages. Trim content or tighten spacing.")
 
     # ── Word count
-    total_words = count_words(full)
     wf = word_flag(total_words)
     print(f"  {wf} Total words     : {total_words}  (sweet spot 1050–1400)")
 
     # ── Sections
-    sections = split_into_sections(full)
-
     if not sections:
         print("\n  ⚠️  Could not detect section headers in PDF text.")
         print("  Raw text preview:")
-        print("  " + full[:400].replace("\n", "\n  "))
+        print("  " + analysis["preview"].replace("\n", "\n  "))
         print(f"\n{HR}\n")
         return
 
     print(f"\n  SECTIONS  ({len(sections)} found)")
     print(f"  {'─'*58}")
 
-    total_bullets = 0
-
-    for header, body in sections:
+    for section in sections:
+        header = section["name"]
 
-        if header in ("SUMMARY",):
-            w = count_words(body)
-            lines = line_estimate(body)
+        if section["kind"] == "summary":
+            w = section["words"]
             wf2 = OK if 30 <= w <= 65 else W
-            print(f"\n  {wf2} {header:<24} {w} words  (~{lines:.1f} lines)")
-
-        elif header in ("SKILLS", "TECHNICAL SKILLS"):
-            rows = [l.strip() for l in body.splitlines() if l.strip()]
-            print(f"\n  📋 {header:<24} {len(rows)} rows")
-            for row in rows:
-                items = len(re.split(r"[|,]", row))
-                lines = line_estimate(row)
-                lf = OK if lines <= 1.4 else W
-                label = row[:35] + ("…" if len(row) > 35 else "")
-                print(f"       {lf} {label:<36} {items} items  (~{lines:.1f} lines)")
-
-        elif header in ("EDUCATION", "AWARDS", "CERTIFICATIONS"):
-            bullets = split_bullets(body)
-            total_bullets += len(bullets)
-            print(f"\n  🎓 {header:<24} {len(bullets)} items")
-            for i, b in enumerate(bullets, 1):
-                w = count_words(b)
-                lines = line_estimate(b)
-                lf = bullet_line_flag(lines)
-                print(f"       {lf} item {i}: {w} words  (~{lines:.1f} lines)")
-
-        else:  # PROJECTS, EXPERIENCE, WORK EXPERIENCE
-            bullets = split_bullets(body)
-            total_bullets += len(bullets)
-            lines_total = sum(line_estimate(b) for b in bullets)
-            print(f"\n  📁 {header:<24} {len(bullets)} bullets  ~{lines_total:.1f} total lines")
-
-            # Try to group by entry (lines without bullet chars are usually titles)
-            raw_lines = [l.strip() for l in body.splitlines() if l.strip()]
-            current_entry = None
-            entry_bullets: list[str] = []
-
-            def flush_entry(title, blist):
-                if not title and not blist:
-                    return
+            print(f"\n  {wf2} {header:<24} {w} words  (~{section['lines']:.1f} lines)")
+
+        elif section["kind"] == "skills":
+            print(f"\n  📋 {header:<24} {len(section['rows'])} rows")
+            for row in section["rows"]:
+                lf = OK if row["lines"] <= 1.4 else W
+                text = row["text"]
+                label = text[:35] + ("…" if len(text) > 35 else "")
+                print(f"       {lf} {label:<36} {row['items']} items  (~{row['lines']:.1f} lines)")
+
+        elif section["kind"] == "items":
+            print(f"\n  🎓 {header:<24} {len(section['items'])} items")
+            for i, b in enumerate(section["items"], 1):
+                lf = bullet_line_flag(b["lines"])
+                print(f"       {lf} item {i}: {b['words']} words  (~{b['lines']:.1f} lines)")
+
+        else:  # entries
+            print(f"\n  📁 {header:<24} {len(section['bullets'])} bullets  ~{section['lines']:.1f} total lines")
+            for entry in section["entries"]:
+                title = entry["title"]
                 short = (title or "—")[:50] + ("…" if len(title or "") > 50 else "")
-                nb = len(blist)
-                el = sum(line_estimate(b) for b in blist)
-                print(f"       📝 {short:<51} {nb}b  ~{el:.1f} lines")
-                for j, b in enumerate(blist, 1):
-                    w = count_words(b)
-                    lines = line_estimate(b)
-                    lf = bullet_line_flag(lines)
-                    short_b = b[:70] + ("…" if len(b) > 70 else "")
-                    print(f"            {lf} b{j}: {w}w  ~{lines:.1f}L  \"{short_b}\"")
-
-            for line in raw_lines:
-                is_bullet = bool(re.match(r"^[●•◆▸\-]", line))
-                if is_bullet:
-                    entry_bullets.append(re.sub(r"^[●•◆▸\-]\s*", "", line).strip())
-                else:
-                    # New entry title — flush previous
-                    if current_entry is not None or entry_bullets:
-                        flush_entry(current_entry or "", entry_bullets)
-                    current_entry = line
-                    entry_bullets = []
-            flush_entry(current_entry or "", entry_bullets)
+                print(f"       📝 {short:<51} {len(entry['bullets'])}b  ~{entry['lines']:.1f} lines")
+                for j, b in enumerate(entry["bullets"], 1):
+                    lf = bullet_line_flag(b["lines"])
+                    text = b["text"]
+                    short_b = text[:70] + ("…" if len(text) > 70 else "")
+                    print(f"            {lf} b{j}: {b['words']}w  ~{b['lines']:.1f}L  \"{short_b}\"")
 
     print(f"\n  {'─'*58}")
-    print(f"  📌 Total bullets (excl. skills/summary): {total_bullets}")
+    print(f"  📌 Total bullets (excl. skills/summary): {analysis['total_bullets']}")
 
     # ── Final verdict
     print(f"\n  VERDICT")
-    issues = []
-    if pages > 1:
-        issues.append(f"❌ {pages} pages — needs trimming")
-    if total_words > 1400:
-        issues.append(f"⚠️  Word count {total_words} is high")
-    if total_words < 800:
-        issues.append(f"⚠️  Word count {total_words} is low — resume may be sparse")
+    issues = analysis["issues"]
 
     if issues:
         for iss in issues:
@@ -239,27 +468,190 @@ def print_report(pdf_path: Path):
     print(f"\n{HR}\n")
 
 
-def main():
+def print_report(pdf_path: Path, data: bytes | None = None) -> list[str]:
+    """
+    Print the full report for one resume PDF and return its verdict issues
+    (an empty list means it passed). Pass `data` to analyse an in-memory PDF;
+    `pdf_path` is then only used for the heading.
+    """
+    analysis = analyze_pdf(pdf_path, data)
+    print_analysis(analysis)
+    return analysis["issues"]
+
+
+# ── Batch analysis ────────────────────────────────────────────────────────────
+
+def analyze_or_error(pdf_path: Path, use_cache: bool = True) -> dict:
+    try:
+        return analyze_pdf(pdf_path, use_cache=use_cache)
+    except Exception as exc:
+        return {"file": pdf_path.name, "path": str(pdf_path), "error": f"{type(exc).__name__}: {exc}"}
+
+
+def analyze_many(paths: list[Path], jobs: int = 1, use_cache: bool = True,
+                 ordered: bool = True, capture_errors: bool = False):
+    """
+    Yield analyses using `jobs` worker processes, in the order of `paths`
+    (or as each one finishes when `ordered` is False). With `capture_errors`
+    a PDF that cannot be analysed yields an {"error": ...} record instead of raising.
+    """
+    analyze = partial(analyze_or_error if capture_errors else analyze_pdf, use_cache=use_cache)
+    if jobs <= 1 or len(paths) <= 1:
+        yield from map(analyze, paths)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    with ProcessPoolExecutor(max_workers=min(jobs, len(paths))) as pool:
+        if ordered:
+            # map() yields in submission order, so the reports stay stable.
+            yield from pool.map(analyze, paths, chunksize=4)
+        else:
+            for future in as_completed([pool.submit(analyze, p) for p in paths]):
+                yield future.result()
+
+
+# ── NDJSON output ─────────────────────────────────────────────────────────────
+
+FLAG_NAMES = {OK: "ok", TI: "borderline", W: "warn", "❌": "fail"}
+
+
+def analysis_record(analysis: dict) -> dict:
+    """A JSON-ready copy of an analysis with each report flag named in plain words."""
+    if "error" in analysis:
+        return analysis
+
+    sections = []
+    for section in analysis["sections"]:
+        section = dict(section)
+        if section["kind"] == "summary":
+            section["flag"] = FLAG_NAMES[OK if 30 <= section["words"] <= 65 else W]
+        elif section["kind"] == "skills":
+            section["rows"] = [dict(r, flag=FLAG_NAMES[OK if r["lines"] <= 1.4 else W]) for r in section["rows"]]
+        elif section["kind"] == "items":
+            section["items"] = [dict(b, flag=FLAG_NAMES[bullet_line_flag(b["lines"])]) for b in section["items"]]
+        else:
+            section["bullets"] = [dict(b, flag=FLAG_NAMES[bullet_line_flag(b["lines"])]) for b in section["bullets"]]
+            section["entries"] = [
+                dict(e, bullets=[dict(b, flag=FLAG_NAMES[bullet_line_flag(b["lines"])]) for b in e["bullets"]])
+                for e in section["entries"]
+            ]
+        sections.append(section)
+
+    issues = [re.sub(r"^\W+", "", iss) for iss in analysis["issues"]]
+    return dict(
+        analysis,
+        sections=sections,
+        flags={
+            "pages": FLAG_NAMES[page_flag(analysis["pages"])],
+            "words": FLAG_NAMES[word_flag(analysis["words"])],
+        },
+        issues=issues,
+        verdict="fail" if issues else "pass",
+    )
+
+
+def write_ndjson(analyses, out=None) -> int:
+    """Write one JSON object per line, flushing after each so readers can stream."""
+    out = out or sys.stdout
+    failed = 0
+    for analysis in analyses:
+        record = analysis_record(analysis)
+        failed += record.get("verdict") != "pass"
+        out.write(json.dumps(record) + "\n")
+        out.flush()
+    return failed
+
+
+def iter_bullets(analysis: dict):
+    for section in analysis["sections"]:
+        if section["kind"] == "entries":
+            yield from (b for b in section["bullets"] if b["text"])
+
+
+def print_summary(analyses: list[dict], top: int = 5):
+    print(f"{HR}")
+    print(f"  SUMMARY  ({len(analyses)} PDFs)")
+    print(HR)
+
+    overflowed = [a for a in analyses if a["pages"] > 1]
+    flag = OK if not overflowed else "❌"
+    print(f"\n  {flag} Overflowed      : {len(overflowed)}")
+    for a in overflowed:
+        print(f"       ❌ {a['file']}  ({a['pages']} pages)")
+
+    words = sorted(a["words"] for a in analyses)
+    median = words[len(words) // 2] if len(words) % 2 else (words[len(words) // 2 - 1] + words[len(words) // 2]) / 2
+    print(f"\n  WORD COUNTS  min {words[0]}  median {median:g}  max {words[-1]}")
+    buckets = [
+        ("< 800", 0, 799),
+        ("800–1049", 800, 1049),
+        ("1050–1400", 1050, 1400),
+        ("1401–1600", 1401, 1600),
+        ("> 1600", 1601, float("inf")),
+    ]
+    for label, lo, hi in buckets:
+        count = sum(1 for n in words if lo <= n <= hi)
+        print(f"       {word_flag(lo)} {label:<10} {count:>4}  {'█' * count}")
+
+    longest = sorted(
+        ((b, a["file"]) for a in analyses for b in iter_bullets(a)),
+        key=lambda pair: pair[0]["lines"],
+        reverse=True,
+    )[:top]
+    if longest:
+        print(f"\n  LONGEST BULLETS")
+        for b, name in longest:
+            lf = bullet_line_flag(b["lines"])
+            short_b = b["text"][:60] + ("…" if len(b["text"]) > 60 else "")
+            print(f"       {lf} ~{b['lines']:.1f}L  {b['words']}w  {name}")
+            print(f"            \"{short_b}\"")
+
+    print(f"\n{HR}\n")
+
+
+def main(argv: list[str] | None = None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Report page count, sections, bullets and word counts for resume PDFs.")
+    parser.add_argument("pdfs", nargs="*", help="PDF paths (default: all Resume/To_Apply/*.pdf)")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="Analyse PDFs in N worker processes")
+    parser.add_argument("--no-cache", action="store_true", help="Re-extract text instead of using the extraction cache")
+    parser.add_argument("--format", choices=("text", "ndjson"), default="text",
+                        help="text report (default) or one JSON record per PDF, streamed as each finishes")
+    args = parser.parse_args(argv)
+    # Keep stdout machine-readable in ndjson mode
+    notices = sys.stderr if args.format == "ndjson" else sys.stdout
+
     targets: list[Path] = []
 
-    if len(sys.argv) > 1:
-        for arg in sys.argv[1:]:
+    if args.pdfs:
+        for arg in args.pdfs:
             p = Path(arg)
             if not p.is_absolute():
                 p = BASE_DIR / p
             if p.exists():
                 targets.append(p)
             else:
-                print(f"Not found: {p}")
+                print(f"Not found: {p}", file=notices)
     else:
         targets = sorted(TO_APPLY.glob("*.pdf"))
 
     if not targets:
-        print(f"No PDFs found in {TO_APPLY}")
+        print(f"No PDFs found in {TO_APPLY}", file=notices)
         sys.exit(1)
 
-    for t in targets:
-        print_report(t)
+    if args.format == "ndjson":
+        analyses = analyze_many(targets, args.jobs, use_cache=not args.no_cache,
+                                ordered=False, capture_errors=True)
+        sys.exit(1 if write_ndjson(analyses) else 0)
+
+    analyses = []
+    for analysis in analyze_many(targets, args.jobs, use_cache=not args.no_cache):
+        print_analysis(analysis)
+        analyses.append(analysis)
+
+    if len(analyses) > 1:
+        print_summary(analyses)
 
 
 if __name__ == "__main__":
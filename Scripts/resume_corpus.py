@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+resume_corpus.py — Reuse analytics across submitted resumes
+Indexes every resume in Resume/Applied/ (HTML preferred, PDF otherwise) into
+normalized bullets, skills rows and project titles, using the same section and
+bullet splitting as resume_check.py, and answers reuse questions from the index.
+
+Usage:
+    python Scripts/resume_corpus.py build                  # (re)index changed files
+    python Scripts/resume_corpus.py query SiliconCrew      # variants + where they were sent
+    python Scripts/resume_corpus.py query "mcp server" --kind bullet
+    python Scripts/resume_corpus.py top --kind skills      # most reused items
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import re
+import sqlite3
+from contextlib import closing
+from html.parser import HTMLParser
+from pathlib import Path
+
+import resume_check
+from resume_check import BASE_DIR, HR
+
+APPLIED_DIR = BASE_DIR / "Resume" / "Applied"
+INDEX_PATH = BASE_DIR / "Resume" / ".resume_corpus.sqlite"
+INDEX_VERSION = 1   # bump when item extraction or normalization changes
+
+KINDS = ("summary", "skills", "title", "bullet")
+SKILLS_SECTIONS = ("SKILLS", "TECHNICAL SKILLS")
+
+# ── HTML → report-style text ─────────────────────────────────────────────────
+
+BLOCK_TAGS = {"div", "p", "h1", "h2", "h3", "h4", "li", "ul", "tr", "section", "br"}
+VOID_TAGS = {"br", "meta", "link", "img", "hr", "input"}
+SKIP_TAGS = {"style", "script", "title", "head"}
+INLINE_ROWS = {"entry-header", "entry-subtitle"}   # title/date pairs stay on one line
+SKIP_CLASSES = {"entry-date", "entry-location"}     # dates and places are not reusable content
+
+
+class _ResumeText(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.out: list[str] = []
+        self.stack: list[tuple[str, bool, bool]] = []   # (tag, skip, inline)
+
+    def handle_starttag(self, tag, attrs):
+        classes = set((dict(attrs).get("class") or "").split())
+        skip = bool(self.stack and self.stack[-1][1]) or tag in SKIP_TAGS or bool(classes & SKIP_CLASSES)
+        inline = bool(self.stack and self.stack[-1][2])
+        if tag in BLOCK_TAGS and not skip:
+            self.out.append(" " if inline else "\n")
+            if "bullet-item" in classes:
+                self.out.append("● ")
+        if tag not in VOID_TAGS:
+            self.stack.append((tag, skip, inline or bool(classes & INLINE_ROWS)))
+
+    def handle_endtag(self, tag):
+        for i in range(len(self.stack) - 1, -1, -1):
+            if self.stack[i][0] == tag:
+                del self.stack[i:]
+                break
+        if tag in BLOCK_TAGS and not (self.stack and self.stack[-1][1]):
+            self.out.append(" " if self.stack and self.stack[-1][2] else "\n")
+
+    def handle_data(self, data):
+        if not (self.stack and self.stack[-1][1]):
+            self.out.append(data)
+
+
+def html_to_text(html: str) -> str:
+    """
+    Render resume HTML as the line-oriented text resume_check expects from a
+    PDF: one line per block, section titles on their own line, bullets
+    prefixed with '●'.
+    """
+    parser = _ResumeText()
+    parser.feed(html)
+    parser.close()
+    lines = (" ".join(l.split()) for l in "".join(parser.out).splitlines())
+    return "\n".join(l for l in lines if l)
+
+
+def extract_html(path: Path) -> list[list]:
+    text = html_to_text(path.read_text(encoding="utf-8", errors="replace"))
+    return [[h, b, resume_check.split_bullets(b)] for h, b in resume_check.split_into_sections(text)]
+
+
+# ── Item extraction ──────────────────────────────────────────────────────────
+
+def normalize(text: str) -> str:
+    return " ".join(re.findall(r"[a-z0-9]+", text.lower()))
+
+
+def document_items(sections: list[list]) -> list[tuple[str, str, str]]:
+    """[(section, kind, text), ...] for the reusable pieces of one resume."""
+    items = []
+    for header, body, bullets in sections:
+        if header == "SUMMARY":
+            items.append((header, "summary", " ".join(body.split())))
+        elif header in SKILLS_SECTIONS:
+            items.extend((header, "skills", row.strip()) for row in body.splitlines() if row.strip())
+        else:
+            entries = resume_check.group_entries(body)
+            if any(e["bullets"] for e in entries):
+                for entry in entries:
+                    if entry["bullets"] and entry["title"]:
+                        items.append((header, "title", entry["title"]))
+                    items.extend((header, "bullet", b["text"]) for b in entry["bullets"])
+            else:
+                # PDF text without bullet glyphs: keep the joined bullet splits
+                items.extend((header, "bullet", b) for b in bullets)
+    return [(h, k, t) for h, k, t in items if normalize(t)]
+
+
+def corpus_files(dirs: list[Path]) -> dict[str, Path]:
+    """One file per resume slug; the HTML wins over its exported PDF."""
+    files: dict[str, Path] = {}
+    for d in dirs:
+        for path in sorted(d.glob("resume_*.pdf")) + sorted(d.glob("resume_*.html")):
+            files[path.stem.removeprefix("resume_")] = path
+    return files
+
+
+# ── Index ────────────────────────────────────────────────────────────────────
+
+def open_index() -> sqlite3.Connection:
+    conn = sqlite3.connect(str(INDEX_PATH), timeout=30)
+    conn.execute("PRAGMA foreign_keys = ON")
+    if conn.execute("PRAGMA user_version").fetchone()[0] != INDEX_VERSION:
+        with conn:
+            conn.executescript("DROP TABLE IF EXISTS postings; DROP TABLE IF EXISTS items; DROP TABLE IF EXISTS documents;")
+            conn.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS documents (
+            id INTEGER PRIMARY KEY, slug TEXT UNIQUE NOT NULL,
+            path TEXT NOT NULL, digest TEXT NOT NULL);
+        CREATE TABLE IF NOT EXISTS items (
+            id INTEGER PRIMARY KEY,
+            doc_id INTEGER NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
+            section TEXT NOT NULL, kind TEXT NOT NULL, position INTEGER NOT NULL,
+            text TEXT NOT NULL, norm TEXT NOT NULL);
+        CREATE INDEX IF NOT EXISTS items_norm ON items(kind, norm);
+        CREATE TABLE IF NOT EXISTS postings (
+            term TEXT NOT NULL,
+            item_id INTEGER NOT NULL REFERENCES items(id) ON DELETE CASCADE,
+            PRIMARY KEY (term, item_id)) WITHOUT ROWID;
+    """)
+    return conn
+
+
+def build_index(dirs: list[Path]) -> tuple[int, int, int]:
+    """Index new or changed resumes and drop vanished ones. Returns (indexed, unchanged, removed)."""
+    files = corpus_files(dirs)
+    indexed = unchanged = 0
+    with closing(open_index()) as conn, conn:
+        known = dict(conn.execute("SELECT slug, digest FROM documents"))
+        stale = set(known) - set(files)
+        conn.executemany("DELETE FROM documents WHERE slug = ?", [(s,) for s in stale])
+
+        for slug, path in files.items():
+            digest = hashlib.sha256(path.read_bytes()).hexdigest()
+            if known.get(slug) == digest:
+                unchanged += 1
+                continue
+            if path.suffix == ".html":
+                sections = extract_html(path)
+            else:
+                sections = resume_check.cached_extract(path)["sections"]
+
+            conn.execute("DELETE FROM documents WHERE slug = ?", (slug,))
+            doc_id = conn.execute(
+                "INSERT INTO documents (slug, path, digest) VALUES (?, ?, ?)",
+                (slug, str(path.relative_to(BASE_DIR)), digest),
+            ).lastrowid
+            for position, (section, kind, text) in enumerate(document_items(sections)):
+                norm = normalize(text)
+                item_id = conn.execute(
+                    "INSERT INTO items (doc_id, section, kind, position, text, norm) VALUES (?, ?, ?, ?, ?, ?)",
+                    (doc_id, section, kind, position, text, norm),
+                ).lastrowid
+                conn.executemany("INSERT OR IGNORE INTO postings VALUES (?, ?)",
+                                 [(term, item_id) for term in set(norm.split())])
+            indexed += 1
+    return indexed, unchanged, len(stale)
+
+
+def variants(conn: sqlite3.Connection, where: str, params: list, limit: int) -> list[tuple]:
+    """Distinct normalized items matching `where`, most widely sent first."""
+    return conn.execute(f"""
+        SELECT i.kind, i.section, MIN(i.text), COUNT(DISTINCT i.doc_id),
+               GROUP_CONCAT(DISTINCT d.slug)
+        FROM items i JOIN documents d ON d.id = i.doc_id
+        WHERE {where}
+        GROUP BY i.kind, i.norm
+        ORDER BY COUNT(DISTINCT i.doc_id) DESC, MIN(i.text)
+        LIMIT ?
+    """, [*params, limit]).fetchall()
+
+
+def query_items(terms: str, kind: str | None = None, limit: int = 50) -> list[tuple]:
+    words = sorted(set(normalize(terms).split()))
+    if not words:
+        return []
+    marks = ",".join("?" * len(words))
+    where = (f"i.id IN (SELECT item_id FROM postings WHERE term IN ({marks}) "
+             f"GROUP BY item_id HAVING COUNT(*) = ?)")
+    params: list = [*words, len(words)]
+    if kind:
+        where += " AND i.kind = ?"
+        params.append(kind)
+    with closing(open_index()) as conn:
+        return variants(conn, where, params, limit)
+
+
+def top_items(kind: str | None = None, limit: int = 20) -> list[tuple]:
+    with closing(open_index()) as conn:
+        return variants(conn, "i.kind = ?" if kind else "1", [kind] if kind else [], limit)
+
+
+# ── Output ───────────────────────────────────────────────────────────────────
+
+def print_variants(title: str, rows: list[tuple], total_docs: int):
+    print(f"\n{HR}")
+    print(f"  {title}")
+    print(HR)
+    if not rows:
+        print("\n  No matching items.")
+    for kind, section, text, count, slugs in rows:
+        short = text[:110] + ("…" if len(text) > 110 else "")
+        print(f"\n  [{count}/{total_docs} resumes] {section} · {kind}")
+        print(f"    \"{short}\"")
+        print(f"    sent to: {', '.join(sorted(slugs.split(',')))}")
+    print(f"\n{HR}\n")
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Bullet, skills-row and project-title reuse across submitted resumes.")
+    parser.add_argument("--dir", action="append", type=Path,
+                        help="Resume folder to index (repeatable; default Resume/Applied)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("build", help="Index new or changed resumes")
+    q = sub.add_parser("query", help="Variants of items containing every query word")
+    q.add_argument("terms", nargs="+")
+    t = sub.add_parser("top", help="Most reused items")
+    for p in (q, t):
+        p.add_argument("--kind", choices=KINDS)
+        p.add_argument("-n", "--limit", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    dirs = [d if d.is_absolute() else BASE_DIR / d for d in (args.dir or [APPLIED_DIR])]
+    indexed, unchanged, removed = build_index(dirs)
+    if args.command == "build":
+        print(f"Indexed {indexed}, unchanged {unchanged}, removed {removed}  →  {INDEX_PATH.relative_to(BASE_DIR)}")
+        return
+
+    with closing(open_index()) as conn:
+        total_docs = conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+    if args.command == "query":
+        terms = " ".join(args.terms)
+        rows = query_items(terms, args.kind, args.limit)
+        print_variants(f"'{terms}' — {len(rows)} variants", rows, total_docs)
+    else:
+        rows = top_items(args.kind, args.limit)
+        print_variants(f"Most reused {args.kind or 'items'}", rows, total_docs)
+
+
+if __name__ == "__main__":
+    main()
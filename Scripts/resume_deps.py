@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+resume_deps.py — Which drafts a base resume edit reaches, and selective rebuild
+Links every draft in Resume/Drafts/ to its Master_Resume/current/ base and to
+the base blocks (each rule of the inline stylesheet, the header, each section)
+it still carries unchanged. When a base is edited, only drafts sharing an
+edited block are affected: `rebuild` lists them, and with --propagate copies
+the fixed blocks into them and re-renders just those. Drafts that rewrote an
+edited block are skipped and reported.
+
+A draft's base is, in order: set with `link`, the "Base:" note written by
+create_jd_resume.py, or the closest base by vocabulary (see resume_diff.py).
+The graph and the base block hashes the drafts were last reconciled with are
+kept in Resume/.resume_deps.json.
+
+Usage:
+    python Scripts/resume_deps.py                                # graph and pending base edits
+    python Scripts/resume_deps.py rebuild                        # list drafts affected by base edits
+    python Scripts/resume_deps.py rebuild --propagate            # copy the base fix in, then re-render
+    python Scripts/resume_deps.py rebuild --propagate --dry-run
+    python Scripts/resume_deps.py link xai-grok-engineer ai_engineer
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+import html_to_pdf
+import resume_diff
+import resume_model
+from html_to_pdf import DRAFTS_DIR, normalize_resume_name
+from resume_check import BASE_DIR, HR
+
+MASTER_DIR = resume_diff.MASTER_DIR
+GRAPH_PATH = BASE_DIR / "Resume" / ".resume_deps.json"
+GRAPH_VERSION = 1   # bump when block splitting or hashing changes
+
+STYLE_RE = re.compile(r"<style>(.*?)</style>", re.DOTALL)   # the base stylesheet, not <style id="autofit">
+BASE_NOTE_RE = re.compile(r"Base:\s*resume_([\w.-]+?)\.html")
+
+# ── Blocks ───────────────────────────────────────────────────────────────────
+
+def css_rule_spans(text: str, start: int, end: int) -> dict[str, tuple[int, int]]:
+    """{"css <selector>": span} for each top-level rule (or @media block) in text[start:end]."""
+    spans = {}
+    depth, rule_start = 0, None
+    for i in range(start, end):
+        char = text[i]
+        if rule_start is None and not char.isspace():
+            rule_start = i
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0 and rule_start is not None:
+                selector = " ".join(text[rule_start:text.index("{", rule_start)].split())
+                name, n = f"css {selector}", 2
+                while name in spans:   # a selector repeated in the sheet
+                    name, n = f"css {selector} #{n}", n + 1
+                spans[name] = (rule_start, i + 1)
+                rule_start = None
+    return spans
+
+
+def block_spans(text: str) -> dict[str, tuple[int, int]]:
+    """
+    {block: (start, end)}: every rule of the base stylesheet (drafts tighten a
+    few rules, so the sheet as a whole is rarely shared), the header div and
+    each section div.
+    """
+    spans = {}
+    style = STYLE_RE.search(text)
+    if style:
+        spans.update(css_rule_spans(text, *style.span(1)))
+    for _, start, end in resume_model.elements(text, "header"):
+        spans["header"] = (start, end)
+    for _, start, end in resume_model.elements(text, "section"):
+        title = resume_model.SECTION_TITLE_RE.search(text, start, end)
+        spans[resume_model.plain(title.group(2)).upper() if title else f"section@{start}"] = (start, end)
+    return spans
+
+
+def block_hashes(text: str) -> dict[str, str]:
+    return {name: hashlib.sha256(text[start:end].encode()).hexdigest()[:16]
+            for name, (start, end) in block_spans(text).items()}
+
+
+def base_path(base: str) -> Path:
+    return MASTER_DIR / f"resume_{base}.html"
+
+
+def base_names() -> list[str]:
+    return [p.stem.removeprefix("resume_") for p in sorted(MASTER_DIR.glob("resume_*.html"))]
+
+
+# ── Graph ────────────────────────────────────────────────────────────────────
+# {"version", "bases": {base: {block: hash at last reconcile}},
+#  "drafts": {draft stem: {"base", "source", "shared": [blocks equal to the base's]}}}
+
+def load_graph() -> dict:
+    try:
+        graph = json.loads(GRAPH_PATH.read_text(encoding="utf-8"))
+        if graph.get("version") == GRAPH_VERSION:
+            return graph
+    except (FileNotFoundError, ValueError):
+        pass
+    return {"version": GRAPH_VERSION, "bases": {}, "drafts": {}}
+
+
+def save_graph(graph: dict) -> None:
+    tmp_path = GRAPH_PATH.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(graph, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    tmp_path.replace(GRAPH_PATH)
+
+
+def refresh_graph(graph: dict) -> dict:
+    """Add new drafts and bases, drop vanished ones, recompute every draft's shared blocks."""
+    bases = base_names()
+    for base in bases:
+        # A base seen for the first time is its own baseline
+        graph["bases"].setdefault(base, block_hashes(base_path(base).read_text(encoding="utf-8")))
+    graph["bases"] = {b: h for b, h in graph["bases"].items() if b in bases}
+
+    models = None
+    drafts = {}
+    for stem in html_to_pdf.draft_names():
+        path = DRAFTS_DIR / f"{stem}.html"
+        text = path.read_text(encoding="utf-8")
+        entry = graph["drafts"].get(stem, {})
+        note = BASE_NOTE_RE.search(text)
+        if entry.get("source") == "linked" and entry.get("base") in bases:
+            base, source = entry["base"], "linked"
+        elif note and note.group(1) in bases:
+            base, source = note.group(1), "recorded"
+        elif entry.get("base") in bases:
+            base, source = entry["base"], entry["source"]
+        else:
+            models = models or resume_diff.load_bases()
+            base, source = resume_diff.closest_base(resume_diff.parse_resume(path), models), "inferred"
+        snapshot = graph["bases"][base]
+        shared = [name for name, digest in block_hashes(text).items() if snapshot.get(name) == digest]
+        drafts[stem] = {"base": base, "source": source, "shared": shared}
+    graph["drafts"] = drafts
+    return graph
+
+
+def edited_blocks(graph: dict) -> dict[str, tuple[dict[str, str], list[str]]]:
+    """{base: (current block hashes, blocks edited since the drafts were reconciled)} for edited bases."""
+    edited = {}
+    for base, snapshot in graph["bases"].items():
+        current = block_hashes(base_path(base).read_text(encoding="utf-8"))
+        changed = [name for name in {**snapshot, **current} if snapshot.get(name) != current.get(name)]
+        if changed:
+            edited[base] = (current, changed)
+    return edited
+
+
+# ── Plan and rebuild ─────────────────────────────────────────────────────────
+
+class Decision(NamedTuple):
+    draft: str
+    base: str
+    blocks: list[str]   # edited base blocks this draft shares (to propagate)
+    kept: str           # why the other edited blocks are left alone
+
+
+def plan(graph: dict, edited: dict) -> list[Decision]:
+    decisions = []
+    for stem, entry in sorted(graph["drafts"].items()):
+        if entry["base"] not in edited:
+            continue
+        current, changed = edited[entry["base"]]
+        hits = [name for name in changed if name in entry["shared"] and name in current]
+        rest = [name for name in changed if name not in hits]
+        draft_hashes = block_hashes((DRAFTS_DIR / f"{stem}.html").read_text(encoding="utf-8"))
+        has_fix = [n for n in rest if n in current and draft_hashes.get(n) == current[n]]
+        own = [n for n in rest if n in draft_hashes and n not in has_fix]
+        unused = [n for n in rest if n not in draft_hashes]
+        kept = "; ".join(f"{label} {', '.join(names)}" for label, names in (
+            ("own copy of", own), ("already has the new", has_fix), ("does not use", unused)) if names)
+        decisions.append(Decision(stem, entry["base"], hits, kept))
+    return decisions
+
+
+def propagate(stem: str, base: str, blocks: list[str]) -> None:
+    """Replace the draft's copies of `blocks` with the base's current text."""
+    path = DRAFTS_DIR / f"{stem}.html"
+    text = path.read_text(encoding="utf-8")
+    base_text = base_path(base).read_text(encoding="utf-8")
+    spans, base_spans = block_spans(text), block_spans(base_text)
+    for name in sorted(blocks, key=lambda n: spans[n][0], reverse=True):   # back to front keeps offsets valid
+        start, end = spans[name]
+        new_start, new_end = base_spans[name]
+        text = text[:start] + base_text[new_start:new_end] + text[end:]
+    path.write_text(text, encoding="utf-8")
+
+
+def rebuild(graph: dict, propagate_fix: bool, dry_run: bool, workers: int | None) -> int:
+    edited = edited_blocks(graph)
+    decisions = plan(graph, edited)
+    affected = [d for d in decisions if d.blocks]
+
+    print(f"\n{HR}")
+    print(f"  Rebuild after base edits  ({len(affected)} affected, {len(decisions) - len(affected)} skipped)")
+    print(HR)
+    if not edited:
+        print("\n  ✅ No base changed since the drafts were last reconciled.")
+    for d in decisions:
+        if d.blocks:
+            verb = ("would propagate" if dry_run else "propagate") if propagate_fix else "needs"
+            print(f"  🔁 {d.draft:<48} {verb} {', '.join(d.blocks)}")
+            if d.kept:
+                print(f"     {'':<48} keeps {d.kept}")
+        else:
+            print(f"  ⏭️  {d.draft:<48} skipped: {d.kept}")
+    # An edit no draft shares has nothing to propagate: it is reconciled as it stands
+    settled = [base for base in edited if not any(d.base == base for d in affected)]
+    for base in settled:
+        print(f"  ✅ resume_{base}.html: no draft shares the edit; {'would mark' if dry_run else 'marked'} it reconciled")
+        if not dry_run:
+            graph["bases"][base] = edited[base][0]
+    if settled and not dry_run:
+        refresh_graph(graph)
+    print()
+    if not affected:
+        return 0
+    if not propagate_fix:
+        # Their HTML still holds the old blocks, so re-rendering would reproduce the same PDFs
+        print("Nothing rendered: these drafts still carry the old blocks. Run with --propagate to copy the base fix in.")
+        return 0
+    if dry_run:
+        print(f"Would re-render {len(affected)} drafts.")
+        return 0
+
+    for d in affected:
+        propagate(d.draft, d.base, d.blocks)
+    for base, (current, _) in edited.items():
+        graph["bases"][base] = current   # every sharing draft now carries the edit
+    save_graph(refresh_graph(graph))
+
+    results = html_to_pdf.build_drafts([d.draft for d in affected], workers)
+    return html_to_pdf.print_batch_summary(results)
+
+
+# ── CLI ──────────────────────────────────────────────────────────────────────
+
+def describe_shared(shared: list[str], snapshot: dict[str, str]) -> str:
+    rules = sum(name.startswith("css ") for name in snapshot)
+    shared_rules = sum(name.startswith("css ") for name in shared)
+    sections = [name for name in shared if not name.startswith("css ")]
+    return f"shares {', '.join(sections) or 'no sections'} + {shared_rules}/{rules} CSS rules"
+
+
+def print_graph(graph: dict) -> None:
+    edited = edited_blocks(graph)
+    by_base: dict[str, list[str]] = {}
+    for stem, entry in sorted(graph["drafts"].items()):
+        by_base.setdefault(entry["base"], []).append(stem)
+
+    print(f"\n{HR}")
+    print(f"  Draft dependencies  ({len(graph['drafts'])} drafts, {len(graph['bases'])} bases)")
+    print(HR)
+    for base in sorted(graph["bases"]):
+        flag = f"  ✏️  edited: {', '.join(edited[base][1])}" if base in edited else ""
+        print(f"\n  resume_{base}.html{flag}")
+        for stem in by_base.get(base, []):
+            entry = graph["drafts"][stem]
+            print(f"    {stem:<50} {entry['source']:<9} {describe_shared(entry['shared'], graph['bases'][base])}")
+        if not by_base.get(base):
+            print("    (no drafts)")
+    if edited:
+        affected = sum(bool(d.blocks) for d in plan(graph, edited))
+        print(f"\n  {affected} drafts affected by base edits.  Run: python Scripts/resume_deps.py rebuild --propagate")
+    print(f"\n{HR}\n")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Track which base each draft came from and rebuild only what a base edit affects.")
+    sub = parser.add_subparsers(dest="command")
+    rebuild_cmd = sub.add_parser("rebuild", help="List drafts that share an edited base block (re-render them with --propagate)")
+    rebuild_cmd.add_argument("--propagate", action="store_true", help="Copy the edited base blocks into those drafts and re-render them")
+    rebuild_cmd.add_argument("--dry-run", action="store_true", help="Show the plan without writing anything")
+    rebuild_cmd.add_argument("-j", "--workers", type=int, default=None, help="Render worker processes")
+    link_cmd = sub.add_parser("link", help="Set a draft's base by hand")
+    link_cmd.add_argument("draft", help="Draft slug or resume_<slug>.html")
+    link_cmd.add_argument("base", help="Base slug, e.g. ai_engineer")
+    args = parser.parse_args(argv)
+
+    graph = refresh_graph(load_graph())
+
+    if args.command == "link":
+        stem, base = normalize_resume_name(args.draft), normalize_resume_name(args.base).removeprefix("resume_")
+        if stem not in graph["drafts"]:
+            print(f"❌ Not a draft: Resume/Drafts/{stem}.html", file=sys.stderr)
+            return 1
+        if base not in graph["bases"]:
+            print(f"❌ Unknown base: {base} (have {', '.join(sorted(graph['bases']))})", file=sys.stderr)
+            return 1
+        graph["drafts"][stem].update(base=base, source="linked")
+        graph = refresh_graph(graph)
+        print(f"✅ {stem} → resume_{base}.html  (shares {', '.join(graph['drafts'][stem]['shared']) or 'nothing'})")
+    elif args.command == "rebuild":
+        status = rebuild(graph, args.propagate, args.dry_run, args.workers)
+        if not args.dry_run:
+            save_graph(graph)
+        return status
+    else:
+        print_graph(graph)
+
+    save_graph(graph)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+resume_diff.py — What a tailored draft changed compared with its base
+Loads a draft and its Master_Resume/current/ base once each into the
+resume_model.py model (summary, skills rows, entries and bullets), then reports
+added, removed, retitled, reworded and moved items instead of an HTML line
+diff. The base is the closest of the four by vocabulary unless --base names one.
+
+Usage:
+    python Scripts/resume_diff.py xai-grok-engineer                  # one draft, full report
+    python Scripts/resume_diff.py xai-grok-engineer --base ai_engineer
+    python Scripts/resume_diff.py                                    # every draft, ranked by drift
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+import resume_corpus
+from html_to_pdf import DRAFTS_DIR, find_input_html
+from resume_check import HR, ITEM_SECTIONS
+from resume_model import MASTER_DIR, Entry, Resume, load, plain_text
+
+REWORD_THRESHOLD = 0.4   # word-set Jaccard above which a changed item counts as reworded
+PROJECT_NAME_RE = re.compile(r"\s+(?:—|–|\||-)\s+")
+
+
+# ── Model ────────────────────────────────────────────────────────────────────
+
+def parse_resume(path: Path) -> Resume:
+    """The resume_model.py model of `path`, with plain display text for comparing wording."""
+    return plain_text(load(path))
+
+
+def summary_of(model: Resume) -> str:
+    return " ".join(s.summary for s in model.sections if s.summary)
+
+
+def skill_rows(model: Resume) -> list[str]:
+    """One 'Label: a | b' string per skills row."""
+    return [f"{row.label}: {' | '.join(row.items)}" if row.label else " | ".join(row.items)
+            for s in model.sections for row in s.skills]
+
+
+def entries_of(model: Resume) -> list[tuple[str, Entry]]:
+    """(section title, entry) for every project / experience entry, in order."""
+    return [(s.title, e) for s in model.sections if s.title not in ITEM_SECTIONS for e in s.entries]
+
+
+def words(text: str) -> frozenset[str]:
+    return frozenset(resume_corpus.normalize(text).split())
+
+
+def similarity(a: str, b: str) -> float:
+    wa, wb = words(a), words(b)
+    return len(wa & wb) / len(wa | wb) if wa or wb else 1.0
+
+
+def project_name(title: str) -> str:
+    return resume_corpus.normalize(PROJECT_NAME_RE.split(title, maxsplit=1)[0])
+
+
+# ── Matching ─────────────────────────────────────────────────────────────────
+
+def match_items(old: list[str], new: list[str], threshold: float = REWORD_THRESHOLD,
+                key=resume_corpus.normalize) -> list[tuple[int, int, float]]:
+    """
+    Pair old and new items: identical (by `key`) first, then the most similar
+    remaining pairs above `threshold`. Returns [(old_idx, new_idx, similarity)].
+    """
+    pairs, free_old, free_new = [], set(range(len(old))), set(range(len(new)))
+    by_key: dict[str, list[int]] = {}
+    for i in range(len(old)):
+        by_key.setdefault(key(old[i]), []).append(i)
+    for j in range(len(new)):
+        candidates = [i for i in by_key.get(key(new[j]), []) if i in free_old]
+        if candidates:
+            pairs.append((candidates[0], j, 1.0))
+            free_old.discard(candidates[0])
+            free_new.discard(j)
+
+    scored = sorted(((similarity(old[i], new[j]), i, j) for i in free_old for j in free_new), reverse=True)
+    for sim, i, j in scored:
+        if sim < threshold:
+            break
+        if i in free_old and j in free_new:
+            pairs.append((i, j, sim))
+            free_old.discard(i)
+            free_new.discard(j)
+    return sorted(pairs, key=lambda p: p[1])
+
+
+def moved(pairs: list[tuple[int, int, float]]) -> set[int]:
+    """
+    New indices of matched items whose relative order changed: everything
+    outside the longest run of pairs that kept their original order.
+    """
+    olds = [i for i, _, _ in pairs]     # pairs are sorted by new index
+    best: list[list[int]] = []          # best[k]: pair positions of the longest increasing run ending at k
+    for k, i in enumerate(olds):
+        prev = max((best[m] for m in range(k) if olds[m] < i), key=len, default=[])
+        best.append(prev + [k])
+    keep = set(max(best, key=len, default=[]))
+    return {pairs[k][1] for k in range(len(pairs)) if k not in keep}
+
+
+# ── Diff ─────────────────────────────────────────────────────────────────────
+
+class Change(NamedTuple):
+    action: str     # added / removed / retitled / reworded / moved
+    where: str
+    text: str
+
+
+def entry_key(entry: Entry) -> str:
+    return resume_corpus.normalize(entry.title)
+
+
+def diff_resumes(base: Resume, draft: Resume) -> tuple[list[Change], float]:
+    """All structural changes from base to draft, plus the drift (share of items not kept verbatim)."""
+    changes: list[Change] = []
+    kept = 0
+
+    base_summary, draft_summary = summary_of(base), summary_of(draft)
+    if resume_corpus.normalize(base_summary) == resume_corpus.normalize(draft_summary):
+        kept += 1
+    elif base_summary or draft_summary:
+        delta = len(draft_summary.split()) - len(base_summary.split())
+        changes.append(Change("reworded", "SUMMARY",
+                              f"{round(100 * similarity(base_summary, draft_summary))}% similar, {delta:+d} words"))
+
+    # Skills rows
+    base_skills, draft_skills = skill_rows(base), skill_rows(draft)
+    pairs = match_items(base_skills, draft_skills, threshold=0.2)
+    shifted = moved(pairs)
+    for i, j, sim in pairs:
+        old, new = base_skills[i], draft_skills[j]
+        if sim == 1.0:
+            kept += 1
+        else:
+            added = sorted(words(new) - words(old))
+            dropped = sorted(words(old) - words(new))
+            changes.append(Change("reworded", "SKILLS",
+                                  f"{label(new)}  +[{' '.join(added)}]  −[{' '.join(dropped)}]"))
+        if j in shifted:
+            changes.append(Change("moved", "SKILLS", f"{label(new)}: row {i + 1} → {j + 1}"))
+    matched_old = {i for i, _, _ in pairs}
+    matched_new = {j for _, j, _ in pairs}
+    changes += [Change("removed", "SKILLS", row) for i, row in enumerate(base_skills) if i not in matched_old]
+    changes += [Change("added", "SKILLS", row) for j, row in enumerate(draft_skills) if j not in matched_new]
+
+    # Entries: same title, then same project name (retitled), then shared bullets
+    base_entries, draft_entries = entries_of(base), entries_of(draft)
+    pairs: list[tuple[int, int, float]] = []
+    for text_of, threshold, key in (
+        (lambda e: e.title, 1.1, resume_corpus.normalize),
+        (lambda e: e.title, 1.1, project_name),
+        (lambda e: " ".join(e.bullets), REWORD_THRESHOLD, resume_corpus.normalize),
+    ):
+        free_old = [i for i in range(len(base_entries)) if i not in {p[0] for p in pairs}]
+        free_new = [j for j in range(len(draft_entries)) if j not in {p[1] for p in pairs}]
+        found = match_items([text_of(base_entries[i][1]) for i in free_old],
+                            [text_of(draft_entries[j][1]) for j in free_new], threshold, key)
+        pairs += [(free_old[a], free_new[b], s) for a, b, s in found]
+    pairs.sort(key=lambda p: p[1])
+    shifted = moved(pairs)
+
+    for i, j, _ in pairs:
+        (old_section, old), (new_section, new) = base_entries[i], draft_entries[j]
+        where = f"{new_section} › {short(new.title, 40)}"
+        if entry_key(old) == entry_key(new):
+            kept += 1
+        else:
+            changes.append(Change("retitled", new_section, f"{short(old.title, 50)}  →  {short(new.title, 50)}"))
+        if old_section != new_section:
+            changes.append(Change("moved", where, f"{old_section} → {new_section}"))
+        elif j in shifted:
+            changes.append(Change("moved", where, f"entry {i + 1} → {j + 1}"))
+        kept += diff_bullets(old, new, where, changes)
+
+    matched_old = {i for i, _, _ in pairs}
+    matched_new = {j for _, j, _ in pairs}
+    for i, (section, e) in enumerate(base_entries):
+        if i not in matched_old:
+            changes.append(Change("removed", section, f"{short(e.title, 60)}  ({len(e.bullets)} bullets)"))
+    for j, (section, e) in enumerate(draft_entries):
+        if j not in matched_new:
+            changes.append(Change("added", section, f"{short(e.title, 60)}  ({len(e.bullets)} bullets)"))
+
+    total = max(item_count(base), item_count(draft), 1)
+    return changes, 1 - kept / total
+
+
+def diff_bullets(old: Entry, new: Entry, where: str, changes: list[Change]) -> int:
+    """Append bullet changes of one matched entry; returns the number of bullets kept verbatim."""
+    pairs = match_items(old.bullets, new.bullets)
+    shifted = moved(pairs)
+    kept = 0
+    for i, j, sim in pairs:
+        if sim == 1.0:
+            kept += 1
+        else:
+            changes.append(Change("reworded", where, f"{round(100 * sim)}%  {short(new.bullets[j], 70)}"))
+        if j in shifted:
+            changes.append(Change("moved", where, f"bullet {i + 1} → {j + 1}  {short(new.bullets[j], 50)}"))
+    matched_old = {i for i, _, _ in pairs}
+    matched_new = {j for _, j, _ in pairs}
+    changes += [Change("removed", where, short(b, 80)) for i, b in enumerate(old.bullets) if i not in matched_old]
+    changes += [Change("added", where, short(b, 80)) for j, b in enumerate(new.bullets) if j not in matched_new]
+    return kept
+
+
+def item_count(model: Resume) -> int:
+    return 1 + len(skill_rows(model)) + sum(1 + len(e.bullets) for _, e in entries_of(model))
+
+
+def label(row: str) -> str:
+    return row.split(":", 1)[0] if ":" in row[:60] else short(row, 40)
+
+
+def short(text: str, n: int) -> str:
+    return text[:n] + ("…" if len(text) > n else "")
+
+
+# ── Base selection ───────────────────────────────────────────────────────────
+
+def load_bases() -> dict[str, Resume]:
+    return {p.stem.removeprefix("resume_"): parse_resume(p) for p in sorted(MASTER_DIR.glob("resume_*.html"))}
+
+
+def vocabulary(model: Resume) -> frozenset[str]:
+    text = " ".join([summary_of(model), *skill_rows(model),
+                     *(t for _, e in entries_of(model) for t in (e.title, *e.bullets))])
+    return words(text)
+
+
+def closest_base(draft: Resume, bases: dict[str, Resume]) -> str:
+    """The base whose vocabulary overlaps the draft's most (drafts do not record their base)."""
+    vocab = vocabulary(draft)
+
+    def overlap(name: str) -> float:
+        other = vocabulary(bases[name])
+        return len(vocab & other) / len(vocab | other)
+
+    return max(bases, key=overlap)
+
+
+# ── Output ───────────────────────────────────────────────────────────────────
+
+ACTION_FLAGS = {"added": "➕", "removed": "➖", "retitled": "🏷️ ", "reworded": "✏️ ", "moved": "↕️ "}
+
+
+def print_diff(path: Path, base_name: str, changes: list[Change], drift: float):
+    print(f"\n{HR}")
+    print(f"  {path.name}  vs  resume_{base_name}.html")
+    print(HR)
+    print(f"\n  Drift: {round(100 * drift)}% of items changed  ({len(changes)} changes)")
+    if not changes:
+        print("\n  ✅ Identical structure and text.")
+    by_section: dict[str, list[Change]] = {}
+    for change in changes:
+        by_section.setdefault(change.where.split(" › ")[0], []).append(change)
+    for section, section_changes in by_section.items():
+        print(f"\n  {section}")
+        for change in section_changes:
+            where = f"[{change.where.split(' › ', 1)[1]}] " if " › " in change.where else ""
+            print(f"    {ACTION_FLAGS[change.action]} {change.action:<9} {where}{change.text}")
+    print(f"\n{HR}\n")
+
+
+def print_drift_table(rows: list[tuple[str, str, float, list[Change]]]):
+    print(f"\n{HR}")
+    print(f"  Drift from base — {len(rows)} drafts")
+    print(HR)
+    print(f"\n  {'Drift':>5}  {'+':>3} {'−':>3} {'✏':>3} {'↕':>3}  {'Base':<16} Draft")
+    for name, base_name, drift, changes in sorted(rows, key=lambda r: -r[2]):
+        count = {a: sum(c.action == a for c in changes) for a in ACTION_FLAGS}
+        print(f"  {round(100 * drift):>4}%  {count['added']:>3} {count['removed']:>3} "
+              f"{count['reworded'] + count['retitled']:>3} {count['moved']:>3}  {base_name:<16} {name}")
+    print(f"\n{HR}\n")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Section-aware diff between tailored drafts and their base resume.")
+    parser.add_argument("names", nargs="*", help="Draft names in Resume/Drafts (default: every draft, drift table)")
+    parser.add_argument("--base", help="Base to compare against, e.g. ai_engineer (default: closest base)")
+    args = parser.parse_args(argv)
+
+    bases = load_bases()
+    if not bases:
+        print("No base resumes found in Master_Resume/current/.", file=sys.stderr)
+        return 1
+    if args.base and args.base.removeprefix("resume_").removesuffix(".html") not in bases:
+        print(f"Unknown base '{args.base}'. Choose from: {', '.join(bases)}", file=sys.stderr)
+        return 1
+
+    try:
+        paths = [find_input_html(n) for n in args.names] or sorted(DRAFTS_DIR.glob("resume_*.html"))
+    except FileNotFoundError as exc:
+        print(str(exc), file=sys.stderr)
+        return 1
+
+    rows = []
+    for path in paths:
+        draft = parse_resume(path)
+        base_name = args.base.removeprefix("resume_").removesuffix(".html") if args.base else closest_base(draft, bases)
+        changes, drift = diff_resumes(bases[base_name], draft)
+        if args.names:
+            print_diff(path, base_name, changes, drift)
+        rows.append((path.stem.removeprefix("resume_"), base_name, drift, changes))
+    if not args.names:
+        print_drift_table(rows)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
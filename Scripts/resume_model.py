@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+"""
+resume_model.py — Structured resume model, HTML renderer and loader
+A Resume is a title, the stylesheet, a header and a list of sections; each
+section holds a summary, skills rows, entries with bullets, or a bullet list.
+load() reads a Master_Resume/current/ base or a draft into the model and
+render() compiles the model back to the same HTML/CSS layout, so variants are
+built by transforming the model in memory (NamedTuple._replace) instead of
+editing copies of the markup.
+
+Text fields keep their inline HTML (<strong>, &mdash;, ...) exactly as written;
+plain_text() gives the display-text copy that resume_diff.py and resume_deps.py
+compare.
+
+Usage:
+    python Scripts/resume_model.py check                      # load + render every base and draft
+    python Scripts/resume_model.py dump ai_engineer > model.json
+    python Scripts/resume_model.py render model.json -o Resume/Drafts/resume_company-role.html
+"""
+
+from __future__ import annotations
+
+import argparse
+import html
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+import resume_corpus
+from html_to_pdf import DRAFTS_DIR, normalize_resume_name
+from resume_check import BASE_DIR, HR
+
+MASTER_DIR = BASE_DIR / "Master_Resume" / "current"
+
+# ── Model ────────────────────────────────────────────────────────────────────
+
+class Contact(NamedTuple):
+    text: str
+    href: str               # "" for plain text such as the phone number
+
+
+class Header(NamedTuple):
+    name: str
+    contacts: list[Contact]
+
+
+class SkillRow(NamedTuple):
+    label: str              # "" for a row without a bold label
+    items: list[str]
+
+
+class Entry(NamedTuple):
+    title: str
+    date: str
+    subtitle: str           # organisation line; "" for projects
+    location: str
+    note: str               # coursework-style line under the subtitle, or ""
+    bullets: list[str]
+    label: str              # the <!-- comment --> naming the entry, or ""
+
+
+class Section(NamedTuple):
+    title: str              # as written, e.g. "AWARDS &amp; HONORS"
+    comment: str            # the <!-- comment --> before the section
+    summary: str
+    skills: list[SkillRow]
+    entries: list[Entry]
+    bullets: list[str]
+    heading: str = "h2"     # element of the section title; fullstack_ai uses <div>
+
+
+class Resume(NamedTuple):
+    title: str
+    css: str                # body of the main <style> block
+    head_extra: str         # markup between that block and </head> (e.g. html_to_pdf's autofit style)
+    header: Header
+    sections: list[Section]
+    prologue: str = ""      # comments between <!DOCTYPE> and <html>, e.g. create_jd_resume's "Base:" note
+
+
+MODEL_TYPES = {"header": Header, "contacts": Contact, "skills": SkillRow, "entries": Entry, "sections": Section}
+
+
+def to_dict(resume: Resume) -> dict:
+    def convert(value):
+        if isinstance(value, tuple) and hasattr(value, "_asdict"):
+            return {k: convert(v) for k, v in value._asdict().items()}
+        if isinstance(value, list):
+            return [convert(v) for v in value]
+        return value
+    return convert(resume)
+
+
+def from_dict(data: dict) -> Resume:
+    def build(cls, fields: dict):
+        values = {}
+        for name, value in fields.items():
+            kind = MODEL_TYPES.get(name)
+            if kind is None:
+                values[name] = value
+            elif isinstance(value, list):
+                values[name] = [build(kind, v) for v in value]
+            else:
+                values[name] = build(kind, value)
+        return cls(**values)
+    return build(Resume, data)
+
+
+# ── Loader ───────────────────────────────────────────────────────────────────
+
+PROLOGUE_RE = re.compile(r"<!DOCTYPE html>\n?(.*?)<html\b", re.DOTALL | re.IGNORECASE)
+TITLE_RE = re.compile(r"<title>(.*?)</title>", re.DOTALL)
+STYLE_RE = re.compile(r"<style>(.*?)</style>\n?(.*?)</head>", re.DOTALL)
+COMMENT_RE = re.compile(r"<!--\s*((?:(?!<!--).)*?)\s*-->\s*$", re.DOTALL)
+SECTION_TITLE_RE = re.compile(r'<(h2|div) class="section-title">(.*?)</\1>', re.DOTALL)
+PARAGRAPH_RE = re.compile(r"<p>(.*?)</p>", re.DOTALL)
+SKILL_LABEL_RE = re.compile(r"<strong>(.*?):</strong>\s*(.*)", re.DOTALL)
+CONTACT_RE = re.compile(r'<a href="([^"]*)">(.*?)</a>|<span class="separator">.*?</span>|([^<\s][^<]*?)\s*(?=<|$)', re.DOTALL)
+
+
+def elements(text: str, cls: str, start: int = 0, end: int | None = None) -> list[tuple[str, int, int]]:
+    """(inner HTML, start, end) of each outermost element with exactly class="cls" in text[start:end]."""
+    end = len(text) if end is None else end
+    found = []
+    opening = re.compile(rf'<(\w+)\b[^>]*\bclass="{re.escape(cls)}"[^>]*>')
+    pos = start
+    while match := opening.search(text, pos, end):
+        tag = match.group(1)
+        depth, close = 0, None
+        for t in re.finditer(rf"<{tag}\b|</{tag}\s*>", text[match.start():end]):
+            depth += -1 if t.group().startswith("</") else 1
+            if depth == 0:
+                close = (match.start() + t.start(), match.start() + t.end())
+                break
+        if close is None:
+            break
+        found.append((text[match.end():close[0]], match.start(), close[1]))
+        pos = close[1]
+    return found
+
+
+def inner(text: str, cls: str) -> str:
+    found = elements(text, cls)
+    return found[0][0].strip() if found else ""
+
+
+def prologue_of(text: str) -> str:
+    match = PROLOGUE_RE.search(text)
+    return match.group(1) if match else ""
+
+
+def comment_before(text: str, pos: int, floor: int = 0) -> str:
+    match = COMMENT_RE.search(text, floor, pos)
+    return match.group(1) if match and not text[match.end():pos].strip() else ""
+
+
+def load_entry(text: str) -> Entry:
+    subtitle_block = inner(text, "entry-subtitle")
+    subtitle = re.sub(r'<div class="entry-location">.*?</div>', "", subtitle_block, flags=re.DOTALL)
+    subtitle = re.sub(r"^\s*<div>(.*?)</div>\s*$", r"\1", subtitle, flags=re.DOTALL).strip()
+    note = PARAGRAPH_RE.search(inner(text, "skills-section"))
+    return Entry(
+        title=inner(text, "entry-title"),
+        date=inner(text, "entry-date"),
+        subtitle=subtitle,
+        location=inner(subtitle_block, "entry-location"),
+        note=note.group(1) if note else "",
+        bullets=[b.strip() for b, _, _ in elements(text, "bullet-item")],
+        label="",
+    )
+
+
+def load_section(text: str, start: int, end: int, comment: str) -> Section:
+    body = text[start:end]
+    title = SECTION_TITLE_RE.search(body)
+    entries, rest, last = [], [], 0
+    for entry_html, entry_start, entry_end in elements(body, "entry"):
+        entries.append(load_entry(entry_html)._replace(label=comment_before(body, entry_start, last)))
+        rest.append(body[last:entry_start])
+        last = entry_end
+    rest = "".join(rest) + body[last:]   # section-level blocks only, without the entries
+    skills = []
+    for paragraph in PARAGRAPH_RE.findall(inner(rest, "skills-section")):
+        label = SKILL_LABEL_RE.match(paragraph)
+        skills.append(SkillRow(label.group(1), label.group(2).strip().split(" | ")) if label
+                      else SkillRow("", [paragraph.strip()]))
+    return Section(
+        title=title.group(2).strip() if title else "",
+        comment=comment,
+        summary=inner(rest, "summary-text"),
+        skills=skills,
+        entries=entries,
+        bullets=[b.strip() for b, _, _ in elements(rest, "bullet-item")],
+        heading=title.group(1) if title else "h2",
+    )
+
+
+def load_html(text: str) -> Resume:
+    style = STYLE_RE.search(text)
+    header_html = inner(text, "header")
+    contacts = [Contact(m.group(2) or m.group(3).strip(), m.group(1) or "")
+                for m in CONTACT_RE.finditer(inner(header_html, "contact-info"))
+                if m.group(2) is not None or m.group(3)]
+    name = re.search(r"<h1>(.*?)</h1>", header_html, re.DOTALL)
+    sections, last = [], 0
+    for _, start, end in elements(text, "section"):
+        sections.append(load_section(text, start, end, comment_before(text, start, last)))
+        last = end
+    title = TITLE_RE.search(text)
+    return Resume(
+        title=title.group(1) if title else "",
+        css=style.group(1) if style else "",
+        head_extra=style.group(2) if style else "",
+        header=Header(name.group(1).strip() if name else "", contacts),
+        sections=sections,
+        prologue=prologue_of(text),
+    )
+
+
+def load(path: Path) -> Resume:
+    return load_html(path.read_text(encoding="utf-8"))
+
+
+# ── Plain text ───────────────────────────────────────────────────────────────
+
+TAG_RE = re.compile(r"<[^>]+>")
+
+
+def plain(text: str) -> str:
+    """Inline HTML -> display text: tags dropped, entities decoded, whitespace collapsed."""
+    return " ".join(html.unescape(TAG_RE.sub("", text)).split())
+
+
+def plain_text(resume: Resume) -> Resume:
+    """Copy of the model with every visible text field as plain display text."""
+    def entry(e: Entry) -> Entry:
+        return e._replace(title=plain(e.title), date=plain(e.date), subtitle=plain(e.subtitle),
+                          location=plain(e.location), note=plain(e.note), bullets=[plain(b) for b in e.bullets])
+    return resume._replace(
+        header=Header(plain(resume.header.name), [c._replace(text=plain(c.text)) for c in resume.header.contacts]),
+        sections=[s._replace(
+            title=plain(s.title),
+            summary=plain(s.summary),
+            skills=[SkillRow(plain(r.label), [plain(i) for i in r.items]) for r in s.skills],
+            entries=[entry(e) for e in s.entries],
+            bullets=[plain(b) for b in s.bullets],
+        ) for s in resume.sections],
+    )
+
+
+# ── Renderer ─────────────────────────────────────────────────────────────────
+
+def section_comment(section: Section) -> str:
+    """Default comment for a section built without one: "TECHNICAL SKILLS" -> "Technical Skills"."""
+    return section.comment or section.title.replace("&amp;", "&").title()
+
+
+def render_entry(entry: Entry) -> list[str]:
+    lines = [""]
+    if entry.label:
+        lines.append(f"        <!-- {entry.label} -->")
+    lines += [
+        '        <div class="entry">',
+        '            <div class="entry-header">',
+        f'                <div class="entry-title">{entry.title}</div>',
+        f'                <div class="entry-date">{entry.date}</div>',
+        "            </div>",
+    ]
+    if entry.subtitle or entry.location:
+        lines += ['            <div class="entry-subtitle">', f"                <div>{entry.subtitle}</div>"]
+        if entry.location:
+            lines.append(f'                <div class="entry-location">{entry.location}</div>')
+        lines.append("            </div>")
+    if entry.note:
+        lines.append(f'            <div class="skills-section" style="margin-top:2pt;"><p>{entry.note}</p></div>')
+    if entry.bullets:
+        lines.append('            <div class="bullet-list">')
+        lines += [f'                <div class="bullet-item">{b}</div>' for b in entry.bullets]
+        lines.append("            </div>")
+    lines.append("        </div>")
+    return lines
+
+
+def render_section(section: Section) -> list[str]:
+    lines = [
+        "",
+        f"    <!-- {section_comment(section)} -->",
+        '    <div class="section">',
+        f'        <{section.heading} class="section-title">{section.title}</{section.heading}>',
+    ]
+    if section.summary:
+        lines.append(f'        <div class="summary-text">{section.summary}</div>')
+    if section.skills:
+        lines.append('        <div class="skills-section">')
+        for row in section.skills:
+            items = " | ".join(row.items)
+            lines.append(f"            <p><strong>{row.label}:</strong> {items}</p>" if row.label else f"            <p>{items}</p>")
+        lines.append("        </div>")
+    for entry in section.entries:
+        lines += render_entry(entry)
+    if section.entries:
+        lines.append("")
+    if section.bullets:
+        lines.append('        <div class="bullet-list">')
+        lines += [f'            <div class="bullet-item">{b}</div>' for b in section.bullets]
+        lines.append("        </div>")
+    lines.append("    </div>")
+    return lines
+
+
+def render(resume: Resume) -> str:
+    contacts = []
+    for contact in resume.header.contacts:
+        if contacts:
+            contacts.append('            <span class="separator">|</span>')
+        contacts.append(f'            <a href="{contact.href}">{contact.text}</a>' if contact.href
+                        else f"            {contact.text}")
+    lines = [
+        "<!DOCTYPE html>",
+        f'{resume.prologue}<html lang="en">',
+        "<head>",
+        '    <meta charset="UTF-8">',
+        '    <meta name="viewport" content="width=device-width, initial-scale=1.0">',
+        f"    <title>{resume.title}</title>",
+        f"    <style>{resume.css}</style>",
+        f"{resume.head_extra}</head>",
+        "<body>",
+        '<div class="resume-container">',
+        "",
+        "    <!-- Header -->",
+        '    <div class="header">',
+        f"        <h1>{resume.header.name}</h1>",
+        '        <div class="contact-info">',
+        *contacts,
+        "        </div>",
+        "    </div>",
+    ]
+    for section in resume.sections:
+        lines += render_section(section)
+    lines += ["", "</div>", "</body>", "</html>", ""]
+    return "\n".join(lines)
+
+
+# ── CLI ──────────────────────────────────────────────────────────────────────
+
+def resolve(name: str) -> Path:
+    """A path, a base slug (ai_engineer) or a draft slug (company-role)."""
+    path = Path(name)
+    if path.suffix == ".html" and path.exists():
+        return path
+    stem = normalize_resume_name(name)
+    for directory in (MASTER_DIR, DRAFTS_DIR):
+        if (directory / f"{stem}.html").exists():
+            return directory / f"{stem}.html"
+    raise FileNotFoundError(f"No base or draft named {name}")
+
+
+def check(paths: list[Path], repeat: int = 100) -> int:
+    """
+    Load and render each file. The rendered text must match the original, and
+    so must the prologue comments, which html_to_text() does not see.
+    """
+    print(f"\n{HR}")
+    print(f"  Model round trip  ({len(paths)} resumes)")
+    print(HR)
+    failures = 0
+    models = []
+    for path in paths:
+        path = path.resolve()
+        text = path.read_text(encoding="utf-8")
+        model = load_html(text)
+        out = render(model)
+        same_text = resume_corpus.html_to_text(out) == resume_corpus.html_to_text(text)
+        same_prologue = prologue_of(out) == prologue_of(text)
+        stable = load_html(out) == model
+        flag = "✅" if same_text and same_prologue and stable else "❌"
+        failures += flag == "❌"
+        exact = "identical" if out == text else "reformatted"
+        shown = path.relative_to(BASE_DIR) if path.is_relative_to(BASE_DIR) else path
+        print(f"  {flag} {shown}  ({len(model.sections)} sections, "
+              f"{sum(len(s.entries) for s in model.sections)} entries, {exact})")
+        models.append(model)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for model in models:
+            render(model)
+    per_render = (time.perf_counter() - start) / (repeat * len(models)) * 1000
+    print(f"\n  render(): {per_render:.3f} ms per resume")
+    print(f"\n{HR}\n")
+    return 1 if failures else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Load resume HTML into a structured model and render it back.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    check_cmd = sub.add_parser("check", help="Round-trip every base and draft (or the given ones)")
+    check_cmd.add_argument("names", nargs="*", help="Base/draft slugs or paths")
+    dump_cmd = sub.add_parser("dump", help="Print a resume's model as JSON")
+    dump_cmd.add_argument("name", help="Base/draft slug or path")
+    render_cmd = sub.add_parser("render", help="Render a JSON model to HTML")
+    render_cmd.add_argument("model", help="JSON file from dump, or - for stdin")
+    render_cmd.add_argument("-o", "--output", help="Output HTML (default: stdout)")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == "check":
+            paths = ([resolve(n) for n in args.names] if args.names
+                     else sorted(MASTER_DIR.glob("resume_*.html")) + sorted(DRAFTS_DIR.glob("resume_*.html")))
+            return check(paths)
+        if args.command == "dump":
+            json.dump(to_dict(load(resolve(args.name))), sys.stdout, indent=2, ensure_ascii=False)
+            print()
+            return 0
+    except FileNotFoundError as exc:
+        print(f"❌ {exc}", file=sys.stderr)
+        return 1
+
+    source = sys.stdin.read() if args.model == "-" else Path(args.model).read_text(encoding="utf-8")
+    html = render(from_dict(json.loads(source)))
+    if args.output:
+        Path(args.output).write_text(html, encoding="utf-8")
+        print(f"✅ Wrote {args.output}")
+    else:
+        sys.stdout.write(html)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+resume_nearest.py — Closest previous tailored resume for a new role
+MinHash/LSH index over the section text of every resume in Resume/Drafts/ and
+Resume/Applied/. Given a draft, looks up only the resumes that share an LSH
+bucket with it and ranks them by estimated Jaccard similarity, so tailoring can
+start from the nearest existing draft instead of a base.
+
+A JD is far shorter than a resume, so its Jaccard similarity to any resume is
+too low for LSH to separate (0.15 at best). JDs are matched on technical terms
+instead (see jd_match.py): an inverted index of each resume's skills terms
+returns the resumes that cover enough of the JD's terms, ranked by coverage.
+
+Requires numpy (pip install numpy).
+
+Usage:
+    python Scripts/resume_nearest.py jd.txt                         # nearest to a JD
+    python Scripts/resume_nearest.py Resume/Drafts/resume_foo.html  # nearest to a draft
+    Get-Clipboard | python Scripts/resume_nearest.py -              # JD from stdin
+    python Scripts/resume_nearest.py --build                        # refresh the index only
+    python Scripts/resume_nearest.py --check                        # LSH candidate counts and recall
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import sqlite3
+import sys
+from contextlib import closing
+from pathlib import Path
+
+import numpy as np
+
+import jd_match
+import resume_check
+import resume_corpus
+from resume_check import BASE_DIR, HR
+
+INDEX_DIRS = (BASE_DIR / "Resume" / "Applied", BASE_DIR / "Resume" / "Drafts")
+INDEX_PATH = BASE_DIR / "Resume" / ".resume_nearest.sqlite"
+
+# 25 bands of 5 rows put the LSH threshold, (1/b)^(1/r), at Jaccard ~0.53. A
+# draft's nearest neighbour is typically 0.45–0.75 and unrelated tracks 0.1–0.3,
+# so a query sees ~7 of 56 resumes and still finds its nearest in ~85% of cases
+# (16x8 would cut that to ~40%). --check measures both on the current index.
+NUM_PERM = 128
+LSH_BANDS, LSH_ROWS = 25, 5
+JD_MIN_COVERAGE = 0.4   # share of the JD's technical terms a skills section must contain
+HASH_PRIME = (1 << 31) - 1
+INDEX_VERSION = 2   # bump when shingling, hashing or banding changes
+
+_rng = np.random.default_rng(20260501)
+PERM_A = _rng.integers(1, HASH_PRIME, NUM_PERM, dtype=np.uint64)
+PERM_B = _rng.integers(0, HASH_PRIME, NUM_PERM, dtype=np.uint64)
+
+# ── MinHash ──────────────────────────────────────────────────────────────────
+
+def shingles(sections: list[list]) -> set[str]:
+    """Content terms of every section body (the same terms jd_match scores on)."""
+    return {t for _, body, _ in sections for t in jd_match.terms(body)}
+
+
+def skill_terms(sections: list[list]) -> set[str]:
+    return {t for header, body, _ in sections if header in jd_match.SKILLS_SECTIONS
+            for t in jd_match.terms(body)}
+
+
+def minhash(items: set[str]) -> np.ndarray | None:
+    """
+    NUM_PERM-wide MinHash signature; all permutations are applied in one array
+    op. None for an empty set, which has no signature (it would match every
+    other empty document at 100%).
+    """
+    if not items:
+        return None
+    x = np.fromiter(
+        (int.from_bytes(hashlib.blake2b(s.encode(), digest_size=4).digest(), "little") for s in items),
+        dtype=np.uint64, count=len(items),
+    ) % HASH_PRIME
+    return ((PERM_A[:, None] * x[None, :] + PERM_B[:, None]) % HASH_PRIME).min(axis=1).astype(np.uint32)
+
+
+def band_keys(signature: np.ndarray) -> list[tuple[int, int]]:
+    """[(band, bucket), ...]: one 63-bit bucket hash per band of the signature."""
+    rows = signature[:LSH_BANDS * LSH_ROWS].reshape(LSH_BANDS, LSH_ROWS)
+    return [(band, int.from_bytes(hashlib.blake2b(row.tobytes(), digest_size=8).digest(), "little") >> 1)
+            for band, row in enumerate(rows)]
+
+
+def sections_of(path: Path) -> list[list]:
+    if path.suffix.lower() == ".html":
+        return resume_corpus.extract_html(path)
+    return resume_check.cached_extract(path)["sections"]
+
+
+# ── Index ────────────────────────────────────────────────────────────────────
+
+def open_index() -> sqlite3.Connection:
+    conn = sqlite3.connect(str(INDEX_PATH), timeout=30)
+    conn.execute("PRAGMA foreign_keys = ON")
+    if conn.execute("PRAGMA user_version").fetchone()[0] != INDEX_VERSION:
+        with conn:
+            conn.executescript("DROP TABLE IF EXISTS skills; DROP TABLE IF EXISTS buckets; DROP TABLE IF EXISTS documents;")
+            conn.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS documents (
+            id INTEGER PRIMARY KEY, slug TEXT UNIQUE NOT NULL,
+            path TEXT NOT NULL, digest TEXT NOT NULL,
+            signature BLOB);   -- NULL: no extractable text, never a candidate
+        CREATE TABLE IF NOT EXISTS buckets (
+            band INTEGER NOT NULL, bucket INTEGER NOT NULL,
+            doc_id INTEGER NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
+            PRIMARY KEY (band, bucket, doc_id)) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS skills (
+            term TEXT NOT NULL,
+            doc_id INTEGER NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
+            PRIMARY KEY (term, doc_id)) WITHOUT ROWID;
+    """)
+    return conn
+
+
+def build_index(dirs=INDEX_DIRS) -> tuple[int, int, int, int]:
+    """
+    Sign new or changed resumes and drop vanished ones. Resumes without
+    extractable text are recorded (so they are not re-read) but not bucketed.
+    Returns (indexed, unchanged, removed, unsigned).
+    """
+    files = resume_corpus.corpus_files(list(dirs))
+    indexed = unchanged = 0
+    with closing(open_index()) as conn, conn:
+        known = dict(conn.execute("SELECT slug, digest FROM documents"))
+        stale = set(known) - set(files)
+        conn.executemany("DELETE FROM documents WHERE slug = ?", [(s,) for s in stale])
+
+        for slug, path in files.items():
+            digest = hashlib.sha256(path.read_bytes()).hexdigest()
+            if known.get(slug) == digest:
+                unchanged += 1
+                continue
+            sections = sections_of(path)
+            signature = minhash(shingles(sections))
+            conn.execute("DELETE FROM documents WHERE slug = ?", (slug,))
+            doc_id = conn.execute(
+                "INSERT INTO documents (slug, path, digest, signature) VALUES (?, ?, ?, ?)",
+                (slug, str(path.relative_to(BASE_DIR)), digest, None if signature is None else signature.tobytes()),
+            ).lastrowid
+            if signature is not None:
+                conn.executemany("INSERT OR IGNORE INTO buckets VALUES (?, ?, ?)",
+                                 [(*key, doc_id) for key in band_keys(signature)])
+                conn.executemany("INSERT INTO skills VALUES (?, ?)", [(t, doc_id) for t in skill_terms(sections)])
+            indexed += 1
+        unsigned = conn.execute("SELECT COUNT(*) FROM documents WHERE signature IS NULL").fetchone()[0]
+    return indexed, unchanged, len(stale), unsigned
+
+
+def signed_total(conn: sqlite3.Connection) -> int:
+    return conn.execute("SELECT COUNT(*) FROM documents WHERE signature IS NOT NULL").fetchone()[0]
+
+
+def nearest(signature: np.ndarray, limit: int,
+            exclude: str | None = None) -> tuple[list[tuple[float, str]], int, int]:
+    """
+    Indexed resumes sharing at least one LSH bucket with `signature`, ranked by
+    estimated Jaccard. Returns (ranked [(similarity, path)], candidates, total).
+    """
+    keys = band_keys(signature)
+    with closing(open_index()) as conn:
+        total = signed_total(conn)
+        rows = conn.execute(f"""
+            SELECT d.slug, d.path, d.signature FROM documents d
+            WHERE d.id IN (SELECT doc_id FROM buckets
+                           WHERE (band, bucket) IN (VALUES {",".join(["(?, ?)"] * len(keys))}))
+        """, [v for key in keys for v in key]).fetchall()
+    rows = [r for r in rows if r[0] != exclude]
+    if not rows:
+        return [], 0, total
+    sigs = np.frombuffer(b"".join(r[2] for r in rows), dtype=np.uint32).reshape(len(rows), NUM_PERM)
+    similarity = (sigs == signature).mean(axis=1)
+    ranked = sorted(zip(similarity.tolist(), (r[1] for r in rows)), key=lambda r: (-r[0], r[1]))
+    return ranked[:limit], len(rows), total
+
+
+def nearest_to_jd(terms: set[str], limit: int) -> tuple[list[tuple[float, str]], int, int]:
+    """
+    Indexed resumes whose skills section contains at least JD_MIN_COVERAGE of
+    the JD's technical terms, ranked by that coverage. Only the index entries
+    of the JD's own terms are read. Returns (ranked, candidates, total).
+    """
+    need = max(1, round(JD_MIN_COVERAGE * len(terms)))
+    with closing(open_index()) as conn:
+        total = signed_total(conn)
+        rows = conn.execute(f"""
+            SELECT d.path, COUNT(*) FROM skills s JOIN documents d ON d.id = s.doc_id
+            WHERE s.term IN ({",".join("?" * len(terms))})
+            GROUP BY s.doc_id HAVING COUNT(*) >= ?
+        """, [*terms, need]).fetchall()
+    ranked = sorted(((shared / len(terms), path) for path, shared in rows), key=lambda r: (-r[0], r[1]))
+    return ranked[:limit], len(rows), total
+
+
+def check_index() -> int:
+    """Query every indexed resume against the rest: LSH candidates per query, and how often the true nearest is one."""
+    with closing(open_index()) as conn:
+        docs = conn.execute("SELECT id, path, signature FROM documents WHERE signature IS NOT NULL ORDER BY id").fetchall()
+        buckets = conn.execute("SELECT band, bucket, doc_id FROM buckets").fetchall()
+    if len(docs) < 2:
+        print("Not enough signed resumes to check.")
+        return 0
+    index = {d[0]: i for i, d in enumerate(docs)}
+    sigs = np.frombuffer(b"".join(d[2] for d in docs), dtype=np.uint32).reshape(len(docs), NUM_PERM)
+    similarity = (sigs[:, None, :] == sigs[None, :, :]).mean(axis=2)
+    np.fill_diagonal(similarity, -1)
+    members: dict[tuple[int, int], list[int]] = {}
+    for band, bucket, doc_id in buckets:
+        members.setdefault((band, bucket), []).append(index[doc_id])
+    candidates = [set() for _ in docs]
+    for group in members.values():
+        for i in group:
+            candidates[i].update(group)
+    counts, found = [], 0
+    for i, cands in enumerate(candidates):
+        cands.discard(i)
+        counts.append(len(cands))
+        found += int(similarity[i].argmax()) in cands
+    others = len(docs) - 1
+    print(f"\n{HR}")
+    print(f"  LSH check  ({LSH_BANDS} bands x {LSH_ROWS} rows, threshold ~{(1 / LSH_BANDS) ** (1 / LSH_ROWS):.2f})")
+    print(HR)
+    print(f"  Candidates per query: mean {np.mean(counts):.1f}, max {max(counts)} of {others} "
+          f"({100 * np.mean(counts) / others:.0f}% scanned)")
+    print(f"  No candidates:        {sum(c == 0 for c in counts)} of {len(docs)}")
+    print(f"  True nearest found:   {found} of {len(docs)}")
+    print(f"\n{HR}\n")
+    return 0
+
+
+# ── CLI ──────────────────────────────────────────────────────────────────────
+
+def jd_terms(jd_text: str) -> set[str]:
+    """The JD's technical terms, judged against every indexed skills section."""
+    with closing(open_index()) as conn:
+        lexicon = {t for (t,) in conn.execute("SELECT DISTINCT term FROM skills")}
+    return {t for t in jd_match.terms(jd_text) if jd_match.looks_technical(t, jd_text, lexicon)}
+
+
+def run_query(source: str, limit: int) -> tuple[str, tuple[list[tuple[float, str]], int, int] | None]:
+    """(label, nearest result) for a JD file, stdin, or resume HTML/PDF; None when it has no usable terms."""
+    if source == "-":
+        label, text = "JD from stdin", sys.stdin.read()
+    else:
+        path = Path(source)
+        label = path.name
+        if path.suffix.lower() in (".html", ".pdf"):
+            signature = minhash(shingles(sections_of(path)))
+            if signature is None:
+                return label, None
+            return label, nearest(signature, limit, path.stem.removeprefix("resume_"))
+        text = path.read_text(encoding="utf-8", errors="replace")
+    terms = jd_terms(text)
+    return label, nearest_to_jd(terms, limit) if terms else None
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Find the previous tailored resumes closest to a JD or draft.")
+    parser.add_argument("query", nargs="?", help="JD text file, resume .html/.pdf, or - for stdin")
+    parser.add_argument("-n", "--limit", type=int, default=5, help="Resumes to list")
+    parser.add_argument("--build", action="store_true", help="Refresh the index and exit")
+    parser.add_argument("--check", action="store_true", help="Report LSH candidate counts and recall over the index")
+    args = parser.parse_args(argv)
+
+    indexed, unchanged, removed, unsigned = build_index()
+    if args.check:
+        return check_index()
+    if args.build or not args.query:
+        skipped = f", {unsigned} without extractable text" if unsigned else ""
+        print(f"Indexed {indexed}, unchanged {unchanged}, removed {removed}{skipped}  →  {INDEX_PATH.relative_to(BASE_DIR)}")
+        return 0
+    if args.query != "-" and not Path(args.query).exists():
+        print(f"❌ Not found: {args.query}", file=sys.stderr)
+        return 1
+
+    label, result = run_query(args.query, args.limit)
+    if result is None:
+        print(f"❌ {label}: no extractable text to match on", file=sys.stderr)
+        return 1
+    ranked, candidates, total = result
+    source = "LSH candidates" if Path(args.query).suffix.lower() in (".html", ".pdf") else "skills matches"
+
+    print(f"\n{HR}")
+    print(f"  Nearest to {label}  ({candidates} {source} of {total} indexed)")
+    print(HR)
+    if not ranked:
+        print("\n  No similar resume found — start from Master_Resume/current/.")
+    for similarity, path in ranked:
+        print(f"  {round(100 * similarity):>4}%  {path}")
+    print(f"\n{HR}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
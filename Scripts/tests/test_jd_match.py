@@ -0,0 +1,30 @@
+from jd_match import jd_blocks, terms
+
+
+def test_inline_headings_fill_their_blocks():
+    jd = "\n".join([
+        "Senior ML Engineer",
+        "Required: Python, Kubernetes, RAG",
+        "Preferred: Rust, Go.",
+    ])
+    required, preferred = jd_blocks(jd)
+    assert {"python", "kubernetes", "rag"} <= set(terms(required))
+    assert {"rust", "go"} <= set(terms(preferred))
+    assert "go" not in terms(required)
+
+
+def test_heading_lines_open_the_block_below():
+    jd = "\n".join([
+        "Minimum Qualifications",
+        "- 5+ years of Python",
+        "Preferred Qualifications",
+        "- Experience with Rust",
+    ])
+    required, preferred = jd_blocks(jd)
+    assert required == "- 5+ years of Python"
+    assert preferred == "- Experience with Rust"
+
+
+def test_no_headings_means_everything_is_required():
+    jd = "We build agents in Python and Go."
+    assert jd_blocks(jd) == (jd, "")
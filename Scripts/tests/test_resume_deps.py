@@ -0,0 +1,47 @@
+import html_to_pdf
+import resume_deps
+
+RESUME = """<!DOCTYPE html>
+{note}<html>
+<head><title>Resume</title><style>
+body {{ font-size: 10pt; }}
+</style>
+</head>
+<body>
+<div class="header"><h1>Jane Doe</h1></div>
+<div class="section">
+<h2 class="section-title">SUMMARY</h2>
+<div class="summary-text">{summary}</div>
+</div>
+</body>
+</html>
+"""
+
+
+def write_tree(tmp_path, monkeypatch):
+    master, drafts = tmp_path / "master", tmp_path / "drafts"
+    master.mkdir()
+    drafts.mkdir()
+    monkeypatch.setattr(resume_deps, "MASTER_DIR", master)
+    monkeypatch.setattr(resume_deps, "DRAFTS_DIR", drafts)
+    monkeypatch.setattr(html_to_pdf, "DRAFTS_DIR", drafts)
+    monkeypatch.setattr(resume_deps, "GRAPH_PATH", tmp_path / "deps.json")
+    base = master / "resume_ai_engineer.html"
+    base.write_text(RESUME.format(note="", summary="Builds agents."), encoding="utf-8")
+    note = "<!-- Base: resume_ai_engineer.html -->\n"
+    (drafts / "resume_acme-ml.html").write_text(RESUME.format(note=note, summary="Builds agents at Acme."), encoding="utf-8")
+    return base
+
+
+def test_edit_no_draft_shares_is_reconciled_once(tmp_path, monkeypatch, capsys):
+    base = write_tree(tmp_path, monkeypatch)
+    assert resume_deps.main([]) == 0
+    base.write_text(RESUME.format(note="", summary="Builds LLM agents."), encoding="utf-8")
+
+    assert resume_deps.main(["rebuild"]) == 0
+    assert "no draft shares the edit" in capsys.readouterr().out
+
+    assert resume_deps.main(["rebuild"]) == 0
+    out = capsys.readouterr().out
+    assert "No base changed" in out
+    assert "no draft shares the edit" not in out